@@ -5,10 +5,23 @@ from tomllib import load
 
 import app.rabbitmq as mq
 from app.bot import bot
-from app.config.config import OWNERS
+from app.config.config import (
+    AMQP_MONITORING,
+    AMQP_MONITORING_INTERVAL,
+    DB_CACHE_CHANGE_STREAM,
+    MONGODB_MONITORING,
+    MONGODB_MONITORING_INTERVAL,
+    OWNERS,
+)
+from app.database.cache import watch_invalidations
 from app.database.database import db
+from app.database.migrations import run_migrations
+from app.database.monitoring import log_mongo_stats
 from app.database.db_operations.user_db_operations import ensure_owner_role
 from app.middlewares.logging import LoggingMiddleware
+from app.rabbitmq.channels import log_publish_stats
+from app.rabbitmq.consumer import log_consumer_stats
+from app.middlewares.user import UserMiddleware
 from app.roles.admin.admin import admin
 from app.roles.owner.owner import owner
 from app.roles.user.user_cmds import user
@@ -39,6 +52,8 @@ async def ensure_owners_in_db():
 async def main():
     dp = Dispatcher()
     dp.include_routers(user, admin, owner)
+    dp.callback_query.outer_middleware(UserMiddleware())
+    dp.message.outer_middleware(UserMiddleware())
     dp.callback_query.middleware(LoggingMiddleware())
     dp.message.middleware(LoggingMiddleware())
 
@@ -50,11 +65,27 @@ async def main():
     logger.info("Старт бота")
     await db.ping()  # Проверка подключения к БД
     await db.setup_indexes()  # Настройка индексов
+    await run_migrations(db.db)  # Миграции схемы и backfill
     await ensure_owners_in_db()  # Проверка и установка владельцев
 
     mq_task = asyncio.create_task(mq.func.start_listening())
     bot_task = asyncio.create_task(dp.start_polling(bot))
-    await asyncio.gather(mq_task, bot_task)  # start bot & rabbitmq listener
+    scheduler_task = asyncio.create_task(mq.func.scheduler.run())  # отложенные задачи рекордеру
+    outbox_task = asyncio.create_task(mq.func.outbox.run())  # публикации из outbox в RabbitMQ
+    tasks = [mq_task, bot_task, scheduler_task, outbox_task]
+    if DB_CACHE_CHANGE_STREAM:  # сброс кэша по изменениям из других реплик бота
+        tasks.append(asyncio.create_task(watch_invalidations(db.db)))
+    if MONGODB_MONITORING:  # статистика пула и команд MongoDB
+        tasks.append(asyncio.create_task(log_mongo_stats(MONGODB_MONITORING_INTERVAL)))
+    if AMQP_MONITORING:  # латентность публикаций и обработки ответов RabbitMQ
+        tasks.append(asyncio.create_task(log_publish_stats(AMQP_MONITORING_INTERVAL)))
+        tasks.append(asyncio.create_task(log_consumer_stats(AMQP_MONITORING_INTERVAL)))
+    try:
+        await asyncio.gather(*tasks)  # start bot & rabbitmq listener
+    finally:
+        await mq.func.response_workers.close()
+        await mq.func.channels.close()
+        db.close()
 
 
 def get_version():
@@ -7,8 +7,14 @@ MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD")
 MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "conferee_db")
 MONGODB_HOST = os.getenv("MONGODB_HOST", "mongodb")  # mongodb для Docker, localhost для локальной разработки
 
+# Хранилище: mongo — MongoDB через Motor, memory — in-memory бэкенд из
+# app/database/memory.py для benchmarks/handler_db.py без mongod (только его сценарии)
+DB_BACKEND = os.getenv("DB_BACKEND", "mongo").lower()
+if DB_BACKEND not in ("mongo", "memory"):
+    raise ValueError("DB_BACKEND must be 'mongo' or 'memory'!")
+
 # Проверяем, что обязательные переменные заданы
-if not MONGODB_USERNAME or not MONGODB_PASSWORD:
+if DB_BACKEND == "mongo" and (not MONGODB_USERNAME or not MONGODB_PASSWORD):
     raise ValueError("MONGODB_USERNAME and MONGODB_PASSWORD must be set in environment variables!")
 
 
@@ -16,3 +22,61 @@ MONGODB_URI = f"mongodb://{MONGODB_USERNAME}:{MONGODB_PASSWORD}@{MONGODB_HOST}:2
 
 OWNERS: List[str] = os.getenv("OWNERS", "").split(",") if os.getenv("OWNERS") else []
 OWNERS = [owner.strip() for owner in OWNERS if owner.strip()]
+
+# Кэш пользователей с их ролями для UserMiddleware и RoleFilter
+ROLE_CACHE_TTL = float(os.getenv("ROLE_CACHE_TTL", "60"))
+ROLE_CACHE_SIZE = int(os.getenv("ROLE_CACHE_SIZE", "1024"))
+
+# Кэш чтений из БД (теги, конференции)
+DB_CACHE_TTL = float(os.getenv("DB_CACHE_TTL", "300"))
+DB_CACHE_SIZE = int(os.getenv("DB_CACHE_SIZE", "2048"))
+# Слушать change stream MongoDB для сброса кэша между репликами бота (нужен replica set)
+DB_CACHE_CHANGE_STREAM = os.getenv("DB_CACHE_CHANGE_STREAM", "false").lower() == "true"
+
+# Пул соединений MongoDB (пустое значение — значение по умолчанию PyMongo)
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS") or 0) or None
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS") or 0) or None
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "30000")
+)
+MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "20000"))
+# Статистика пула и латентности команд MongoDB в логах
+MONGODB_MONITORING = os.getenv("MONGODB_MONITORING", "false").lower() == "true"
+MONGODB_MONITORING_INTERVAL = float(os.getenv("MONGODB_MONITORING_INTERVAL", "60"))
+MONGODB_SLOW_COMMAND_MS = float(os.getenv("MONGODB_SLOW_COMMAND_MS", "100"))
+
+# Каналы RabbitMQ: пул для basic_get и т.п. и таймаут подтверждения публикации
+AMQP_CHANNEL_POOL_SIZE = int(os.getenv("AMQP_CHANNEL_POOL_SIZE", "4"))
+AMQP_PUBLISH_TIMEOUT = float(os.getenv("AMQP_PUBLISH_TIMEOUT", "10"))
+# Пауза перед переподключением к RabbitMQ: удваивается с каждой неудачей до максимума
+AMQP_RECONNECT_MIN_DELAY = float(os.getenv("AMQP_RECONNECT_MIN_DELAY", "1"))
+AMQP_RECONNECT_MAX_DELAY = float(os.getenv("AMQP_RECONNECT_MAX_DELAY", "60"))
+# Outbox публикаций: размер пачки, срок захвата пачки репликой и интервал проверки
+# сообщений, сохранённых другими репликами (секунды)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "100"))
+OUTBOX_CLAIM_TTL = float(os.getenv("OUTBOX_CLAIM_TTL", "60"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", "5"))
+# Сколько ответов рекордера канал получает до подтверждения и сколько обрабатывается
+# параллельно (ответы одной конференции — по порядку, кроме повторов после ошибки)
+AMQP_PREFETCH_COUNT = int(os.getenv("AMQP_PREFETCH_COUNT", "32"))
+AMQP_CONSUMER_WORKERS = int(os.getenv("AMQP_CONSUMER_WORKERS", "8"))
+# Сколько раз обрабатывается ответ с ошибкой, прежде чем он уйдёт в gmeet_res_dead, и
+# пауза перед повтором (умножается на номер попытки, секунды)
+AMQP_MAX_ATTEMPTS = int(os.getenv("AMQP_MAX_ATTEMPTS", "5"))
+AMQP_RETRY_DELAY = float(os.getenv("AMQP_RETRY_DELAY", "5"))
+# Сколько ID обработанных ответов держится в памяти и сколько секунд они хранятся в
+# MongoDB для отсева повторных доставок
+AMQP_DEDUP_CACHE_SIZE = int(os.getenv("AMQP_DEDUP_CACHE_SIZE", "10000"))
+AMQP_DEDUP_TTL = float(os.getenv("AMQP_DEDUP_TTL", "21600"))
+# Сколько секунд ждать ответа рекордера на запрос скриншота или времени записи
+AMQP_REQUEST_TIMEOUT = float(os.getenv("AMQP_REQUEST_TIMEOUT", "30"))
+# Статистика публикаций и обработки входящих сообщений в логах
+AMQP_MONITORING = os.getenv("AMQP_MONITORING", "false").lower() == "true"
+AMQP_MONITORING_INTERVAL = float(os.getenv("AMQP_MONITORING_INTERVAL", "60"))
+# Планировщик отложенных задач: окно подгрузки из MongoDB, срок захвата задачи репликой
+# и пауза перед повтором неудачной публикации (секунды)
+SCHEDULER_WINDOW = float(os.getenv("SCHEDULER_WINDOW", "60"))
+SCHEDULER_CLAIM_TTL = float(os.getenv("SCHEDULER_CLAIM_TTL", "60"))
+SCHEDULER_RETRY_DELAY = float(os.getenv("SCHEDULER_RETRY_DELAY", "10"))
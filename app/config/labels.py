@@ -9,6 +9,7 @@ CHOOSE_ACTION = "Выберите действие"
 # choose_recordings_search_method_keyboard
 BY_TAG = "🏷️ По тегу"
 BY_LINK = "🔗 По ссылке"
+BY_SEARCH = "🔤 Поиск по фрагменту"
 CHOOSE_SEARCH_RECORD_TYPE = "Выберите способ поиска конференции"
 
 
@@ -35,6 +36,11 @@ BACK = "↩ Назад"
 ADD_ADMIN = "➕ Добавить админа"
 
 
+# paginated inline lists
+PREV_PAGE = "⬅️ Предыдущие"
+NEXT_PAGE = "Следующие ➡️"
+
+
 # conference actions
 REQUEST_SCREENSHOT = "📸 Запросить скриншот происходящего"
 REQUEST_TIME_PASSED = "⏱️ Узнать, как давно записывается встреча"
@@ -9,17 +9,17 @@ class Role(StrEnum):
     OWNER = "owner"
 
     def __lt__(self, other):
-        roles = list(Role)
-        return roles.index(self) < roles.index(other)
+        return _ROLE_ORDINALS[self] < _ROLE_ORDINALS[other]
 
     def __le__(self, other):
-        roles = list(Role)
-        return roles.index(self) <= roles.index(other)
+        return _ROLE_ORDINALS[self] <= _ROLE_ORDINALS[other]
 
     def __gt__(self, other):
-        roles = list(Role)
-        return roles.index(self) > roles.index(other)
+        return _ROLE_ORDINALS[self] > _ROLE_ORDINALS[other]
 
     def __ge__(self, other):
-        roles = list(Role)
-        return roles.index(self) >= roles.index(other)
+        return _ROLE_ORDINALS[self] >= _ROLE_ORDINALS[other]
+
+
+# Порядковые номера ролей, вычисляются один раз при импорте
+_ROLE_ORDINALS = {role: ordinal for ordinal, role in enumerate(Role)}
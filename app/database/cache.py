@@ -0,0 +1,71 @@
+from pymongo.errors import OperationFailure, PyMongoError
+
+from app.config.config import DB_CACHE_SIZE, DB_CACHE_TTL
+from app.utils.cache import TTLCache
+from app.utils.logger import logger
+from app.utils.role_cache import invalidate_role
+
+# tag_id -> Tag
+tag_cache = TTLCache(maxsize=DB_CACHE_SIZE, ttl=DB_CACHE_TTL)
+# (is_archived, after, before, limit) -> страница тегов
+tag_list_cache = TTLCache(maxsize=DB_CACHE_SIZE, ttl=DB_CACHE_TTL)
+# conference_id -> Conference
+conference_cache = TTLCache(maxsize=DB_CACHE_SIZE, ttl=DB_CACHE_TTL)
+# (tag_id, ...) -> список конференций с тегом
+conference_list_cache = TTLCache(maxsize=DB_CACHE_SIZE, ttl=DB_CACHE_TTL)
+
+
+def invalidate_tag(tag_id=None) -> None:
+    """Сбрасывает тег по id и все закэшированные списки тегов."""
+    if tag_id is not None:
+        tag_cache.pop(str(tag_id))
+    tag_list_cache.clear()
+
+
+def invalidate_conference(conference_id=None, tag_id=None) -> None:
+    """Сбрасывает конференцию по id и списки конференций её тега.
+
+    Если тег неизвестен, сбрасываются списки конференций всех тегов.
+    """
+    if conference_id is not None:
+        conference_cache.pop(str(conference_id))
+    if tag_id is None:
+        conference_list_cache.clear()
+        return
+    for key, _ in list(conference_list_cache.items()):
+        if key[0] == str(tag_id):
+            conference_list_cache.pop(key)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    return {
+        "tags": tag_cache.stats(),
+        "tag_lists": tag_list_cache.stats(),
+        "conferences": conference_cache.stats(),
+        "conference_lists": conference_list_cache.stats(),
+    }
+
+
+async def watch_invalidations(database) -> None:
+    """Сбрасывает кэш по событиям change stream, чтобы изменения с других реплик бота
+    не жили в кэше до истечения TTL. Работает только с replica set.
+
+    Args:
+        database: База данных Motor (db.db).
+    """
+    pipeline = [{"$match": {"ns.coll": {"$in": ["tags", "conferences", "users"]}}}]
+    try:
+        async with database.watch(pipeline) as stream:
+            logger.info("Слушаем change stream для сброса кэша")
+            async for change in stream:
+                document_id = change.get("documentKey", {}).get("_id")
+                if change["ns"]["coll"] == "tags":
+                    invalidate_tag(document_id)
+                elif change["ns"]["coll"] == "users":
+                    invalidate_role(user_id=document_id)
+                else:
+                    invalidate_conference(document_id)
+    except OperationFailure as e:
+        logger.warning(f"Change stream недоступен, кэш сбрасывается только локально: {e}")
+    except PyMongoError as e:
+        logger.error(f"Change stream для сброса кэша остановлен: {e}")
@@ -1,47 +1,186 @@
-from typing import List
+import asyncio
+from contextlib import asynccontextmanager
+from typing import List, Optional
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
 
-from app.config.config import MONGODB_URI, MONGODB_DATABASE
-from app.database.models.tag_DBO import Tag
-from app.database.models.user_DBO import User
+from app.config.config import (
+    DB_BACKEND,
+    MONGODB_CONNECT_TIMEOUT_MS,
+    MONGODB_DATABASE,
+    MONGODB_MAX_IDLE_TIME_MS,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_MONITORING,
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+    MONGODB_URI,
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+)
+from app.database.cache import tag_list_cache
+from app.database.indexes import INDEXES
+from app.database.memory import MemoryClient
+from app.database.models.tag_DBO import TagListItem
+from app.database.monitoring import mongo_stats
+from app.database.models.user_DBO import UserListItem
+from app.database.pagination import PAGE_SIZE, keyset_filter, split_page
 
 
 class Database:
     def __init__(self):
-        self.client = AsyncIOMotorClient(MONGODB_URI)
-        self.db = self.client[MONGODB_DATABASE]
+        # Клиент создаётся при первом обращении внутри запущенного event loop,
+        # а не при импорте модуля: Motor привязывается к текущему циклу.
+        self._client: Optional[AsyncIOMotorClient] = None
+        self._db = None
+        self._supports_transactions: Optional[bool] = None
+
+    @property
+    def client(self) -> AsyncIOMotorClient:
+        if self._client is None and DB_BACKEND == "memory":
+            # тот же API коллекций, что у Motor, но данные живут в памяти процесса
+            self._client = MemoryClient()
+        if self._client is None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError(
+                    "Клиент MongoDB создаётся только внутри запущенного event loop"
+                ) from None
+            self._client = AsyncIOMotorClient(
+                MONGODB_URI,
+                maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                minPoolSize=MONGODB_MIN_POOL_SIZE,
+                maxIdleTimeMS=MONGODB_MAX_IDLE_TIME_MS,
+                waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS,
+                serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                connectTimeoutMS=MONGODB_CONNECT_TIMEOUT_MS,
+                event_listeners=[mongo_stats] if MONGODB_MONITORING else [],
+            )
+        return self._client
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = self.client[MONGODB_DATABASE]
+        return self._db
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._db = None
 
     async def ping(self):
         await self.db.command("ping")
         print("MongoDB connection successful")
 
+    async def supports_transactions(self) -> bool:
+        """Транзакции доступны только на replica set и шардированном кластере."""
+        if self._supports_transactions is None:
+            try:
+                hello = await self.db.command("hello")
+                self._supports_transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+            except PyMongoError:
+                self._supports_transactions = False
+        return self._supports_transactions
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Открывает сессию с транзакцией и отдаёт её; на standalone отдаёт None,
+        и операции выполняются без транзакции."""
+        if not await self.supports_transactions():
+            yield None
+            return
+        async with await self.client.start_session() as session:
+            async with session.start_transaction():
+                yield session
+
     async def setup_indexes(self):
-        await self.db["tags"].create_index("name", unique=True)
-        await self.db["users"].create_index("telegram_tag", unique=True)
-        await self.db["users"].create_index("telegram_id", unique=False)
-        await self.db["conferences"].create_index("link", unique=True)
+        for collection, indexes in INDEXES.items():
+            await self.db[collection].create_indexes(indexes)
 
-    async def get_active_tags(self) -> List[Tag]:
+    async def find_page(
+        self,
+        collection: str,
+        query: dict,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: int = PAGE_SIZE,
+    ) -> tuple[List[dict], bool, bool]:
+        """Читает одну страницу документов по _id-курсору, запрашивая limit+1 документ.
+
+        Returns:
+            tuple[List[dict], bool, bool]: Документы, есть ли предыдущая и следующая страницы.
+        """
+        page_query, direction = keyset_filter(query, after, before)
+        cursor = self.db[collection].find(page_query).sort("_id", direction).limit(limit + 1)
+        docs = [doc async for doc in cursor]
+        return split_page(docs, limit, after, before)
+
+    async def get_active_tags(self) -> List[TagListItem]:
+        cached = tag_list_cache.get((False, None, None, None))
+        if cached is not None:
+            return cached
         tags_collection = self.db["tags"]
         tags = []
         async for tag_doc in tags_collection.find({"is_archived": False}):
-            tags.append(Tag(**tag_doc))
+            tags.append(TagListItem(tag_doc))
+        tag_list_cache.set((False, None, None, None), tags)
         return tags
 
-    async def get_archived_tags(self) -> List[Tag]:
+    async def get_active_tags_page(
+        self, after: Optional[str] = None, before: Optional[str] = None, limit: int = PAGE_SIZE
+    ) -> tuple[List[TagListItem], bool, bool]:
+        cache_key = (False, after, before, limit)
+        cached = tag_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        docs, has_prev, has_next = await self.find_page(
+            "tags", {"is_archived": False}, after, before, limit
+        )
+        page = [TagListItem(tag_doc) for tag_doc in docs], has_prev, has_next
+        tag_list_cache.set(cache_key, page)
+        return page
+
+    async def get_archived_tags(self) -> List[TagListItem]:
+        cached = tag_list_cache.get((True, None, None, None))
+        if cached is not None:
+            return cached
         tags_collection = self.db["tags"]
         tags = []
         async for tag_doc in tags_collection.find({"is_archived": True}):
-            tags.append(Tag(**tag_doc))
+            tags.append(TagListItem(tag_doc))
+        tag_list_cache.set((True, None, None, None), tags)
         return tags
 
-    async def get_all_admins(self) -> List[User]:
+    async def get_archived_tags_page(
+        self, after: Optional[str] = None, before: Optional[str] = None, limit: int = PAGE_SIZE
+    ) -> tuple[List[TagListItem], bool, bool]:
+        cache_key = (True, after, before, limit)
+        cached = tag_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        docs, has_prev, has_next = await self.find_page(
+            "tags", {"is_archived": True}, after, before, limit
+        )
+        page = [TagListItem(tag_doc) for tag_doc in docs], has_prev, has_next
+        tag_list_cache.set(cache_key, page)
+        return page
+
+    async def get_all_admins(self) -> List[UserListItem]:
         users_collection = self.db["users"]
         admins = []
         async for user_doc in users_collection.find({"role": "admin"}):
-            admins.append(User(**user_doc))
+            admins.append(UserListItem(user_doc))
         return admins
 
+    async def get_admins_page(
+        self, after: Optional[str] = None, before: Optional[str] = None, limit: int = PAGE_SIZE
+    ) -> tuple[List[UserListItem], bool, bool]:
+        docs, has_prev, has_next = await self.find_page(
+            "users", {"role": "admin"}, after, before, limit
+        )
+        return [UserListItem(user_doc) for user_doc in docs], has_prev, has_next
+
 
 db = Database()
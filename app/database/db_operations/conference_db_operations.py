@@ -1,17 +1,29 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from bson import ObjectId
 from motor.core import AgnosticCollection
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
+from app.database.cache import conference_cache, conference_list_cache, invalidate_conference
 from app.database.database import db
-from app.database.db_operations.recording_db_operations import delete_recording_from_db
-from app.database.models.conference_DBO import Conference
+from app.database.db_operations.scheduled_task_db_operations import (
+    delete_scheduled_tasks_by_conference,
+)
+from app.database.models.conference_DBO import Conference, ConferenceListItem
+from app.database.pagination import PAGE_SIZE, keyset_filter, split_page
+from app.database.projection import build_projection, to_model
 from app.utils.logger import logger
+from app.utils.meet_link import extract_meet_code
+from app.utils.search import search_terms
+
+DELETE_BATCH_SIZE = 500
+
+_ANY = object()
 
 
 async def update_conference_timestamp(
-    conference_id: ObjectId, timestamp: int | None
+    conference_id: ObjectId, timestamp: int | None, expected_timestamp=_ANY
 ) -> tuple[bool, str]:
     """
     Update the timestamp of a conference with the given ID.
@@ -19,6 +31,9 @@ async def update_conference_timestamp(
     Args:
         conference_id (ObjectId): The ID of the conference to update.
         timestamp (int | None): The new timestamp value to set (Unix timestamp in seconds or None).
+        expected_timestamp (int | None): If given, update only while the stored timestamp
+            still equals it. A mismatch means the timestamp was already moved (for example
+            by a redelivered recorder response) and is reported as success.
 
     Returns:
         tuple[bool, str]: A tuple containing:
@@ -27,38 +42,64 @@ async def update_conference_timestamp(
     """
     conferences_collection: AgnosticCollection = db.db["conferences"]
     try:
-        # Проверяем, существует ли конференция
-        conference = await get_conference_by_id(str(conference_id))
+        # Обновляем timestamp (может быть None) и получаем документ до изменения одним запросом
+        query = {"_id": ObjectId(conference_id)}
+        if expected_timestamp is not _ANY:
+            query["next_meeting_timestamp"] = expected_timestamp
+        conference = await conferences_collection.find_one_and_update(
+            query,
+            {"$set": {"next_meeting_timestamp": timestamp}},
+            projection={"link": 1, "tag_id": 1, "next_meeting_timestamp": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if not conference and expected_timestamp is not _ANY:
+            exists = await conferences_collection.count_documents(
+                {"_id": ObjectId(conference_id)}, limit=1
+            )
+            if exists:
+                logger.info(
+                    f"Timestamp for conference '{conference_id}' was already moved "
+                    f"from '{expected_timestamp}'"
+                )
+                return True, f"Timestamp для конференции уже перенесён с '{expected_timestamp}'!"
         if not conference:
             logger.warning(f"Conference with id '{conference_id}' not found")
             return False, f"Конференция с id '{conference_id}' не найдена!"
 
-        # Обновляем timestamp (может быть None)
-        result = await conferences_collection.update_one(
-            {"_id": conference_id}, {"$set": {"next_meeting_timestamp": timestamp}}
-        )
-        if result.modified_count == 0:
+        invalidate_conference(conference_id, conference["tag_id"])
+        if conference.get("next_meeting_timestamp") == timestamp:
             logger.info(
                 f"Timestamp for conference '{conference_id}' was already '{timestamp}' or no changes applied"
             )
             return (
                 True,
-                f"Timestamp для конференции '{conference.link}' уже был '{timestamp}' или не изменился!",
+                f"Timestamp для конференции '{conference['link']}' уже был '{timestamp}' или не изменился!",
             )
 
         logger.info(f"Timestamp for conference '{conference_id}' updated to '{timestamp}'")
         return (
             True,
-            f"Timestamp для конференции '{conference.link}' успешно обновлён на '{timestamp}'!",
+            f"Timestamp для конференции '{conference['link']}' успешно обновлён на '{timestamp}'!",
         )
     except Exception as e:
         logger.error(f"Error updating timestamp for conference '{conference_id}': {e}")
         return False, f"Ошибка при обновлении timestamp: {e}"
 
 
+def link_filter(link: str) -> dict:
+    """
+    Build a conference lookup filter for a Meet link: by the canonical meeting code when
+    it can be extracted, otherwise by the raw link.
+    """
+    meet_code = extract_meet_code(link)
+    if meet_code is None:
+        return {"link": link}
+    return {"meet_code": meet_code}
+
+
 async def conference_exists_by_link(meet_link: str) -> bool:
     """Check if a conference with the given link already exists in the database."""
-    existing_conference = await db.db.conferences.find_one({"link": meet_link})
+    existing_conference = await db.db.conferences.find_one(link_filter(meet_link), {"_id": 1})
     return bool(existing_conference)
 
 
@@ -68,37 +109,66 @@ async def add_conference_to_db(
     timestamp: int,
     timezone: int,
     periodicity: Optional[int] = None,
-) -> tuple[bool, str]:
+) -> tuple[bool, str, Optional[ObjectId]]:
     """
     Adds a new conference to the database.
 
     Returns:
-        tuple[bool, str]: A tuple containing:
+        tuple[bool, str, Optional[ObjectId]]: A tuple containing:
             - Success flag (True if inserted, False if failed).
             - Response message.
+            - ID of the inserted conference (None if failed).
     """
+    meet_code = extract_meet_code(meet_link)
     conference = {
         "link": meet_link,
+        "meet_code": meet_code,
+        "search_terms": search_terms(meet_code or meet_link),
         "tag_id": tag_id,
         "next_meeting_timestamp": timestamp,
         "timezone": timezone,
         "periodicity": periodicity,
         "recordings": [],
+        "recordings_count": 0,
     }
     try:
         await db.db.conferences.insert_one(conference)
-        return True, f"Конференция с ссылкой {meet_link} успешно добавлена!"
+        invalidate_conference(conference["_id"], tag_id)
+        return True, f"Конференция с ссылкой {meet_link} успешно добавлена!", conference["_id"]
     except DuplicateKeyError:
-        return False, f"Конференция с ссылкой '{meet_link}' уже существует!"
+        return False, f"Конференция с ссылкой '{meet_link}' уже существует!", None
+
+
+async def get_conference_by_id(
+    conference_id: str, fields: Optional[Iterable[str]] = None
+) -> Optional[Conference]:
+    """
+    Retrieve a conference by its ID.
 
+    Args:
+        conference_id (str): The ID of the conference.
+        fields (Optional[Iterable[str]]): Fields to read. None reads everything except
+            the recordings array (its field is None then, use recordings_count or
+            get_recordings_by_conference_id); a partial conference is returned without
+            validation.
 
-async def get_conference_by_id(conference_id: str) -> Optional[Conference]:
-    """Retrieve a conference by its ID."""
+    Returns:
+        Optional[Conference]: The conference or None if not found.
+    """
+    if fields is None or "recordings" not in fields:
+        cached = conference_cache.get(str(conference_id))
+        if cached is not None:
+            return cached
     conferences_collection: AgnosticCollection = db.db["conferences"]
     try:
-        conference_doc = await conferences_collection.find_one({"_id": ObjectId(conference_id)})
+        conference_doc = await conferences_collection.find_one(
+            {"_id": ObjectId(conference_id)}, build_projection("conferences", fields)
+        )
         if conference_doc:
-            return Conference(**conference_doc)
+            conference = to_model(Conference, conference_doc, fields)
+            if fields is None:
+                conference_cache.set(str(conference_id), conference)
+            return conference
         logger.warning(f"Conference with id '{conference_id}' not found")
         return None
     except Exception as e:
@@ -106,28 +176,124 @@ async def get_conference_by_id(conference_id: str) -> Optional[Conference]:
         return None
 
 
-async def get_conferences_by_tag(tag_id: str) -> List[Conference]:
-    """Retrieve all conferences associated with a specific tag."""
+def conference_list_pipeline(
+    tag_id: str,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> List[dict]:
+    """Build the aggregation pipeline used by get_conference_list_by_tag."""
+    match, direction = keyset_filter({"tag_id": ObjectId(tag_id)}, after, before)
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"_id": direction}},
+    ]
+    if skip:
+        pipeline.append({"$skip": skip})
+    if limit:
+        pipeline.append({"$limit": limit})
+    pipeline.append(
+        {
+            "$project": {
+                "link": 1,
+                "next_meeting_timestamp": 1,
+                "timezone": 1,
+                # до миграции 1 счётчика может не быть, тогда считаем по массиву
+                "recordings_count": {
+                    "$ifNull": ["$recordings_count", {"$size": {"$ifNull": ["$recordings", []]}}]
+                },
+            }
+        }
+    )
+    return pipeline
+
+
+async def get_conference_list_by_tag(
+    tag_id: str,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+) -> List[ConferenceListItem]:
+    """
+    Retrieve a lightweight listing of conferences with a specific tag in one aggregation.
+
+    Only the fields needed by list screens are projected; the recordings array is replaced
+    by its size on the server side.
+
+    Args:
+        tag_id (str): The ID of the tag.
+        skip (int): Number of conferences to skip.
+        limit (Optional[int]): Maximum number of conferences to return (None for all).
+        after (Optional[str]): Return only conferences with _id greater than this one.
+        before (Optional[str]): Return only conferences with _id less than this one,
+            in descending order.
+
+    Returns:
+        List[ConferenceListItem]: Conferences ordered by _id.
+    """
     conferences_collection: AgnosticCollection = db.db["conferences"]
-    conferences = []
+    pipeline = conference_list_pipeline(tag_id, skip, limit, after, before)
+    cache_key = (str(tag_id), skip, limit, after, before)
+    cached = conference_list_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
-        async for conference_doc in conferences_collection.find({"tag_id": ObjectId(tag_id)}):
-            conferences.append(Conference(**conference_doc))
+        conferences = [
+            ConferenceListItem(conference_doc)
+            async for conference_doc in conferences_collection.aggregate(pipeline)
+        ]
+        conference_list_cache.set(cache_key, conferences)
         return conferences
     except Exception as e:
-        logger.error(f"Error retrieving conferences by tag '{tag_id}': {e}")
+        logger.error(f"Error retrieving conference listing by tag '{tag_id}': {e}")
         return []
 
 
-async def get_conference_by_link(link: str) -> Optional[Conference]:
-    """Retrieve a conference by its link."""
+async def get_conference_page_by_tag(
+    tag_id: str,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    limit: int = PAGE_SIZE,
+) -> tuple[List[ConferenceListItem], bool, bool]:
+    """
+    Retrieve one page of the conference listing by an _id cursor, reading limit+1 documents.
+
+    Returns:
+        tuple[List[ConferenceListItem], bool, bool]: Conferences of the page,
+            whether a previous page exists, whether a next page exists.
+    """
+    conferences = await get_conference_list_by_tag(
+        tag_id, limit=limit + 1, after=after, before=before
+    )
+    return split_page(conferences, limit, after, before)
+
+
+async def find_conference_by_link(
+    link: str, fields: Optional[Iterable[str]] = None
+) -> Optional[Conference]:
+    """
+    Retrieve a conference by its link like get_conference_by_link, but let database errors
+    propagate, so that a caller that can retry (a recorder response, a migration) does not
+    mistake a failed read for a missing conference.
+    """
     conferences_collection: AgnosticCollection = db.db["conferences"]
+    conference_doc = await conferences_collection.find_one(
+        link_filter(link), build_projection("conferences", fields)
+    )
+    if conference_doc:
+        return to_model(Conference, conference_doc, fields)
+    logger.warning(f"Conference with link '{link}' not found")
+    return None
+
+
+async def get_conference_by_link(
+    link: str, fields: Optional[Iterable[str]] = None
+) -> Optional[Conference]:
+    """Retrieve a conference by its link; fields work as in get_conference_by_id."""
     try:
-        conference_doc = await conferences_collection.find_one({"link": link})
-        if conference_doc:
-            return Conference(**conference_doc)
-        logger.warning(f"Conference with link '{link}' not found")
-        return None
+        return await find_conference_by_link(link, fields)
     except Exception as e:
         logger.error(f"Error retrieving conference with link '{link}': {e}")
         return None
@@ -136,49 +302,83 @@ async def get_conference_by_link(link: str) -> Optional[Conference]:
 async def add_recording_to_conference(
     conference_id: ObjectId, recording_id: ObjectId
 ) -> tuple[bool, str]:
-    """Add a recording ID to the recordings array of a conference."""
+    """
+    Add a recording ID to the recordings array of a conference.
+
+    Returns False if the conference is missing or already has the recording. Database
+    errors propagate, so that a recorder response that failed here is retried.
+    """
     conferences_collection: AgnosticCollection = db.db["conferences"]
-    try:
-        result = await conferences_collection.update_one(
-            {"_id": conference_id}, {"$push": {"recordings": recording_id}}
+    # idempotent: a recording that is already in the array is not pushed or counted again
+    result = await conferences_collection.update_one(
+        {"_id": conference_id, "recordings": {"$ne": recording_id}},
+        {"$push": {"recordings": recording_id}, "$inc": {"recordings_count": 1}},
+    )
+    cached_conference = conference_cache.get(str(conference_id))
+    invalidate_conference(
+        conference_id, cached_conference.tag_id if cached_conference is not None else None
+    )
+    if result.modified_count == 0:
+        logger.warning(
+            f"Conference with id '{conference_id}' not found or already has {recording_id}"
         )
-        if result.modified_count == 0:
-            logger.warning(f"Conference with id '{conference_id}' not found")
-            return False, f"Conference with id '{conference_id}' not found!"
-        logger.info(f"Recording {recording_id} added to conference with id '{conference_id}'")
-        return True, "Recording successfully added to conference!"
-    except Exception as e:
-        logger.error(f"Error updating conference with id '{conference_id}': {e}")
-        return False, f"Error: {e}"
+        return False, f"Conference with id '{conference_id}' not found or already has it!"
+    logger.info(f"Recording {recording_id} added to conference with id '{conference_id}'")
+    return True, "Recording successfully added to conference!"
+
+
+async def delete_conferences_cascade(
+    conference_ids: List[ObjectId], session=None
+) -> tuple[int, int]:
+    """
+    Delete conferences, their recordings and pending scheduled recordings with
+    delete_many over $in batches.
+
+    Args:
+        conference_ids (List[ObjectId]): IDs of the conferences to delete.
+        session: Optional session of an open transaction.
+
+    Returns:
+        tuple[int, int]: Number of deleted conferences and deleted recordings.
+    """
+    conferences_deleted = recordings_deleted = 0
+    for start in range(0, len(conference_ids), DELETE_BATCH_SIZE):
+        batch = conference_ids[start : start + DELETE_BATCH_SIZE]
+        result = await db.db.recordings.delete_many(
+            {"conference_id": {"$in": batch}}, session=session
+        )
+        recordings_deleted += result.deleted_count
+        await delete_scheduled_tasks_by_conference(batch, session=session)
+        result = await db.db.conferences.delete_many({"_id": {"$in": batch}}, session=session)
+        conferences_deleted += result.deleted_count
+    return conferences_deleted, recordings_deleted
 
 
 async def delete_conference_by_id(conference_id: str) -> tuple[bool, str]:
     """Delete a conference by its ID from the database and its associated recordings."""
-    conferences_collection: AgnosticCollection = db.db["conferences"]
     try:
-        conference = await get_conference_by_id(conference_id)
+        conference = await get_conference_by_id(conference_id, fields=("tag_id", "link"))
         if not conference:
             logger.warning(f"Conference with id '{conference_id}' not found for deletion")
             return False, f"Конференция с ID '{conference_id}' не найдена!"
 
-        for recording_id in conference.recordings:
-            success, msg = await delete_recording_from_db(str(recording_id))
-            if not success:
-                logger.warning(
-                    f"Failed to delete recording {recording_id} for conference {conference_id}: {msg}"
-                )
-
-        result = await conferences_collection.delete_one({"_id": ObjectId(conference_id)})
-        if result.deleted_count == 0:
+        async with db.transaction() as session:
+            conferences_deleted, recordings_deleted = await delete_conferences_cascade(
+                [conference.id], session=session
+            )
+        invalidate_conference(conference_id, conference.tag_id)
+        if conferences_deleted == 0:
             logger.warning(f"Conference with id '{conference_id}' not found during deletion")
             return False, f"Конференция с ссылкой '{conference.link}' не найдена!"
 
         logger.info(
-            f"Conference with id '{conference_id}' and its recordings deleted successfully"
+            f"Conference with id '{conference_id}' and {recordings_deleted} recordings "
+            "deleted successfully"
         )
         return (
             True,
-            f"Конференция с ссылкой '{conference.link}' и все связанные записи успешно удалены!",
+            f"Конференция с ссылкой '{conference.link}' и все связанные записи успешно удалены! "
+            f"Удалено записей: {recordings_deleted}.",
         )
     except Exception as e:
         logger.error(f"Error deleting conference with id '{conference_id}': {e}")
@@ -0,0 +1,65 @@
+import time
+from typing import List
+
+from bson import ObjectId
+
+from app.database.database import db
+
+
+async def add_outbox_message(
+    body: bytes, exchange: str, routing_key: str, properties: dict, delay: float = 0
+) -> ObjectId:
+    """Сохраняет сообщение для публикации в RabbitMQ. Возвращает ID записи outbox.
+
+    Сообщение с delay создаётся захваченным на delay секунд: claim_outbox_batch не
+    выберет его раньше срока.
+    """
+    now = time.time()
+    message = {
+        "body": body,
+        "exchange": exchange,
+        "routing_key": routing_key,
+        "properties": properties,
+        "created_at": now,
+    }
+    if delay > 0:
+        message["claimed_until"] = now + delay
+    result = await db.db.outbox.insert_one(message)
+    return result.inserted_id
+
+
+async def claim_outbox_batch(limit: int, lease: float) -> List[dict]:
+    """
+    Захватывает до limit самых старых незахваченных сообщений, чтобы их не публиковала
+    другая реплика бота. Захват истекает через lease секунд, если реплика не успела
+    опубликовать и удалить сообщения.
+
+    Returns:
+        List[dict]: Захваченные сообщения в порядке добавления.
+    """
+    now = time.time()
+    free = {"$or": [{"claimed_until": None}, {"claimed_until": {"$lt": now}}]}
+    ids = [
+        doc["_id"] async for doc in db.db.outbox.find(free, {"_id": 1}).sort("_id", 1).limit(limit)
+    ]
+    if not ids:
+        return []
+    claim = ObjectId()
+    await db.db.outbox.update_many(
+        {"_id": {"$in": ids}, **free},
+        {"$set": {"claimed_until": now + lease, "claim": claim}},
+    )
+    return await db.db.outbox.find({"claim": claim}).sort("_id", 1).to_list(None)
+
+
+async def delete_outbox_messages(message_ids: List[ObjectId]) -> int:
+    """Удаляет опубликованные сообщения."""
+    result = await db.db.outbox.delete_many({"_id": {"$in": message_ids}})
+    return result.deleted_count
+
+
+async def release_outbox_messages(message_ids: List[ObjectId]) -> None:
+    """Снимает захват после неудачной публикации, сообщения уйдут следующей пачкой."""
+    await db.db.outbox.update_many(
+        {"_id": {"$in": message_ids}}, {"$unset": {"claimed_until": "", "claim": ""}}
+    )
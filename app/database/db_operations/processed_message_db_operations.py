@@ -0,0 +1,23 @@
+from datetime import datetime, timedelta, timezone
+
+from app.database.database import db
+
+
+async def is_message_processed(message_id: str) -> bool:
+    """Обработано ли сообщение с этим ID (запись ещё не истекла)."""
+    document = await db.db.processed_messages.find_one(
+        {"_id": message_id, "expires_at": {"$gt": datetime.now(timezone.utc)}}, {"_id": 1}
+    )
+    return document is not None
+
+
+async def mark_message_processed(message_id: str, ttl: float) -> None:
+    """
+    Запоминает обработанное сообщение на ttl секунд. Повторная отметка продлевает срок.
+    Истёкшие записи удаляет TTL-индекс по expires_at.
+    """
+    await db.db.processed_messages.update_one(
+        {"_id": message_id},
+        {"$set": {"expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl)}},
+        upsert=True,
+    )
@@ -1,10 +1,11 @@
 from motor.core import AgnosticCollection
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 from bson import ObjectId
-from typing import Optional
+from typing import List, Optional
 
 from app.database.database import db
-from app.database.models.recording_DBO import Recording
+from app.database.models.recording_DBO import Recording, RecordingListItem
 from app.utils.logger import logger
 
 
@@ -37,21 +38,29 @@ async def create_recording_by_conference_link(
         recording_link (str): Ссылка на запись.
 
     Returns:
-        tuple[bool, str, Optional[ObjectId]]: Успех, сообщение, ID созданной записи (или None).
+        tuple[bool, str, Optional[ObjectId]]: Успех, сообщение, ID созданной или уже
+            существующей записи с этой ссылкой (или None).
     """
     from app.database.db_operations.conference_db_operations import get_conference_by_link
 
     # Ищем конференцию по ссылке
-    conference = await get_conference_by_link(conference_link)
+    conference = await get_conference_by_link(conference_link, fields=("_id",))
     if not conference:
         logger.warning(f"Конференция с ссылкой '{conference_link}' не найдена для создания записи")
         return False, f"Конференция с ссылкой '{conference_link}' не найдена!", None, None
 
-    # Создаём запись с conference_id
+    # Создаём запись с conference_id; повторная доставка ответа рекордера о той же записи
+    # находит уже созданную (индекс conference_id) и не добавляет дубль
     recording = Recording(conference_id=conference.id, link=recording_link)
     recordings_collection: AgnosticCollection = db.db["recordings"]
     try:
-        await recordings_collection.insert_one(recording.model_dump(by_alias=True))
+        recording_doc = await recordings_collection.find_one_and_update(
+            {"conference_id": conference.id, "link": recording_link},
+            {"$setOnInsert": recording.model_dump(by_alias=True)},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        recording = Recording(**recording_doc)
         logger.info(
             f"Запись с ссылкой '{recording_link}' добавлена для конференции '{conference_link}' с id: {recording.id}"
         )
@@ -85,6 +94,21 @@ async def get_recording_by_id(recording_id: str) -> Optional[Recording]:
         return None
 
 
+async def get_recordings_by_conference_id(conference_id: ObjectId) -> List[RecordingListItem]:
+    """Получает все записи конференции одним запросом, отсортированные по времени."""
+    recordings_collection: AgnosticCollection = db.db["recordings"]
+    recordings = []
+    try:
+        async for recording_doc in recordings_collection.find(
+            {"conference_id": ObjectId(conference_id)}
+        ).sort("timestamp", 1):
+            recordings.append(RecordingListItem(recording_doc))
+        return recordings
+    except Exception as e:
+        logger.error(f"Ошибка при получении записей конференции с id '{conference_id}': {e}")
+        return []
+
+
 async def get_recording_by_meeting_id(meeting_id: str) -> Optional[Recording]:
     """Получает запись по ID встречи."""
     recordings_collection: AgnosticCollection = db.db["recordings"]
@@ -0,0 +1,99 @@
+import time
+from typing import List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from app.database.database import db
+from app.database.models.scheduled_task_DBO import ScheduledTask
+from app.utils.logger import logger
+
+
+async def upsert_scheduled_task(
+    link: str, due_at: float, conference_id: Optional[ObjectId] = None
+) -> ObjectId:
+    """
+    Планирует публикацию ссылки на due_at. У ссылки одна отложенная задача: повторное
+    планирование переносит её срок и снимает захват.
+
+    Args:
+        link (str): Ссылка на встречу.
+        due_at (float): Unix timestamp публикации.
+        conference_id (Optional[ObjectId]): Конференция ссылки; задачи с ней отменяются
+            каскадом при удалении конференции.
+
+    Returns:
+        ObjectId: ID задачи.
+    """
+    fields = {"due_at": due_at}
+    if conference_id is not None:
+        fields["conference_id"] = conference_id
+    task = await db.db.scheduled_tasks.find_one_and_update(
+        {"link": link},
+        {
+            "$set": fields,
+            "$unset": {"claimed_until": ""},
+            "$setOnInsert": {"created_at": time.time()},
+        },
+        projection={"_id": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    logger.info(f"Задача для '{link}' запланирована на {due_at}")
+    return task["_id"]
+
+
+async def delete_scheduled_tasks_by_conference(
+    conference_ids: List[ObjectId], session=None
+) -> int:
+    """
+    Отменяет отложенные задачи конференций одним delete_many по индексу conference_id.
+    Уже подгруженные планировщиком задачи не будут захвачены и пропустятся при
+    срабатывании, поэтому очередь брокера не просматривается.
+
+    Returns:
+        int: Число отменённых задач.
+    """
+    result = await db.db.scheduled_tasks.delete_many(
+        {"conference_id": {"$in": conference_ids}}, session=session
+    )
+    return result.deleted_count
+
+
+async def get_tasks_due_before(timestamp: float) -> List[ScheduledTask]:
+    """Задачи со сроком не позже timestamp, по возрастанию срока (индекс due_at)."""
+    cursor = db.db.scheduled_tasks.find({"due_at": {"$lte": timestamp}}).sort("due_at", 1)
+    return [ScheduledTask(**task_doc) async for task_doc in cursor]
+
+
+async def claim_scheduled_task(
+    task_id: ObjectId, due_at: float, lease: float
+) -> Optional[ScheduledTask]:
+    """
+    Захватывает задачу на публикацию, чтобы её не опубликовала другая реплика бота.
+    Задача не захватывается, если её перенесли (due_at изменился), отменили или она
+    уже захвачена и захват ещё не истёк.
+    """
+    now = time.time()
+    task_doc = await db.db.scheduled_tasks.find_one_and_update(
+        {
+            "_id": task_id,
+            "due_at": due_at,
+            "$or": [{"claimed_until": None}, {"claimed_until": {"$lt": now}}],
+        },
+        {"$set": {"claimed_until": now + lease}},
+        return_document=ReturnDocument.AFTER,
+    )
+    return ScheduledTask(**task_doc) if task_doc else None
+
+
+async def complete_scheduled_task(task_id: ObjectId, due_at: float) -> None:
+    """Удаляет опубликованную задачу, если за время публикации её не перенесли."""
+    await db.db.scheduled_tasks.delete_one({"_id": task_id, "due_at": due_at})
+
+
+async def release_scheduled_task(task_id: ObjectId, due_at: float) -> None:
+    """Снимает захват после неудачной публикации."""
+    await db.db.scheduled_tasks.update_one(
+        {"_id": task_id, "due_at": due_at}, {"$unset": {"claimed_until": ""}}
+    )
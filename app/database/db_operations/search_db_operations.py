@@ -0,0 +1,78 @@
+import asyncio
+from typing import List
+
+from bson import ObjectId
+
+from app.database.database import db
+from app.database.pagination import PAGE_SIZE
+from app.utils.logger import logger
+from app.utils.search import normalize, prefix_filter, rank
+
+SEARCH_MIN_LENGTH = 2
+# Сколько совпадений читается из каждой коллекции. Запрос идёт по индексу search_terms
+# без сортировки, поэтому MongoDB останавливается на этом числе ключей независимо от
+# размера каталога; ранжирование и страницы считаются уже по этой выборке.
+SEARCH_MAX_RESULTS = 50
+
+TAG = "tag"
+CONFERENCE = "conference"
+
+
+class SearchHit:
+    """Результат поиска по фрагменту: активный тег или конференция."""
+
+    __slots__ = ("kind", "id", "title", "rank")
+
+    def __init__(self, kind: str, id: ObjectId, title: str, rank: int):
+        self.kind = kind
+        self.id = id
+        self.title = title
+        self.rank = rank
+
+
+async def _search_tags(query: str) -> List[SearchHit]:
+    cursor = db.db.tags.find({**prefix_filter(query), "is_archived": False}, {"name": 1}).limit(
+        SEARCH_MAX_RESULTS
+    )
+    return [
+        SearchHit(TAG, doc["_id"], doc["name"], rank(query, doc["name"])) async for doc in cursor
+    ]
+
+
+async def _search_conferences(query: str) -> List[SearchHit]:
+    cursor = db.db.conferences.find(prefix_filter(query), {"link": 1, "meet_code": 1}).limit(
+        SEARCH_MAX_RESULTS
+    )
+    hits = []
+    async for doc in cursor:
+        title = doc.get("meet_code") or doc["link"]
+        hits.append(SearchHit(CONFERENCE, doc["_id"], title, rank(query, title)))
+    return hits
+
+
+async def search_catalogue(
+    query: str, skip: int = 0, limit: int = PAGE_SIZE
+) -> tuple[List[SearchHit], bool, bool]:
+    """
+    Ищет активные теги и конференции, у которых имя, код встречи или отдельное слово
+    начинается с фрагмента запроса.
+
+    Args:
+        query (str): Фрагмент, введённый пользователем.
+        skip (int): Сколько результатов пропустить (номер страницы * limit).
+        limit (int): Размер страницы.
+
+    Returns:
+        tuple[List[SearchHit], bool, bool]: Результаты страницы по убыванию релевантности
+            (теги раньше конференций при равном ранге), есть ли предыдущая страница,
+            есть ли следующая.
+    """
+    if len(normalize(query)) < SEARCH_MIN_LENGTH:
+        return [], False, False
+    try:
+        tags, conferences = await asyncio.gather(_search_tags(query), _search_conferences(query))
+    except Exception as e:
+        logger.error(f"Ошибка поиска по запросу '{query}': {e}")
+        return [], False, False
+    hits = sorted(tags + conferences, key=lambda hit: (hit.rank, hit.kind != TAG, hit.title))
+    return hits[skip : skip + limit], skip > 0, skip + limit < len(hits)
@@ -1,14 +1,16 @@
 from bson import ObjectId
 from motor.core import AgnosticCollection
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
 from app.database.db_operations.conference_db_operations import (
-    get_conferences_by_tag,
-    delete_conference_by_id,
+    delete_conferences_cascade,
 )  # Импортируем
+from app.database.cache import invalidate_conference, invalidate_tag, tag_cache
 from app.database.database import db
 from app.database.models.tag_DBO import Tag
 from app.utils.logger import logger
+from app.utils.search import search_terms
 
 
 async def add_tag_to_db(name: str) -> tuple[bool, str]:
@@ -16,11 +18,12 @@ async def add_tag_to_db(name: str) -> tuple[bool, str]:
     Adds tag to DB.
     Returns tuple (isSuccessful, message)
     """
-    tag = Tag(name=name)
+    tag = Tag(name=name, search_terms=search_terms(name))
     tags_collection: AgnosticCollection = db.db["tags"]
 
     try:
         await tags_collection.insert_one(tag.model_dump(by_alias=True))
+        invalidate_tag()
         logger.info(f"Тег '{name}' успешно добавлен с id: {tag.id}")
         return True, f"Тег '{name}' успешно добавлен!"
     except DuplicateKeyError:
@@ -38,13 +41,17 @@ async def update_tag_in_db(tag_id: str, new_name: str) -> tuple[bool, str]:
     """
     tags_collection: AgnosticCollection = db.db["tags"]
     try:
-        result = await tags_collection.update_one(
-            {"_id": ObjectId(tag_id)}, {"$set": {"name": new_name}}
+        previous = await tags_collection.find_one_and_update(
+            {"_id": ObjectId(tag_id)},
+            {"$set": {"name": new_name, "search_terms": search_terms(new_name)}},
+            projection={"name": 1},
+            return_document=ReturnDocument.BEFORE,
         )
-        if result.matched_count == 0:
+        invalidate_tag(tag_id)
+        if previous is None:
             logger.warning(f"Тег с id '{tag_id}' не найден")
             return False, "Тег не найден!"
-        if result.modified_count > 0:
+        if previous["name"] != new_name:
             logger.info(f"Тег с id '{tag_id}' обновлён: новое имя '{new_name}'")
             return True, f"Тег успешно обновлён на '{new_name}'!"
         logger.warning(f"Тег с id '{tag_id}' не изменён (имя уже '{new_name}')")
@@ -59,7 +66,8 @@ async def update_tag_in_db(tag_id: str, new_name: str) -> tuple[bool, str]:
 
 async def delete_tag_from_db(tag_id: str) -> tuple[bool, str]:
     """
-    Deletes tag from DB by ID and its associated conferences.
+    Deletes tag from DB by ID and its associated conferences and recordings.
+    The cascade runs in batches inside a transaction when the server supports it.
     Returns tuple (isSuccessful, message)
     """
     tags_collection: AgnosticCollection = db.db["tags"]
@@ -69,21 +77,34 @@ async def delete_tag_from_db(tag_id: str) -> tuple[bool, str]:
             logger.warning(f"Тег с id '{tag_id}' не найден")
             return False, f"Тег с id '{tag_id}' не найден!"
 
-        conferences = await get_conferences_by_tag(tag_id)
-        for conference in conferences:
-            success, msg = await delete_conference_by_id(str(conference.id))
-            if not success:
-                logger.warning(
-                    f"Failed to delete conference {conference.id} for tag {tag_id}: {msg}"
+        async with db.transaction() as session:
+            conference_ids = [
+                doc["_id"]
+                async for doc in db.db.conferences.find(
+                    {"tag_id": ObjectId(tag_id)}, {"_id": 1}, session=session
                 )
-
-        result = await tags_collection.delete_one({"_id": ObjectId(tag_id)})
+            ]
+            conferences_deleted, recordings_deleted = await delete_conferences_cascade(
+                conference_ids, session=session
+            )
+            result = await tags_collection.delete_one({"_id": ObjectId(tag_id)}, session=session)
+        invalidate_tag(tag_id)
+        for conference_id in conference_ids:
+            invalidate_conference(conference_id, tag_id)
+        invalidate_conference(tag_id=tag_id)
         if result.deleted_count == 0:
             logger.warning(f"Тег с id '{tag_id}' не найден при удалении")
             return False, f"Тег с id '{tag_id}' не найден!"
 
-        logger.info(f"Тег с id '{tag_id}' и связанные конференции успешно удалены")
-        return True, f"Тег '{tag.name}' и все связанные конференции успешно удалены!"
+        logger.info(
+            f"Тег с id '{tag_id}' удалён вместе с {conferences_deleted} конференциями "
+            f"и {recordings_deleted} записями"
+        )
+        return (
+            True,
+            f"Тег '{tag.name}' и все связанные конференции успешно удалены! "
+            f"Удалено конференций: {conferences_deleted}, записей: {recordings_deleted}.",
+        )
     except Exception as e:
         logger.error(f"Ошибка при удалении тега с id '{tag_id}': {e}")
         return False, f"Ошибка: {e}"
@@ -96,13 +117,17 @@ async def unarchive_tag_in_db(tag_id: str) -> tuple[bool, str]:
     """
     tags_collection: AgnosticCollection = db.db["tags"]
     try:
-        result = await tags_collection.update_one(
-            {"_id": ObjectId(tag_id)}, {"$set": {"is_archived": False}}
+        previous = await tags_collection.find_one_and_update(
+            {"_id": ObjectId(tag_id)},
+            {"$set": {"is_archived": False}},
+            projection={"is_archived": 1},
+            return_document=ReturnDocument.BEFORE,
         )
-        if result.matched_count == 0:
+        invalidate_tag(tag_id)
+        if previous is None:
             logger.warning(f"Тег с id '{tag_id}' не найден")
             return False, f"Тег с id '{tag_id}' не найден!"
-        if result.modified_count > 0:
+        if previous.get("is_archived", False):
             logger.info(f"Тег с id '{tag_id}' успешно разархивирован")
             return True, "Тег успешно разархивирован!"
         logger.info(f"Тег с id '{tag_id}' уже был неархивированным")
@@ -119,13 +144,17 @@ async def archive_tag_in_db(tag_id: str) -> tuple[bool, str]:
     """
     tags_collection: AgnosticCollection = db.db["tags"]
     try:
-        result = await tags_collection.update_one(
-            {"_id": ObjectId(tag_id)}, {"$set": {"is_archived": True}}
+        previous = await tags_collection.find_one_and_update(
+            {"_id": ObjectId(tag_id)},
+            {"$set": {"is_archived": True}},
+            projection={"is_archived": 1},
+            return_document=ReturnDocument.BEFORE,
         )
-        if result.matched_count == 0:
+        invalidate_tag(tag_id)
+        if previous is None:
             logger.warning(f"Тег с id '{tag_id}' не найден")
             return False, f"Тег с id '{tag_id}' не найден!"
-        if result.modified_count > 0:
+        if not previous.get("is_archived", False):
             logger.info(f"Тег с id '{tag_id}' успешно архивирован")
             return True, "Тег успешно архивирован!"
         logger.info(f"Тег с id '{tag_id}' уже был архивирован")
@@ -140,11 +169,16 @@ async def get_tag_by_id(tag_id: str) -> Tag | None:
     Retrieves a tag from the DB by its ID.
     Returns Tag object or None if not found.
     """
+    cached = tag_cache.get(str(tag_id))
+    if cached is not None:
+        return cached
     tags_collection: AgnosticCollection = db.db["tags"]
     try:
         tag_doc = await tags_collection.find_one({"_id": ObjectId(tag_id)})
         if tag_doc:
-            return Tag(**tag_doc)
+            tag = Tag(**tag_doc)
+            tag_cache.set(str(tag_id), tag)
+            return tag
         logger.warning(f"Тег с id '{tag_id}' не найден")
         return None
     except Exception as e:
@@ -1,16 +1,19 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from bson import ObjectId
 from motor.core import AgnosticCollection
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 
 from app.bot import bot
 from app.config.config import OWNERS
 from app.config.roles import Role
 from app.database.database import db
-from app.database.models.user_DBO import User
+from app.database.models.user_DBO import User, UserListItem
+from app.database.projection import build_projection, to_model
 from app.keyboards import main_actions_keyboard
 from app.utils.logger import logger
+from app.utils.role_cache import invalidate_role
 
 
 async def add_user_if_not_exists(telegram_tag: str, telegram_id: int | None) -> tuple[bool, str, User | None]:
@@ -50,6 +53,7 @@ async def update_user_telegram_tag(user_id: ObjectId, new_telegram_tag: str) ->
         {"_id": user_id},
         {"$set": {"telegram_tag": new_telegram_tag}}
     )
+    invalidate_role(user_id=user_id)
     return result.modified_count > 0
 
 
@@ -59,40 +63,51 @@ async def update_user_telegram_id(user_id: ObjectId, telegram_id: int) -> bool:
         {"_id": user_id},
         {"$set": {"telegram_id": telegram_id}}
     )
+    invalidate_role(telegram_id, user_id=user_id)
     return result.modified_count > 0
 
 
 async def add_or_update_user_to_admin(telegram_tag: str) -> tuple[bool, str]:
     """Добавляет нового пользователя с ролью admin или обновляет существующего до admin."""
     users_collection: AgnosticCollection = db.db["users"]
+    user = User(telegram_tag=telegram_tag, role=Role.ADMIN)
     try:
-        existing_user = await users_collection.find_one({"telegram_tag": telegram_tag})
+        # Повышение существующего пользователя или вставка нового админа одним запросом.
+        # Админы и владельцы под фильтр не попадают: upsert для них упрётся в уникальный
+        # индекс telegram_tag, и причина отказа читается уже в обработчике DuplicateKeyError.
+        existing_user = await users_collection.find_one_and_update(
+            {"telegram_tag": telegram_tag, "role": {"$nin": [Role.ADMIN, Role.OWNER]}},
+            {
+                "$set": {"role": Role.ADMIN},
+                "$setOnInsert": {"_id": user.id, "telegram_id": user.telegram_id},
+            },
+            projection={"telegram_id": 1},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
         if existing_user:
-            if existing_user["role"] == Role.ADMIN:
-                logger.warning(f"Пользователь '{telegram_tag}' уже является админом")
-                return False, f"Пользователь '{telegram_tag}' уже является админом!"
-            if existing_user["role"] == Role.OWNER:
-                logger.warning(f"Пользователь '{telegram_tag}' является владельцем и не может быть изменён")
-                return False, f"Пользователь '{telegram_tag}' является владельцем и не может быть изменён!"
-            result = await users_collection.update_one(
-                {"telegram_tag": telegram_tag},
-                {"$set": {"role": Role.ADMIN}}
-            )
-            if result.modified_count > 0:
-                notify_successful = await notify_user_about_upgrade_to_admin(telegram_tag)
-                if not notify_successful:
-                    logger.info(f"Не удалось оповестить пользователя '{telegram_tag}' о повышении.")
-                else:
-                    logger.info(f"Оповещение пользователю '{telegram_tag}' о повышении отправлено.")
-                logger.info(f"Пользователь '{telegram_tag}' повышен до админа")
-                return True, f"Пользователь '{telegram_tag}' повышен до админа!"
-            return False, f"Ошибка при обновлении роли пользователя '{telegram_tag}'!"
-        else:
-            user = User(telegram_tag=telegram_tag, role=Role.ADMIN)
-            await users_collection.insert_one(user.model_dump(by_alias=True))
-            logger.info(f"Новый админ '{telegram_tag}' добавлен с id: {user.id}")
-            return True, f"Админ '{telegram_tag}' успешно добавлен!"
+            invalidate_role(existing_user.get("telegram_id"), telegram_tag)
+            notify_successful = await notify_user_about_upgrade_to_admin(telegram_tag)
+            if not notify_successful:
+                logger.info(f"Не удалось оповестить пользователя '{telegram_tag}' о повышении.")
+            else:
+                logger.info(f"Оповещение пользователю '{telegram_tag}' о повышении отправлено.")
+            logger.info(f"Пользователь '{telegram_tag}' повышен до админа")
+            return True, f"Пользователь '{telegram_tag}' повышен до админа!"
+        invalidate_role(telegram_tag=telegram_tag)
+        logger.info(f"Новый админ '{telegram_tag}' добавлен с id: {user.id}")
+        return True, f"Админ '{telegram_tag}' успешно добавлен!"
     except DuplicateKeyError:
+        existing_user = await users_collection.find_one(
+            {"telegram_tag": telegram_tag}, {"role": 1}
+        )
+        role = existing_user["role"] if existing_user else None
+        if role == Role.ADMIN:
+            logger.warning(f"Пользователь '{telegram_tag}' уже является админом")
+            return False, f"Пользователь '{telegram_tag}' уже является админом!"
+        if role == Role.OWNER:
+            logger.warning(f"Пользователь '{telegram_tag}' является владельцем и не может быть изменён")
+            return False, f"Пользователь '{telegram_tag}' является владельцем и не может быть изменён!"
         logger.warning(f"Ошибка: пользователь '{telegram_tag}' уже существует с другой ролью")
         return False, f"Ошибка: пользователь '{telegram_tag}' уже существует!"
     except Exception as e:
@@ -100,13 +115,13 @@ async def add_or_update_user_to_admin(telegram_tag: str) -> tuple[bool, str]:
         return False, f"Ошибка: {e}"
 
 
-async def get_all_users() -> List[User]:
+async def get_all_users(fields: Optional[Iterable[str]] = None) -> List[UserListItem]:
     """Получает всех пользователей."""
     users_collection: AgnosticCollection = db.db["users"]
     users = []
     try:
-        async for user_doc in users_collection.find():
-            users.append(User(**user_doc))
+        async for user_doc in users_collection.find({}, build_projection("users", fields)):
+            users.append(UserListItem(user_doc))
         return users
     except Exception as e:
         logger.error(f"Ошибка при получении списка пользователей: {e}")
@@ -137,39 +152,45 @@ async def notify_user_about_downgrade_to_user(telegram_tag) -> bool:
     return False
 
 
-async def get_admins() -> List[User]:
+async def get_admins(fields: Optional[Iterable[str]] = None) -> List[UserListItem]:
     """Получает всех пользователей с ролью admin."""
     users_collection: AgnosticCollection = db.db["users"]
     admins = []
     try:
-        async for user_doc in users_collection.find({"role": Role.ADMIN}):
-            admins.append(User(**user_doc))
+        async for user_doc in users_collection.find(
+            {"role": Role.ADMIN}, build_projection("users", fields)
+        ):
+            admins.append(UserListItem(user_doc))
         return admins
     except Exception as e:
         logger.error(f"Ошибка при получении списка админов: {e}")
         return []
 
 
-async def get_owners() -> List[User]:
+async def get_owners(fields: Optional[Iterable[str]] = None) -> List[UserListItem]:
     """Получает всех пользователей с ролью owner."""
     users_collection: AgnosticCollection = db.db["users"]
     owners = []
     try:
-        async for user_doc in users_collection.find({"role": Role.OWNER}):
-            owners.append(User(**user_doc))
+        async for user_doc in users_collection.find(
+            {"role": Role.OWNER}, build_projection("users", fields)
+        ):
+            owners.append(UserListItem(user_doc))
         return owners
     except Exception as e:
         logger.error(f"Ошибка при получении списка владельцев: {e}")
         return []
 
 
-async def get_user_by_id(user_id: str) -> Optional[User]:
-    """Получает пользователя по ID."""
+async def get_user_by_id(user_id: str, fields: Optional[Iterable[str]] = None) -> Optional[User]:
+    """Получает пользователя по ID; fields ограничивает читаемые поля."""
     users_collection: AgnosticCollection = db.db["users"]
     try:
-        user_doc = await users_collection.find_one({"_id": ObjectId(user_id)})
+        user_doc = await users_collection.find_one(
+            {"_id": ObjectId(user_id)}, build_projection("users", fields)
+        )
         if user_doc:
-            return User(**user_doc)
+            return to_model(User, user_doc, fields)
         logger.warning(f"Пользователь с id '{user_id}' не найден")
         return None
     except Exception as e:
@@ -181,20 +202,21 @@ async def demote_admin_to_user(user_id: str) -> tuple[bool, str]:
     """Понижает админа до роли user."""
     users_collection: AgnosticCollection = db.db["users"]
     try:
-        user = await get_user_by_id(user_id)
-        if not user:
-            logger.warning(f"Пользователь с id '{user_id}' не найден")
-            return False, f"Пользователь с id '{user_id}' не найден!"
-        if user.role != Role.ADMIN:
+        user_doc = await users_collection.find_one_and_update(
+            {"_id": ObjectId(user_id), "role": Role.ADMIN},
+            {"$set": {"role": Role.USER}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not user_doc:
+            # Понижать некого: выясняем причину для сообщения, это редкий путь
+            user = await get_user_by_id(user_id, fields=("telegram_tag",))
+            if not user:
+                logger.warning(f"Пользователь с id '{user_id}' не найден")
+                return False, f"Пользователь с id '{user_id}' не найден!"
             logger.warning(f"Пользователь '{user.telegram_tag}' не является админом")
             return False, f"Пользователь '{user.telegram_tag}' не является админом!"
-        result = await users_collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": {"role": Role.USER}}
-        )
-        if result.modified_count == 0:
-            logger.warning(f"Не удалось понизить роль пользователя с id '{user_id}'")
-            return False, f"Не удалось понизить роль пользователя '{user.telegram_tag}'!"
+        user = User(**user_doc)
+        invalidate_role(user.telegram_id, user.telegram_tag)
         notify_successful = await notify_user_about_downgrade_to_user(user.telegram_tag)
         if not notify_successful:
             logger.info(f"Не удалось оповестить пользователя '{user.telegram_tag}' о понижении")
@@ -224,6 +246,7 @@ async def ensure_owner_role(telegram_tag: str, telegram_id: int | None = None) -
             {"_id": user.id},
             {"$set": {"role": Role.OWNER}}
         )
+        invalidate_role(user.telegram_id, telegram_tag)
         return True, f"Роль пользователя {telegram_tag} обновлена до OWNER"
     return True, f"Пользователь {telegram_tag} уже имеет роль {user.role}"
 
@@ -236,6 +259,7 @@ async def delete_user_by_telegram_tag_with_no_telegram_id(telegram_tag: str) ->
         })
 
         if result.deleted_count > 0:
+            invalidate_role(telegram_tag=telegram_tag)
             logger.info(f"Пользователь с тегом '{telegram_tag}' успешно удалён")
             return True, f"Пользователь '{telegram_tag}' успешно удалён из базы данных."
         else:
@@ -247,28 +271,79 @@ async def delete_user_by_telegram_tag_with_no_telegram_id(telegram_tag: str) ->
         return False, f"Ошибка при удалении пользователя: {str(e)}"
 
 
-async def handle_user_on_start(telegram_tag: str, telegram_id: int) -> User:
-    """Обрабатывает пользователя при вызове /start."""
-    user = await get_user_by_telegram_id(telegram_id)
-    if user:
-        print("User found with this telegram id")
-        if user.telegram_tag != telegram_tag:
-            logger.info(f"Обновляем telegram_tag для {telegram_id}: {user.telegram_tag} -> {telegram_tag}")
-            await delete_user_by_telegram_tag_with_no_telegram_id(user.telegram_tag)
-            await update_user_telegram_tag(user.id, telegram_tag)
-            user.telegram_tag = telegram_tag
-        return user
+async def _merge_duplicate_by_telegram_id(user_doc: dict) -> dict:
+    """
+    Удаляет старый документ с тем же telegram_id, оставшийся после смены username, когда
+    пользователь занял заготовку с новым тегом. Роль берётся старшая из двух.
+    """
+    duplicate = await db.db.users.find_one_and_delete(
+        {"telegram_id": user_doc["telegram_id"], "_id": {"$ne": user_doc["_id"]}}
+    )
+    if duplicate is None:
+        return user_doc
+    invalidate_role(user_doc["telegram_id"], duplicate["telegram_tag"])
+    role = max(Role(user_doc["role"]), Role(duplicate.get("role", Role.USER)))
+    if role != user_doc["role"]:
+        user_doc = await db.db.users.find_one_and_update(
+            {"_id": user_doc["_id"]},
+            {"$set": {"role": role}},
+            return_document=ReturnDocument.AFTER,
+        )
+    logger.info(
+        f"Пользователь {user_doc['telegram_id']}: заготовка {user_doc['telegram_tag']} "
+        f"объединена с записью {duplicate['telegram_tag']}, роль {role}"
+    )
+    return user_doc
 
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if user:
-        if user.telegram_id is None or user.telegram_id != telegram_id:
-            logger.info(f"Обновляем telegram_id для {telegram_tag}: {user.telegram_id} -> {telegram_id}")
-            await update_user_telegram_id(user.id, telegram_id)
-            user.telegram_id = telegram_id
-        return user
-
-    success, response, user = await add_user_if_not_exists(telegram_tag, telegram_id)
-    if not success:
-        raise Exception(response)
-    logger.info(response)
-    return user
+
+async def _release_telegram_tag(telegram_tag: str, telegram_id: int) -> None:
+    """Тег занят другим telegram_id: прежний владелец сменил username. Его запись получает
+    запасной тег вида @<telegram_id>, как у пользователей без username."""
+    stale = await db.db.users.find_one_and_update(
+        {"telegram_tag": telegram_tag, "telegram_id": {"$nin": [None, telegram_id]}},
+        [{"$set": {"telegram_tag": {"$concat": ["@", {"$toString": "$telegram_id"}]}}}],
+    )
+    if stale is not None:
+        invalidate_role(stale["telegram_id"], telegram_tag)
+        logger.info(f"Тег {telegram_tag} освобождён от пользователя {stale['telegram_id']}")
+
+
+async def handle_user_on_start(telegram_tag: str, telegram_id: int) -> User:
+    """
+    Обрабатывает пользователя при вызове /start.
+
+    Обычно это один find_one_and_update: запись с этим тегом, у которой telegram_id ещё
+    не задан (заготовка из add_or_update_user_to_admin) или уже совпадает, привязывается
+    к telegram_id. Иначе запись ищется по telegram_id и получает новый тег (upsert
+    создаёт её при первом /start). Одновременные /start упираются в уникальный индекс
+    telegram_tag, и проигравший вызов повторяется уже по созданной записи.
+    """
+    for _ in range(3):
+        try:
+            previous = await db.db.users.find_one_and_update(
+                {"telegram_tag": telegram_tag, "telegram_id": {"$in": [None, telegram_id]}},
+                {"$set": {"telegram_id": telegram_id}},
+                return_document=ReturnDocument.BEFORE,
+            )
+            if previous is not None:
+                user_doc = {**previous, "telegram_id": telegram_id}
+                if previous.get("telegram_id") is None:
+                    logger.info(f"Заготовка {telegram_tag} привязана к telegram_id {telegram_id}")
+                    user_doc = await _merge_duplicate_by_telegram_id(user_doc)
+                    invalidate_role(telegram_id, telegram_tag)
+                return User(**user_doc)
+
+            user_doc = await db.db.users.find_one_and_update(
+                {"telegram_id": telegram_id},
+                {"$set": {"telegram_tag": telegram_tag}, "$setOnInsert": {"role": Role.USER}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+            invalidate_role(telegram_id, telegram_tag)
+            logger.info(
+                f"Пользователь {telegram_tag} ({telegram_id}) сохранён с ролью {user_doc['role']}"
+            )
+            return User(**user_doc)
+        except DuplicateKeyError:
+            await _release_telegram_tag(telegram_tag, telegram_id)
+    raise Exception(f"Не удалось зарегистрировать пользователя {telegram_tag}")
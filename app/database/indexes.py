@@ -0,0 +1,56 @@
+from pymongo import ASCENDING, IndexModel
+
+# Индексы под реальные запросы из app/database/db_operations и Database.
+# Имена не задаются явно: create_indexes с тем же ключом и опциями ничего не делает,
+# поэтому уже созданные на проде индексы (name_1, link_1, ...) повторно не пересоздаются.
+# Составные индексы с _id покрывают и фильтр по первому полю, и сортировку страниц.
+INDEXES: dict[str, list[IndexModel]] = {
+    "tags": [
+        IndexModel([("name", ASCENDING)], unique=True),
+        # get_active_tags/get_archived_tags и страницы тегов
+        IndexModel([("is_archived", ASCENDING), ("_id", ASCENDING)]),
+        # поиск по фрагменту: префикс search_terms, архивные теги отсекаются по индексу
+        IndexModel([("search_terms", ASCENDING), ("is_archived", ASCENDING)]),
+    ],
+    "users": [
+        IndexModel([("telegram_tag", ASCENDING)], unique=True),
+        IndexModel([("telegram_id", ASCENDING)]),
+        # списки админов/владельцев и страницы админов
+        IndexModel([("role", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "conferences": [
+        IndexModel([("link", ASCENDING)], unique=True),
+        # поиск по ссылке; документы без кода (до миграции 2) в индекс не попадают
+        IndexModel(
+            [("meet_code", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"meet_code": {"$type": "string"}},
+        ),
+        # поиск по фрагменту кода встречи
+        IndexModel([("search_terms", ASCENDING)]),
+        # конференции тега и их страницы
+        IndexModel([("tag_id", ASCENDING), ("_id", ASCENDING)]),
+    ],
+    "recordings": [
+        # записи конференции в порядке времени
+        IndexModel([("conference_id", ASCENDING), ("timestamp", ASCENDING)]),
+        IndexModel([("meeting_id", ASCENDING)]),
+    ],
+    "scheduled_tasks": [
+        # одна отложенная задача на ссылку
+        IndexModel([("link", ASCENDING)], unique=True),
+        # выборка задач, срок которых наступает в ближайшем окне планировщика
+        IndexModel([("due_at", ASCENDING)]),
+        # отмена задач удалённых конференций
+        IndexModel([("conference_id", ASCENDING)]),
+    ],
+    "outbox": [
+        # захват пачки: незахваченные или с истёкшим захватом; порядок по _id
+        IndexModel([("claimed_until", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("claim", ASCENDING)], sparse=True),
+    ],
+    "processed_messages": [
+        # ID обработанных ответов рекордера удаляются MongoDB по истечении expires_at
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ],
+}
@@ -0,0 +1,527 @@
+"""In-memory реализация API Motor в объёме, который нужен benchmarks/handler_db.py.
+
+Бэкенд выбирается через DB_BACKEND=memory: Database.client отдаёт MemoryClient вместо
+AsyncIOMotorClient, и db_operations из сценариев бенчмарка работают без mongod. Семантика
+повторяет MongoDB там, где от неё зависят эти сценарии: уникальные (в том числе частичные)
+индексы из app/database/indexes.py с DuplicateKeyError, выборка по первым полям индексов,
+upsert, проекции, sort/limit. Всё остальное (удаление, bulk_write, транзакции, change
+stream, прочие операторы) не реализовано: неизвестный оператор даёт OperationFailure.
+"""
+
+import copy
+import itertools
+import re
+from bisect import bisect_left
+from typing import Any, Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from pymongo.results import InsertOneResult, UpdateResult
+
+_MISSING = object()
+
+
+def _get(document: dict, path: str) -> Any:
+    value = document
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _set(document: dict, path: str, value: Any) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.setdefault(part, {})
+    document[last] = value
+
+
+def _unset(document: dict, path: str) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.get(part)
+        if not isinstance(document, dict):
+            return
+    document.pop(last, None)
+
+
+def _literal_prefix(pattern: str) -> Optional[str]:
+    """Литеральный префикс из re.escape(...) или None, если в шаблоне есть метасимволы."""
+    prefix = re.sub(r"\\(.)", r"\1", pattern)
+    return prefix if re.escape(prefix) == pattern else None
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _hashable(item)) for key, item in value.items())
+    return value
+
+
+def _sort_key(value: Any) -> tuple:
+    # поля, по которым сортируют сценарии, одного типа; отсутствующее значение идёт первым
+    if value is None or value is _MISSING:
+        return 0, 0
+    return 1, value
+
+
+def _equals(value: Any, operand: Any) -> bool:
+    if operand is None:
+        return value is None or value is _MISSING
+    if isinstance(value, list) and not isinstance(operand, list):
+        return any(_equals(item, operand) for item in value)
+    return value is not _MISSING and value == operand
+
+
+_BSON_TYPES = {"string": str, "objectId": ObjectId}
+
+
+def _match_operator(value: Any, operator: str, operand: Any) -> bool:
+    if operator == "$ne":
+        return not _equals(value, operand)
+    if operator == "$in":
+        return any(_equals(value, item) for item in operand)
+    if operator == "$type" and operand in _BSON_TYPES:
+        return isinstance(value, _BSON_TYPES[operand])
+    if operator == "$regex":
+        pattern = re.compile(operand) if isinstance(operand, str) else operand
+        values = value if isinstance(value, list) else [value]
+        return any(isinstance(item, str) and pattern.search(item) for item in values)
+    raise OperationFailure(f"Неподдерживаемый оператор запроса в MemoryCollection: {operator}")
+
+
+def matches(document: dict, query: Optional[dict]) -> bool:
+    """Проверяет документ на соответствие фильтру find."""
+    for key, condition in (query or {}).items():
+        if key.startswith("$"):
+            raise OperationFailure(f"Неподдерживаемый оператор запроса в MemoryCollection: {key}")
+        value = _get(document, key)
+        if isinstance(condition, dict) and condition and next(iter(condition)).startswith("$"):
+            if not all(
+                _match_operator(value, operator, operand)
+                for operator, operand in condition.items()
+            ):
+                return False
+        elif not _equals(value, condition):
+            return False
+    return True
+
+
+def _evaluate(expression: Any, document: dict) -> Any:
+    """Вычисляет выражение агрегации ($field, $ifNull, $size)."""
+    if isinstance(expression, str) and expression.startswith("$"):
+        value = _get(document, expression[1:])
+        return None if value is _MISSING else value
+    if not isinstance(expression, dict):
+        return expression
+    ((operator, args),) = expression.items()
+    if operator == "$ifNull":
+        *candidates, default = args
+        for candidate in candidates:
+            value = _evaluate(candidate, document)
+            if value is not None:
+                return value
+        return _evaluate(default, document)
+    if operator == "$size":
+        value = _evaluate(args, document)
+        if not isinstance(value, list):
+            raise OperationFailure("The argument to $size must be an array")
+        return len(value)
+    raise OperationFailure(f"Неподдерживаемое выражение в MemoryCollection: {operator}")
+
+
+def _apply_update(document: dict, update: dict, is_insert: bool = False) -> None:
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            if operator == "$set":
+                _set(document, path, copy.deepcopy(value))
+            elif operator == "$setOnInsert":
+                if is_insert:
+                    _set(document, path, copy.deepcopy(value))
+            elif operator == "$inc":
+                current = _get(document, path)
+                _set(document, path, (0 if current is _MISSING else current) + value)
+            elif operator in ("$push", "$addToSet"):
+                current = _get(document, path)
+                items = [] if current is _MISSING else list(current)
+                each = isinstance(value, dict) and "$each" in value
+                new_items = value["$each"] if each else [value]
+                for item in new_items:
+                    if operator == "$push" or item not in items:
+                        items.append(copy.deepcopy(item))
+                _set(document, path, items)
+            else:
+                raise OperationFailure(f"Неподдерживаемый оператор update: {operator}")
+
+
+def _project(document: dict, projection: Optional[dict]) -> dict:
+    document = copy.deepcopy(document)
+    if not projection:
+        return document
+    include_id = bool(projection.get("_id", 1))
+    fields = {key: value for key, value in projection.items() if key != "_id"}
+    if fields and all(fields.values()):
+        result = {}
+        for path in fields:
+            value = _get(document, path)
+            if value is not _MISSING:
+                _set(result, path, value)
+        if include_id and "_id" in document:
+            result = {"_id": document["_id"], **result}
+        return result
+    for path in fields:
+        _unset(document, path)
+    if not include_id:
+        document.pop("_id", None)
+    return document
+
+
+def _upsert_seed(query: dict) -> dict:
+    """Поля нового документа при upsert: равенства из фильтра."""
+    document = {}
+    for key, condition in query.items():
+        if not (isinstance(condition, dict) and next(iter(condition), "").startswith("$")):
+            _set(document, key, copy.deepcopy(condition))
+    return document
+
+
+def _sort_documents(documents: List[dict], sort: Iterable[tuple[str, int]]) -> List[dict]:
+    for key, direction in reversed(list(sort)):
+        documents.sort(key=lambda doc: _sort_key(_get(doc, key)), reverse=direction < 0)
+    return documents
+
+
+def _normalize_sort(key_or_list, direction: Optional[int] = None) -> List[tuple[str, int]]:
+    if isinstance(key_or_list, str):
+        return [(key_or_list, direction or 1)]
+    if isinstance(key_or_list, dict):
+        return list(key_or_list.items())
+    return list(key_or_list)
+
+
+class MemoryCursor:
+    """Курсор find/aggregate: sort/limit вызываются до чтения, как у Motor."""
+
+    def __init__(self, producer, transform=None):
+        self._producer = producer
+        self._transform = transform
+        self._sort: List[tuple[str, int]] = []
+        self._limit = 0
+
+    def sort(self, key_or_list, direction: Optional[int] = None) -> "MemoryCursor":
+        self._sort = _normalize_sort(key_or_list, direction)
+        return self
+
+    def limit(self, limit: int) -> "MemoryCursor":
+        self._limit = limit
+        return self
+
+    async def __aiter__(self):
+        documents = self._producer(self._sort)
+        if self._limit:
+            documents = documents[: self._limit]
+        for document in documents:
+            yield document if self._transform is None else self._transform(document)
+
+
+class MemoryCollection:
+    def __init__(self, database: "MemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self._documents: dict[Any, dict] = {}
+        # порядок вставки: выборка по индексу возвращается в естественном порядке
+        self._sequence: dict[Any, int] = {}
+        self._counter = itertools.count()
+        # уникальные индексы: name -> (keys, partialFilterExpression) и name -> {ключ: _id}
+        self._unique_indexes: dict[str, tuple[List[str], Optional[dict]]] = {}
+        self._unique_keys: dict[str, dict[tuple, Any]] = {}
+        # первые поля индексов: field -> {значение: {_id}}, чтобы равенство не перебирало
+        # коллекцию; отсортированные строковые значения — для ^prefix
+        self._field_keys: dict[str, dict[Any, set]] = {}
+        self._sorted_keys: dict[str, Optional[List[str]]] = {}
+
+    # Индексы
+
+    async def create_indexes(self, indexes, session=None, **kwargs) -> List[str]:
+        # бенчмарк создаёт индексы до вставки данных, поэтому существующие документы
+        # в индексы не переносятся
+        if self._documents:
+            raise OperationFailure("MemoryCollection строит индексы только на пустой коллекции")
+        names = []
+        for index in indexes:
+            document = index.document
+            names.append(document["name"])
+            field = next(iter(document["key"]))
+            if field not in self._field_keys and field != "_id":
+                self._field_keys[field] = {}
+                self._sorted_keys[field] = None
+            if document.get("unique") and document["name"] not in self._unique_indexes:
+                self._unique_indexes[document["name"]] = (
+                    list(document["key"].keys()),
+                    document.get("partialFilterExpression"),
+                )
+                self._unique_keys[document["name"]] = {}
+        return names
+
+    def _index_key(self, name: str, document: dict) -> Optional[tuple]:
+        """Ключ документа в уникальном индексе или None, если он не попадает в индекс."""
+        keys, partial = self._unique_indexes[name]
+        if partial and not matches(document, partial):
+            return None
+        values = (_get(document, path) for path in keys)
+        return tuple(None if value is _MISSING else _hashable(value) for value in values)
+
+    def _check_unique(self, document: dict, exclude_id: Any = _MISSING) -> None:
+        if exclude_id is _MISSING and document["_id"] in self._documents:
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error collection: {self.name} index: _id_",
+                11000,
+                {"keyValue": {"_id": document["_id"]}},
+            )
+        for name, (keys, _) in self._unique_indexes.items():
+            key = self._index_key(name, document)
+            if key is None:
+                continue
+            owner = self._unique_keys[name].get(key, _MISSING)
+            if owner is not _MISSING and owner != exclude_id:
+                key_value = {path: _get(document, path) for path in keys}
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.name} index: {name} "
+                    f"dup key: {key_value}",
+                    11000,
+                    {"keyValue": key_value},
+                )
+
+    def _field_values(self, field: str, document: dict) -> list:
+        value = _get(document, field)
+        if value is _MISSING or value is None:
+            return [None]
+        if isinstance(value, list):
+            return [_hashable(item) for item in value] or [None]
+        return [_hashable(value)]
+
+    def _prefix_ids(self, field: str, prefix: str) -> set:
+        if self._sorted_keys[field] is None:
+            self._sorted_keys[field] = sorted(
+                key for key in self._field_keys[field] if isinstance(key, str)
+            )
+        keys = self._sorted_keys[field]
+        ids = set()
+        for key in keys[bisect_left(keys, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            ids |= self._field_keys[field][key]
+        return ids
+
+    def _candidate_ids(self, query: dict) -> Optional[set]:
+        """_id документов, которые могут подойти под фильтр, по индексированному полю;
+        None — индекс не помогает и нужен полный перебор."""
+        for field, condition in query.items():
+            if field not in self._field_keys:
+                continue
+            keys = self._field_keys[field]
+            if not isinstance(condition, dict):
+                if isinstance(condition, list):
+                    continue
+                return set(keys.get(_hashable(condition), ()))
+            pattern = condition.get("$regex")
+            if isinstance(pattern, str) and pattern.startswith("^"):
+                prefix = _literal_prefix(pattern[1:])
+                if prefix is not None:
+                    return self._prefix_ids(field, prefix)
+        return None
+
+    def _index_add(self, document: dict) -> None:
+        for field in self._field_keys:
+            for value in self._field_values(field, document):
+                self._field_keys[field].setdefault(value, set()).add(document["_id"])
+            self._sorted_keys[field] = None
+        for name in self._unique_indexes:
+            key = self._index_key(name, document)
+            if key is not None:
+                self._unique_keys[name][key] = document["_id"]
+
+    def _index_remove(self, document: dict) -> None:
+        for field in self._field_keys:
+            for value in self._field_values(field, document):
+                ids = self._field_keys[field].get(value)
+                if ids is not None:
+                    ids.discard(document["_id"])
+                    if not ids:
+                        del self._field_keys[field][value]
+            self._sorted_keys[field] = None
+        for name in self._unique_indexes:
+            key = self._index_key(name, document)
+            if key is not None:
+                self._unique_keys[name].pop(key, None)
+
+    # Чтение
+
+    def _select(self, query: Optional[dict], sort: Iterable[tuple[str, int]] = ()) -> List[dict]:
+        document_id = (query or {}).get("_id", _MISSING)
+        if document_id is not _MISSING and not isinstance(document_id, dict):
+            # поиск по _id не перебирает коллекцию, как и в MongoDB
+            candidates = [self._documents[document_id]] if document_id in self._documents else []
+        else:
+            ids = self._candidate_ids(query or {})
+            if ids is None:
+                candidates = self._documents.values()
+            else:
+                candidates = [
+                    self._documents[i] for i in sorted(ids, key=self._sequence.__getitem__)
+                ]
+        documents = [doc for doc in candidates if matches(doc, query)]
+        return _sort_documents(documents, sort)
+
+    def find(
+        self,
+        filter: Optional[dict] = None,
+        projection: Optional[dict] = None,
+        session=None,
+        **kwargs,
+    ) -> MemoryCursor:
+        return MemoryCursor(
+            lambda sort: self._select(filter, sort), lambda doc: _project(doc, projection)
+        )
+
+    async def find_one(
+        self,
+        filter: Optional[dict] = None,
+        projection: Optional[dict] = None,
+        session=None,
+        **kwargs,
+    ) -> Optional[dict]:
+        documents = self._select(filter, _normalize_sort(kwargs.get("sort") or []))
+        return _project(documents[0], projection) if documents else None
+
+    def aggregate(self, pipeline: List[dict], session=None, **kwargs) -> MemoryCursor:
+        # пайплайны сценариев начинаются с $match, за которым идут $sort, $limit и $project
+        def run(sort):
+            ((name, spec),) = pipeline[0].items()
+            if name != "$match":
+                raise OperationFailure("Пайплайн MemoryCollection должен начинаться с $match")
+            documents = self._select(spec)
+            for stage in pipeline[1:]:
+                ((name, spec),) = stage.items()
+                if name == "$sort":
+                    documents = _sort_documents(documents, _normalize_sort(spec))
+                elif name == "$limit":
+                    documents = documents[:spec]
+                elif name == "$project":
+                    documents = [self._project_stage(doc, spec) for doc in documents]
+                else:
+                    raise OperationFailure(f"Неподдерживаемая стадия в MemoryCollection: {name}")
+            return [copy.deepcopy(doc) for doc in _sort_documents(documents, sort)]
+
+        return MemoryCursor(run)
+
+    @staticmethod
+    def _project_stage(document: dict, spec: dict) -> dict:
+        result = {"_id": document["_id"]} if spec.get("_id", 1) else {}
+        for path, expression in spec.items():
+            if path == "_id":
+                continue
+            if expression in (1, True):
+                value = _get(document, path)
+                if value is not _MISSING:
+                    _set(result, path, value)
+            else:
+                _set(result, path, _evaluate(expression, document))
+        return result
+
+    # Запись
+
+    def _insert(self, document: dict) -> Any:
+        document.setdefault("_id", ObjectId())
+        stored = {"_id": document["_id"], **copy.deepcopy(document)}
+        self._check_unique(stored)
+        self._documents[stored["_id"]] = stored
+        self._sequence[stored["_id"]] = next(self._counter)
+        self._index_add(stored)
+        return stored["_id"]
+
+    async def insert_one(self, document: dict, session=None, **kwargs) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), True)
+
+    def _update(self, filter: dict, update: dict, upsert: bool) -> dict:
+        """Обновляет первый подходящий документ и возвращает raw-результат в формате сервера."""
+        targets = self._select(filter, [("_id", 1)])[:1]
+        if not targets:
+            if not upsert:
+                return {"n": 0, "nModified": 0}
+            document = _upsert_seed(filter)
+            _apply_update(document, update, is_insert=True)
+            return {"n": 1, "nModified": 0, "upserted": self._insert(document)}
+        target = targets[0]
+        updated = copy.deepcopy(target)
+        _apply_update(updated, update)
+        if updated == target:
+            return {"n": 1, "nModified": 0}
+        self._check_unique(updated, exclude_id=target["_id"])
+        self._index_remove(target)
+        self._documents[target["_id"]] = updated
+        self._index_add(updated)
+        return {"n": 1, "nModified": 1}
+
+    async def update_one(
+        self, filter: dict, update: dict, upsert: bool = False, session=None, **kwargs
+    ) -> UpdateResult:
+        return UpdateResult(self._update(filter, update, upsert), True)
+
+    async def find_one_and_update(
+        self,
+        filter: dict,
+        update: dict,
+        projection: Optional[dict] = None,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        session=None,
+        **kwargs,
+    ) -> Optional[dict]:
+        existing = self._select(filter, [("_id", 1)])
+        before = copy.deepcopy(existing[0]) if existing else None
+        raw = self._update(filter, update, upsert)
+        if return_document == ReturnDocument.BEFORE:
+            return _project(before, projection) if before is not None else None
+        document_id = before["_id"] if before is not None else raw.get("upserted")
+        if document_id is None:
+            return None
+        return _project(self._documents[document_id], projection)
+
+
+class MemoryDatabase:
+    def __init__(self, client: "MemoryClient", name: str):
+        self.client = client
+        self.name = name
+        self._collections: dict[str, MemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(self, name)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+
+class MemoryClient:
+    """Замена AsyncIOMotorClient: базы живут в памяти процесса до close()."""
+
+    def __init__(self):
+        self._databases: dict[str, MemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(self, name)
+        return self._databases[name]
+
+    async def drop_database(self, name) -> None:
+        self._databases.pop(getattr(name, "name", name), None)
+
+    def close(self) -> None:
+        self._databases.clear()
@@ -0,0 +1,247 @@
+import asyncio
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Optional
+from uuid import uuid4
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.utils.logger import logger
+from app.utils.meet_link import extract_meet_code
+from app.utils.search import search_terms
+
+MIGRATIONS_COLLECTION = "_migrations"
+STATE_ID = "schema"  # документ с применённой версией схемы
+LOCK_ID = "lock"  # документ-блокировка, чтобы миграции выполняла одна реплика
+LOCK_TTL = 300  # секунд; блокировка продлевается перед каждой пачкой
+LOCK_POLL_INTERVAL = 5  # секунд между проверками, пока миграции выполняет другая реплика
+BATCH_SIZE = 500
+
+# version -> (name, apply)
+MIGRATIONS: dict[int, tuple[str, Callable[["MigrationContext"], Awaitable[None]]]] = {}
+
+
+def migration(version: int, name: str):
+    """Регистрирует миграцию схемы. Версии применяются по возрастанию, ровно один раз."""
+
+    def register(func):
+        if version in MIGRATIONS:
+            raise ValueError(f"Миграция версии {version} уже зарегистрирована")
+        MIGRATIONS[version] = (name, func)
+        return func
+
+    return register
+
+
+class LockLostError(RuntimeError):
+    """Блокировка истекла и была захвачена другой репликой."""
+
+
+class MigrationContext:
+    def __init__(self, database, version: int, owner: str):
+        self.database = database
+        self.version = version
+        self.owner = owner
+        self._migrations = database[MIGRATIONS_COLLECTION]
+
+    async def renew_lock(self) -> None:
+        result = await self._migrations.update_one(
+            {"_id": LOCK_ID, "owner": self.owner},
+            {"$set": {"expires_at": time.time() + LOCK_TTL}},
+        )
+        if result.matched_count == 0:
+            raise LockLostError(f"Блокировка миграций потеряна при версии {self.version}")
+
+    async def backfill(
+        self,
+        collection: str,
+        query: dict,
+        make_operation: Callable[[dict], Optional[UpdateOne]],
+        projection: Optional[dict] = None,
+        skip_duplicates: bool = False,
+    ) -> int:
+        """
+        Проходит по документам коллекции пачками по _id и записывает изменения через bulk_write.
+        После каждой пачки сохраняет последний _id, поэтому прерванный backfill продолжается
+        с того же места при следующем запуске.
+
+        Args:
+            collection (str): Имя коллекции.
+            query (dict): Фильтр документов, которым нужен backfill.
+            make_operation: Строит операцию для документа или возвращает None, чтобы пропустить.
+            projection (Optional[dict]): Поля, нужные make_operation.
+            skip_duplicates (bool): Пропускать документы, которые нарушили бы уникальный
+                индекс, вместо остановки миграции.
+
+        Returns:
+            int: Количество изменённых документов.
+        """
+        progress_id = f"progress:{self.version}:{collection}"
+        progress = await self._migrations.find_one({"_id": progress_id}) or {}
+        last_id = progress.get("last_id")
+        modified = progress.get("modified", 0)
+        while True:
+            await self.renew_lock()
+            batch_query = dict(query)
+            if last_id is not None:
+                batch_query["_id"] = {"$gt": last_id}
+            cursor = (
+                self.database[collection]
+                .find(batch_query, projection)
+                .sort("_id", 1)
+                .limit(BATCH_SIZE)
+            )
+            docs = [doc async for doc in cursor]
+            if not docs:
+                break
+            operations = [op for op in map(make_operation, docs) if op is not None]
+            if operations:
+                modified += await self._bulk_write(collection, operations, skip_duplicates)
+            last_id = docs[-1]["_id"]
+            await self._migrations.update_one(
+                {"_id": progress_id},
+                {"$set": {"last_id": last_id, "modified": modified}},
+                upsert=True,
+            )
+            logger.info(f"Миграция {self.version}: {collection}, обновлено {modified}")
+        return modified
+
+    async def _bulk_write(self, collection: str, operations: list, skip_duplicates: bool) -> int:
+        try:
+            result = await self.database[collection].bulk_write(operations, ordered=False)
+            return result.modified_count
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if not skip_duplicates or any(error["code"] != 11000 for error in errors):
+                raise
+            for error in errors:
+                logger.warning(
+                    f"Миграция {self.version}: {collection} {error.get('op')} пропущен, "
+                    f"дубликат ключа: {error.get('keyValue')}"
+                )
+            return e.details.get("nModified", 0)
+
+
+async def get_schema_version(database) -> int:
+    state = await database[MIGRATIONS_COLLECTION].find_one({"_id": STATE_ID})
+    return state["version"] if state else 0
+
+
+async def _acquire_lock(database, owner: str) -> bool:
+    now = time.time()
+    try:
+        await database[MIGRATIONS_COLLECTION].update_one(
+            {"_id": LOCK_ID, "expires_at": {"$lt": now}},
+            {"$set": {"owner": owner, "expires_at": now + LOCK_TTL}},
+            upsert=True,
+        )
+        return True
+    except DuplicateKeyError:  # блокировка есть и ещё не истекла
+        return False
+
+
+async def run_migrations(database) -> int:
+    """
+    Применяет незарегистрированные в _migrations версии схемы. Реплики, запущенные
+    одновременно, ждут, пока миграции выполнит та, что захватила блокировку.
+
+    Returns:
+        int: Версия схемы после запуска.
+    """
+    latest = max(MIGRATIONS, default=0)
+    owner = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+    while not await _acquire_lock(database, owner):
+        if await get_schema_version(database) >= latest:
+            return latest
+        logger.info("Миграции выполняет другая реплика, ожидание")
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+    migrations = database[MIGRATIONS_COLLECTION]
+    try:
+        version = await get_schema_version(database)
+        for next_version in sorted(v for v in MIGRATIONS if v > version):
+            name, apply = MIGRATIONS[next_version]
+            logger.info(f"Применяется миграция {next_version}: {name}")
+            await apply(MigrationContext(database, next_version, owner))
+            applied = {"name": name, "at": time.time(), "by": owner}
+            await migrations.update_one(
+                {"_id": STATE_ID},
+                {"$set": {"version": next_version, f"applied.{next_version}": applied}},
+                upsert=True,
+            )
+            await migrations.delete_many({"_id": {"$regex": f"^progress:{next_version}:"}})
+            version = next_version
+        logger.info(f"Версия схемы БД: {version}")
+        return version
+    finally:
+        await migrations.delete_one({"_id": LOCK_ID, "owner": owner})
+
+
+@migration(1, "conferences.recordings_count")
+async def conference_recordings_count(context: MigrationContext) -> None:
+    """Денормализует количество записей конференции для списков конференций."""
+    await context.backfill(
+        "conferences",
+        {"recordings_count": {"$exists": False}},
+        lambda doc: UpdateOne(
+            {"_id": doc["_id"], "recordings_count": {"$exists": False}},
+            # считается на сервере, чтобы не потерять записи, добавленные во время backfill
+            [{"$set": {"recordings_count": {"$size": {"$ifNull": ["$recordings", []]}}}}],
+        ),
+        projection={"_id": 1},
+    )
+
+
+@migration(2, "conferences.meet_code")
+async def conference_meet_code(context: MigrationContext) -> None:
+    """Заполняет канонический код встречи, по которому ищутся конференции."""
+
+    def set_meet_code(doc: dict) -> Optional[UpdateOne]:
+        meet_code = extract_meet_code(doc["link"])
+        if meet_code is None:
+            return None
+        return UpdateOne({"_id": doc["_id"]}, {"$set": {"meet_code": meet_code}})
+
+    await context.backfill(
+        "conferences",
+        {"meet_code": {"$exists": False}},
+        set_meet_code,
+        projection={"link": 1},
+        skip_duplicates=True,
+    )
+
+
+@migration(3, "search_terms")
+async def search_terms_backfill(context: MigrationContext) -> None:
+    """Заполняет ключи поиска по фрагменту для тегов и конференций."""
+    await context.backfill(
+        "tags",
+        {"search_terms": {"$exists": False}},
+        lambda doc: UpdateOne(
+            {"_id": doc["_id"]}, {"$set": {"search_terms": search_terms(doc["name"])}}
+        ),
+        projection={"name": 1},
+    )
+    await context.backfill(
+        "conferences",
+        {"search_terms": {"$exists": False}},
+        lambda doc: UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"search_terms": search_terms(doc.get("meet_code") or doc["link"])}},
+        ),
+        projection={"link": 1, "meet_code": 1},
+    )
+
+
+@migration(4, "gmeet_schedule -> scheduled_tasks")
+async def queued_tasks_to_scheduler(context: MigrationContext) -> None:
+    """Переносит задачи, которые ждут в очереди gmeet_schedule с TTL сообщения (опубликованы
+    до появления планировщика), в scheduled_tasks. Одна такая задача в голове очереди
+    задерживала бы все наступившие задачи за ней. Выполняется один раз, до запуска
+    планировщиков, поэтому в очереди ещё нет сообщений, которые публикует планировщик."""
+    from app.rabbitmq.func import migrate_queued_tasks  # RabbitMQ нужен только этой миграции
+
+    migrated = await migrate_queued_tasks(context.renew_lock)
+    logger.info(f"Миграция {context.version}: из gmeet_schedule перенесено задач: {migrated}")
@@ -8,11 +8,30 @@ class Conference(BaseModel):
     id: ObjectId = Field(default_factory=ObjectId, alias="_id")
     tag_id: ObjectId = Field(...)
     link: str = Field(..., min_length=1)
+    # Канонический код встречи из link (abc-defg-hij), по нему ищутся конференции
+    meet_code: Optional[str] = Field(default=None)
+    search_terms: List[str] = Field(default_factory=list)  # ключи поиска по meet_code
     next_meeting_timestamp: int | None = Field(default_factory=lambda: int(time.time()))  # Unix timestamp in seconds
-    recordings: List[ObjectId] = Field(default_factory=list)
+    # None, если массив не читался: по умолчанию он исключается из проекции (HEAVY_FIELDS)
+    recordings: Optional[List[ObjectId]] = Field(default=None)
+    recordings_count: int = Field(default=0)  # len(recordings), заполняется миграцией 1
     timezone: int = Field(...)  # Timezone offset from UTC
     periodicity: Optional[int] = Field(default=None)  # Periodicity in weeks (1, 2, or None)
 
     class Config:
         arbitrary_types_allowed = True
         json_encoders = {ObjectId: str}
+
+
+class ConferenceListItem:
+    """Проекция конференции для списков: вместо массива записей хранится их количество.
+    Собирается из результата агрегации без валидации Pydantic."""
+
+    __slots__ = ("id", "link", "next_meeting_timestamp", "timezone", "recordings_count")
+
+    def __init__(self, document: dict):
+        self.id: ObjectId = document["_id"]
+        self.link: str = document["link"]
+        self.next_meeting_timestamp: int | None = document.get("next_meeting_timestamp")
+        self.timezone: int = document["timezone"]
+        self.recordings_count: int = document.get("recordings_count", 0)
@@ -12,3 +12,15 @@ class Recording(BaseModel):
     class Config:
         arbitrary_types_allowed = True
         json_encoders = {ObjectId: str}
+
+
+class RecordingListItem:
+    """Запись для карточки конференции, собирается из документа БД без валидации."""
+
+    __slots__ = ("id", "conference_id", "link", "timestamp")
+
+    def __init__(self, document: dict):
+        self.id: ObjectId = document["_id"]
+        self.conference_id: ObjectId = document["conference_id"]
+        self.link: str = document["link"]
+        self.timestamp: int = document["timestamp"]
@@ -0,0 +1,20 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from bson import ObjectId
+
+
+class ScheduledTask(BaseModel):
+    """Отложенный запуск записи: в due_at ссылка публикуется рекордеру."""
+
+    id: ObjectId = Field(default_factory=ObjectId, alias="_id")
+    link: str = Field(..., min_length=1)
+    # Конференция, которую записывает задача; по ней задачи отменяются при удалении
+    conference_id: Optional[ObjectId] = Field(default=None)
+    due_at: float = Field(...)  # Unix timestamp in seconds
+    # Реплика бота, взявшая задачу на публикацию, держит её до этого момента
+    claimed_until: Optional[float] = Field(default=None)
+
+    class Config:
+        arbitrary_types_allowed = True
+        json_encoders = {ObjectId: str}
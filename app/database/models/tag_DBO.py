@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel, Field
 from bson import ObjectId
 
@@ -6,8 +8,21 @@ class Tag(BaseModel):
     id: ObjectId = Field(default_factory=ObjectId, alias="_id")
     name: str = Field(..., min_length=1, max_length=32)
     is_archived: bool = Field(default=False)
+    search_terms: List[str] = Field(default_factory=list)  # app.utils.search.search_terms(name)
     # 32 chars is recommended for inline. More chars may go out of screen due to small phone screen
 
     class Config:
         arbitrary_types_allowed = True  # Enabling ObjectId
         json_encoders = {ObjectId: str}  # Converting ObjectId into string for JSON
+
+
+class TagListItem:
+    """Тег для списков. Собирается из документа БД без валидации Pydantic:
+    в БД теги попадают только через Tag."""
+
+    __slots__ = ("id", "name", "is_archived")
+
+    def __init__(self, document: dict):
+        self.id: ObjectId = document["_id"]
+        self.name: str = document["name"]
+        self.is_archived: bool = document.get("is_archived", False)
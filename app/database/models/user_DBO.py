@@ -11,4 +11,17 @@ class User(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
\ No newline at end of file
+        json_encoders = {ObjectId: str}
+
+
+class UserListItem:
+    """Пользователь для списков и рассылок, собирается из документа БД без валидации.
+    Поля, не попавшие в проекцию запроса, равны None."""
+
+    __slots__ = ("id", "telegram_tag", "telegram_id", "role")
+
+    def __init__(self, document: dict):
+        self.id: ObjectId = document["_id"]
+        self.telegram_tag: str | None = document.get("telegram_tag")
+        self.telegram_id: int | None = document.get("telegram_id")
+        self.role: Role | None = Role(document["role"]) if "role" in document else None
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+from pymongo import monitoring
+
+from app.config.config import MONGODB_SLOW_COMMAND_MS
+from app.utils.logger import logger
+
+
+class MongoStats(monitoring.ConnectionPoolListener, monitoring.CommandListener):
+    """Собирает статистику пула соединений и латентность команд MongoDB.
+
+    PyMongo вызывает слушателей из своих потоков, поэтому счётчики защищены блокировкой.
+    """
+
+    def __init__(self, slow_command_ms: float = MONGODB_SLOW_COMMAND_MS):
+        self.slow_command_ms = slow_command_ms
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные счётчики; число занятых соединений остаётся текущим."""
+        with self._lock:
+            self.max_checked_out = self.checked_out
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            # command -> [count, total_ms, max_ms, failures]
+            self.commands: dict[str, list] = {}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checked_out": self.checked_out,
+                "max_checked_out": self.max_checked_out,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "wait_avg_ms": self.wait_total_ms / self.checkouts if self.checkouts else 0.0,
+                "wait_max_ms": self.wait_max_ms,
+                "commands": {
+                    name: {
+                        "count": count,
+                        "avg_ms": total / count if count else 0.0,
+                        "max_ms": max_ms,
+                        "failures": failures,
+                    }
+                    for name, (count, total, max_ms, failures) in self.commands.items()
+                },
+            }
+
+    # ConnectionPoolListener
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        wait_ms = (event.duration or 0.0) * 1000
+        with self._lock:
+            self.checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self.checkout_failures += 1
+        logger.warning(f"Не удалось получить соединение MongoDB из пула: {event.reason}")
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        logger.warning(f"Пул соединений MongoDB {event.address} очищен")
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        pass
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        pass
+
+    def connection_check_out_started(self, event) -> None:
+        pass
+
+    # CommandListener
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event.command_name, event.duration_micros / 1000, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event.command_name, event.duration_micros / 1000, failed=True)
+
+    def _record(self, command: str, duration_ms: float, failed: bool) -> None:
+        with self._lock:
+            stats = self.commands.setdefault(command, [0, 0.0, 0.0, 0])
+            stats[0] += 1
+            stats[1] += duration_ms
+            stats[2] = max(stats[2], duration_ms)
+            stats[3] += failed
+        if duration_ms >= self.slow_command_ms:
+            logger.warning(f"Медленная команда MongoDB '{command}': {duration_ms:.1f} мс")
+
+
+mongo_stats = MongoStats()
+
+
+async def log_mongo_stats(interval: float) -> None:
+    """Периодически пишет в лог статистику пула и команд за прошедший интервал."""
+    while True:
+        await asyncio.sleep(interval)
+        stats = mongo_stats.snapshot()
+        mongo_stats.reset()
+        commands = ", ".join(
+            f"{name}: {s['count']} шт., avg {s['avg_ms']:.1f} мс, max {s['max_ms']:.1f} мс"
+            for name, s in sorted(stats["commands"].items())
+        )
+        logger.info(
+            f"MongoDB пул: занято {stats['checked_out']} (макс. {stats['max_checked_out']}), "
+            f"выдач {stats['checkouts']}, ошибок {stats['checkout_failures']}, "
+            f"ожидание avg {stats['wait_avg_ms']:.1f} мс / max {stats['wait_max_ms']:.1f} мс; "
+            f"команды: {commands or 'нет'}"
+        )
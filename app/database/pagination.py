@@ -0,0 +1,45 @@
+from typing import Any, List, Optional
+
+from bson import ObjectId
+
+# Количество элементов на одной странице инлайн-списков
+PAGE_SIZE = 10
+
+
+def keyset_filter(
+    query: dict, after: Optional[str] = None, before: Optional[str] = None
+) -> tuple[dict, int]:
+    """Дополняет запрос границей по _id для keyset-пагинации.
+
+    Args:
+        query (dict): Исходный фильтр.
+        after (Optional[str]): _id последнего элемента предыдущей страницы (листаем вперёд).
+        before (Optional[str]): _id первого элемента следующей страницы (листаем назад).
+
+    Returns:
+        tuple[dict, int]: Фильтр с границей и направление сортировки по _id.
+    """
+    if before is not None:
+        return {**query, "_id": {"$lt": ObjectId(before)}}, -1
+    if after is not None:
+        return {**query, "_id": {"$gt": ObjectId(after)}}, 1
+    return query, 1
+
+
+def split_page(
+    items: List[Any], limit: int, after: Optional[str] = None, before: Optional[str] = None
+) -> tuple[List[Any], bool, bool]:
+    """Превращает выборку из limit+1 элементов в страницу.
+
+    Лишний элемент показывает, что в направлении выборки есть ещё страница.
+
+    Returns:
+        tuple[List[Any], bool, bool]: Элементы страницы по возрастанию _id,
+            есть ли предыдущая страница, есть ли следующая.
+    """
+    has_more = len(items) > limit
+    items = items[:limit]
+    if before is not None:
+        items.reverse()
+        return items, has_more, True
+    return items, after is not None, has_more
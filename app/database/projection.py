@@ -0,0 +1,80 @@
+from enum import Enum
+from typing import Iterable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+# Поля, которые не читаются, пока их не запросили явно: массив записей конференции растёт
+# без ограничений, а экранам хватает recordings_count.
+HEAVY_FIELDS = {"conferences": ("recordings",)}
+
+
+def build_projection(collection: str, fields: Optional[Iterable[str]] = None) -> Optional[dict]:
+    """
+    Строит проекцию для find/find_one.
+
+    Args:
+        collection (str): Имя коллекции, чтобы исключить её тяжёлые поля.
+        fields (Optional[Iterable[str]]): Нужные поля; None — все, кроме тяжёлых.
+            _id возвращается всегда.
+
+    Returns:
+        Optional[dict]: Проекция или None, если читать нужно весь документ.
+    """
+    if fields is None:
+        return {field: 0 for field in HEAVY_FIELDS.get(collection, ())} or None
+    return {field: 1 for field in fields}
+
+
+class _PartialModel:
+    """Основа частичных моделей: __slots__ по полям модели, заполняются только поля из
+    документа, без валидации. Незапрошенное поле не получает значение по умолчанию:
+    обращение к нему выбрасывает AttributeError."""
+
+    __slots__ = ()
+    _aliases: dict[str, str] = {}  # ключ документа (_id) -> поле модели (id)
+    _enums: dict[str, Type[Enum]] = {}  # поля-перечисления, строка из БД -> Enum
+
+    def __init__(self, document: dict):
+        for key, value in document.items():
+            name = self._aliases.get(key)
+            if name is None:
+                continue
+            enum = self._enums.get(name)
+            setattr(self, name, enum(value) if enum is not None and value is not None else value)
+
+
+_partial_models: dict[type, type] = {}
+
+
+def _partial_model(model: Type[BaseModel]) -> type:
+    partial = _partial_models.get(model)
+    if partial is None:
+        fields = model.model_fields
+        partial = type(
+            f"Partial{model.__name__}",
+            (_PartialModel,),
+            {
+                "__slots__": tuple(fields),
+                "_aliases": {field.alias or name: name for name, field in fields.items()},
+                "_enums": {
+                    name: field.annotation
+                    for name, field in fields.items()
+                    if isinstance(field.annotation, type) and issubclass(field.annotation, Enum)
+                },
+            },
+        )
+        _partial_models[model] = partial
+    return partial
+
+
+def to_model(model: Type[M], document: dict, fields: Optional[Iterable[str]] = None) -> M:
+    """
+    Документ без явной проекции валидируется моделью. Частичный документ собирается в
+    __slots__-модель с полями model (как списочные модели, без валидации): у неё есть
+    только запрошенные поля, обращение к остальным выбросит AttributeError.
+    """
+    if fields is None:
+        return model(**document)
+    return _partial_model(model)(document)
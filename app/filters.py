@@ -1,9 +1,12 @@
+from typing import Any
+
 from aiogram.filters import Filter
 from aiogram.types import Message, CallbackQuery
 
 from app.config.roles import Role
 from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
 from app.utils.logger import logger
+from app.utils.role_cache import cache_user, get_cached_role, role_cache
 
 
 class RoleFilter(Filter):
@@ -16,9 +19,12 @@ class RoleFilter(Filter):
     def __init__(self, role: Role):
         self.role = role
 
-    async def __call__(self, obj: Message | CallbackQuery) -> bool:
+    async def __call__(self, obj: Message | CallbackQuery, **data: Any) -> bool:
         """Фильтрация по роли пользователя.
 
+        Если UserMiddleware уже загрузил пользователя (data['db_user']), повторный запрос
+        в БД не выполняется.
+
         Args:
             obj (Message | CallbackQuery): Объект сообщения или коллбэка.
 
@@ -33,7 +39,13 @@ class RoleFilter(Filter):
             return False
 
         telegram_tag = f"@{user.username}" if user.username else f"@{user.id}"
-        db_user = await get_user_by_telegram_tag(telegram_tag)
+        if "db_user" in data:
+            db_user = data["db_user"]
+        else:
+            cached_role = get_cached_role(user.id, telegram_tag)
+            if cached_role is not None:
+                return cached_role >= self.role
+            db_user = await get_user_by_telegram_tag(telegram_tag)
         if not db_user:
             logger.warning(f"Пользователь с тегом '{telegram_tag}' не найден в БД")
             return False
@@ -45,4 +57,9 @@ class RoleFilter(Filter):
             logger.error(f"Некорректная роль '{db_user.role}' для пользователя '{telegram_tag}'")
             return False
 
+        if "db_user" not in data:
+            cache_user(user.id, telegram_tag, db_user)
+            logger.debug(
+                f"Роль '{user_role}' для '{telegram_tag}' загружена из БД, кэш ролей: {role_cache.stats()}"
+            )
         return user_role >= self.role
@@ -37,39 +37,87 @@ choose_recordings_search_method_keyboard = InlineKeyboardMarkup(
             InlineKeyboardButton(text=labels.BY_TAG, callback_data=Callbacks.get_recording_by_tag_callback),
             InlineKeyboardButton(text=labels.BY_LINK, callback_data=Callbacks.get_recording_by_link_callback),
         ],
+        [
+            InlineKeyboardButton(text=labels.BY_SEARCH, callback_data=Callbacks.get_recording_by_search_callback),
+        ],
     ]
 )
 
 
+PAGE_NEXT = "n"
+PAGE_PREV = "p"
+
+
+def page_navigation_row(
+        on_page_clicked_callback: str,
+        items: list,
+        has_prev: bool,
+        has_next: bool,
+) -> list[InlineKeyboardButton]:
+    """Кнопки перехода между страницами, курсором служит _id крайнего элемента страницы."""
+    row = []
+    if not items:
+        return row
+    if has_prev:
+        row.append(InlineKeyboardButton(
+            text=labels.PREV_PAGE, callback_data=f"{on_page_clicked_callback}:{PAGE_PREV}:{items[0].id}"
+        ))
+    if has_next:
+        row.append(InlineKeyboardButton(
+            text=labels.NEXT_PAGE, callback_data=f"{on_page_clicked_callback}:{PAGE_NEXT}:{items[-1].id}"
+        ))
+    return row
+
+
+def parse_page_callback(callback_data: str) -> tuple[str | None, str | None]:
+    """Разбирает колбэк перехода по страницам вида '<prefix>:<n|p>:<cursor>'.
+
+    Returns:
+        tuple[str | None, str | None]: Курсоры after и before для запроса страницы.
+    """
+    direction, cursor = callback_data.rsplit(":", 2)[-2:]
+    if direction == PAGE_PREV:
+        return None, cursor
+    return cursor, None
+
+
 async def inline_active_tag_list(
         on_item_clicked_callback: str,
         on_cancel_clicked_callback: str,
         on_archived_clicked_callback: str = None,
         on_item_create_clicked_callback: str = None,
+        on_page_clicked_callback: str = None,
+        after: str = None,
+        before: str = None,
 ) -> InlineKeyboardMarkup:
-    tags = await db.get_active_tags()
+    tags, has_prev, has_next = await db.get_active_tags_page(after=after, before=before)
 
     tags_list_keyboard = InlineKeyboardBuilder()
     for tag in tags:
         callback_data = f"{on_item_clicked_callback}:{str(tag.id)}"
         tags_list_keyboard.add(InlineKeyboardButton(text=tag.name, callback_data=callback_data))
+    tags_list_keyboard.adjust(1)
+    if on_page_clicked_callback is not None:
+        navigation = page_navigation_row(on_page_clicked_callback, tags, has_prev, has_next)
+        if navigation:
+            tags_list_keyboard.row(*navigation)
     if on_item_create_clicked_callback is not None:
-        tags_list_keyboard.add(
+        tags_list_keyboard.row(
             InlineKeyboardButton(
                 text=labels.CREATE_TAG, callback_data=on_item_create_clicked_callback
             )
         )
     if on_archived_clicked_callback is not None:
-        tags_list_keyboard.add(
+        tags_list_keyboard.row(
             InlineKeyboardButton(
                 text=labels.ARCHIVED_TAGS,
                 callback_data=on_archived_clicked_callback,
             )
         )
-    tags_list_keyboard.add(
+    tags_list_keyboard.row(
         InlineKeyboardButton(text=labels.CANCEL, callback_data=on_cancel_clicked_callback)
     )
-    return tags_list_keyboard.adjust(1).as_markup()
+    return tags_list_keyboard.as_markup()
 
 
 tag_deletion_confirmation_keyboard = InlineKeyboardMarkup(
@@ -114,17 +162,25 @@ async def inline_archived_tag_actions(
 async def inline_archived_tag_list(
         on_item_clicked_callback: str,
         on_back_clicked_callback: str,
+        on_page_clicked_callback: str = None,
+        after: str = None,
+        before: str = None,
 ) -> InlineKeyboardMarkup:
-    tags = await db.get_archived_tags()
+    tags, has_prev, has_next = await db.get_archived_tags_page(after=after, before=before)
 
     tags_list_keyboard = InlineKeyboardBuilder()
     for tag in tags:
         callback_data = f"{on_item_clicked_callback}:{str(tag.id)}"
         tags_list_keyboard.add(InlineKeyboardButton(text=tag.name, callback_data=callback_data))
-    tags_list_keyboard.add(
+    tags_list_keyboard.adjust(1)
+    if on_page_clicked_callback is not None:
+        navigation = page_navigation_row(on_page_clicked_callback, tags, has_prev, has_next)
+        if navigation:
+            tags_list_keyboard.row(*navigation)
+    tags_list_keyboard.row(
         InlineKeyboardButton(text=labels.BACK, callback_data=on_back_clicked_callback)
     )
-    return tags_list_keyboard.adjust(1).as_markup()
+    return tags_list_keyboard.as_markup()
 
 
 async def inline_single_cancel_button(
@@ -143,21 +199,29 @@ async def inline_single_cancel_button(
     return cancel_tag_enter_keyboard
 
 
-async def inline_admin_list(on_cancel_clicked_callback: str) -> InlineKeyboardMarkup:
-    admins = await db.get_all_admins()
+async def inline_admin_list(
+        on_cancel_clicked_callback: str,
+        after: str = None,
+        before: str = None,
+) -> InlineKeyboardMarkup:
+    admins, has_prev, has_next = await db.get_admins_page(after=after, before=before)
     admin_list_keyboard = InlineKeyboardBuilder()
     for admin in admins:
         print(f"Admin data: {admin}")
         admin_list_keyboard.add(
             InlineKeyboardButton(text=admin.telegram_tag, callback_data=f"{Callbacks.on_admin_clicked}:{admin.id}")
         )
-    admin_list_keyboard.add(
+    admin_list_keyboard.adjust(1)
+    navigation = page_navigation_row(Callbacks.admins_page, admins, has_prev, has_next)
+    if navigation:
+        admin_list_keyboard.row(*navigation)
+    admin_list_keyboard.row(
         InlineKeyboardButton(text=labels.ADD_ADMIN, callback_data=Callbacks.add_admin_callback)
     )
-    admin_list_keyboard.add(
+    admin_list_keyboard.row(
         InlineKeyboardButton(text=labels.CANCEL, callback_data=on_cancel_clicked_callback)
     )
-    return admin_list_keyboard.adjust(1).as_markup()
+    return admin_list_keyboard.as_markup()
 
 
 def manage_tag_inline_keyboard(tag_id: str) -> InlineKeyboardMarkup:
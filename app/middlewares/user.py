@@ -0,0 +1,31 @@
+from typing import Any, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.utils.role_cache import cache_user, get_cached_user
+
+
+class UserMiddleware(BaseMiddleware):
+    """Загружает пользователя из БД один раз на апдейт и кладёт его в data['db_user'].
+
+    Регистрируется как outer-middleware, поэтому объект доступен и фильтрам, и хендлерам.
+    Если пользователь ещё не зарегистрирован (например, до /start), в data кладётся None.
+    Найденный пользователь берётся из кэша ролей (app.utils.role_cache) по telegram id,
+    поэтому БД читается только при промахе, а не на каждый апдейт.
+    """
+
+    async def __call__(self, handler: Callable, event: TelegramObject, data: Dict[str, Any]):
+        from_user = data.get("event_from_user")
+        if from_user is not None:
+            telegram_tag = f"@{from_user.username}" if from_user.username else f"@{from_user.id}"
+            db_user = get_cached_user(from_user.id, telegram_tag)
+            if db_user is None:
+                db_user = await get_user_by_telegram_tag(telegram_tag)
+                if db_user is not None:
+                    cache_user(from_user.id, telegram_tag, db_user)
+            data["db_user"] = db_user
+        else:
+            data["db_user"] = None
+        return await handler(event, data)
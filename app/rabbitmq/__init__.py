@@ -7,8 +7,8 @@ __all__ = ["responses", "func"]
 Всё обрабатывай в mq.func.handle_responses, там я написал # TODO для твоего кода
 
 await mq.func.schedule_task("https://meet.google.com/qwe-qwe-qwe", 0)           schedule task in n secs
-await mq.func.manage_active_task(mq.responses.Req.TIME, user_id: int)           request for current recording time
-await mq.func.manage_active_task(mq.responses.Req.SCREENSHOT, user_id: int)     request for screenshot
+await mq.func.schedule_task(link, in_secs, conference.id)                       cancelled when the conference is deleted
+await mq.func.manage_active_task(mq.responses.Req.TIME, user_id: int, link)     request for current recording time
+await mq.func.manage_active_task(mq.responses.Req.SCREENSHOT, user_id: int, link)   request for screenshot
 await mq.func.manage_active_task(mq.responses.Req.STOP_RECORD, user_id: int)    request for stop recording
-await mq.func.decline_task("https://meet.google.com/qwe-qwe-qwe")               delete task from schedule
 """
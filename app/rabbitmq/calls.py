@@ -0,0 +1,113 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable
+from uuid import uuid4
+
+from app.rabbitmq.codec import Response
+from app.utils.logger import logger
+
+
+class PendingCall:
+    """Запрос к рекордеру, ожидающий ответа, и пользователи, которым нужен результат."""
+
+    __slots__ = ("correlation_id", "user_ids", "future")
+
+    def __init__(self, user_id: int):
+        self.correlation_id = uuid4().hex
+        self.user_ids: dict[int, None] = {user_id: None}  # упорядоченное множество
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class RecorderCalls:
+    """Запросы SCREENSHOT и TIME с ожиданием ответа по correlation_id.
+
+    Одинаковые запросы (тот же key — команда и конференция), пока первый ждёт ответа,
+    не отправляются рекордеру повторно: пользователь добавляется к ожидающим, и один
+    результат рассылается всем. Если рекордер не ответил за timeout секунд, все ожидающие
+    сразу получают сообщение о таймауте.
+    """
+
+    def __init__(self, timeout: float):
+        self._timeout = timeout
+        self._by_key: dict[Hashable, PendingCall] = {}
+        self._by_id: dict[str, PendingCall] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def _forget(self, key: Hashable, call: PendingCall) -> None:
+        if self._by_key.get(key) is call:
+            del self._by_key[key]
+        self._by_id.pop(call.correlation_id, None)
+
+    async def request(
+        self,
+        key: Hashable,
+        user_id: int,
+        send: Callable[[str], Awaitable],
+        deliver: Callable[[list[int], Response], Awaitable],
+        expire: Callable[[list[int]], Awaitable],
+    ) -> bool:
+        """
+        Отправляет запрос через send(correlation_id) или присоединяет пользователя к уже
+        отправленному. Ответ передаётся в deliver(user_ids, response), таймаут — в
+        expire(user_ids); оба вызываются в фоне, обработчик не ждёт рекордер.
+
+        Returns:
+            bool: True, если рекордеру ушёл новый запрос, False, если запрос объединён
+                с уже ожидающим.
+        """
+        call = self._by_key.get(key)
+        if call is not None:
+            call.user_ids[user_id] = None
+            return False
+        call = PendingCall(user_id)
+        self._by_key[key] = call
+        self._by_id[call.correlation_id] = call
+        try:
+            await send(call.correlation_id)
+        except Exception:
+            self._forget(key, call)
+            raise
+        task = asyncio.create_task(self._wait(key, call, deliver, expire))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _wait(
+        self,
+        key: Hashable,
+        call: PendingCall,
+        deliver: Callable[[list[int], Response], Awaitable],
+        expire: Callable[[list[int]], Awaitable],
+    ) -> None:
+        try:
+            response = await asyncio.wait_for(call.future, self._timeout)
+        except asyncio.TimeoutError:
+            response = None
+        # новые запросы после ответа или таймаута снова идут рекордеру
+        self._forget(key, call)
+        user_ids = list(call.user_ids)
+        try:
+            if response is None:
+                logger.warning(f"Рекордер не ответил на запрос {key} за {self._timeout} с")
+                await expire(user_ids)
+            else:
+                await deliver(user_ids, response)
+        except Exception as e:
+            logger.error(f"Ошибка рассылки ответа рекордера на запрос {key}: {e}")
+
+    def resolve(self, key: Hashable, response: Response) -> bool:
+        """
+        Передаёт ответ ожидающему запросу: по correlation_id или, если рекордер его не
+        вернул (старая версия), по key.
+
+        Returns:
+            bool: False, если ожидающего запроса нет: он истёк или его отправила другая
+                реплика бота. Тогда ответ доставляется только user_id из самого ответа.
+        """
+        if response.correlation_id is not None:
+            call = self._by_id.get(response.correlation_id)
+        else:
+            call = self._by_key.get(key)
+        if call is None or call.future.done():
+            return False
+        call.future.set_result(response)
+        return True
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from aiormq.abc import AbstractChannel, AbstractConnection
+from pamqp.commands import Basic
+
+from app.utils.logger import logger
+
+
+class PublishStats:
+    """Латентность публикаций до подтверждения брокером и число неподтверждённых."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные счётчики; число публикаций в полёте остаётся текущим."""
+        self.max_in_flight = self.in_flight
+        self.published = 0
+        self.failures = 0
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "published": self.published,
+            "failures": self.failures,
+            "latency_avg_ms": (self.latency_total_ms / self.published if self.published else 0.0),
+            "latency_max_ms": self.latency_max_ms,
+        }
+
+    def started(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finished(self, latency_ms: float, failed: bool) -> None:
+        self.in_flight -= 1
+        if failed:
+            self.failures += 1
+            return
+        self.published += 1
+        self.latency_total_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+
+
+publish_stats = PublishStats()
+
+
+class ChannelPool:
+    """Долгоживущие каналы AMQP вместо connection.channel() на каждый запрос.
+
+    Публикации идут через один выделенный канал с publisher confirms: конкурентные
+    basic_publish не ждут друг друга, подтверждения брокер присылает пачками
+    (Basic.Ack с multiple). Остальные операции (basic_get при переносе старых задач из
+    gmeet_schedule) берут канал из пула через acquire() и возвращают его обратно. Закрытый канал (например, после
+    переподключения) при следующем обращении открывается заново.
+    """
+
+    def __init__(
+        self,
+        get_connection: Callable[[], Awaitable[AbstractConnection]],
+        size: int,
+        publish_timeout: float,
+    ):
+        self._get_connection = get_connection
+        self._publish_timeout = publish_timeout
+        self._publisher: Optional[AbstractChannel] = None
+        self._publisher_lock = asyncio.Lock()
+        self._idle: asyncio.LifoQueue = asyncio.LifoQueue()
+        self._semaphore = asyncio.Semaphore(size)
+
+    async def _open(self, publisher_confirms: bool) -> AbstractChannel:
+        connection = await self._get_connection()
+        return await connection.channel(publisher_confirms=publisher_confirms)
+
+    async def publisher(self) -> AbstractChannel:
+        async with self._publisher_lock:
+            if self._publisher is None or self._publisher.is_closed:
+                self._publisher = await self._open(publisher_confirms=True)
+            return self._publisher
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AbstractChannel]:
+        """Выдаёт канал без publisher confirms в монопольное пользование.
+
+        К выходу из блока на канале не должно остаться неподтверждённых сообщений:
+        канал вернётся в пул и будет отдан другому вызову.
+        """
+        async with self._semaphore:
+            channel = None
+            while not self._idle.empty():
+                candidate = self._idle.get_nowait()
+                if not candidate.is_closed:
+                    channel = candidate
+                    break
+            if channel is None:
+                channel = await self._open(publisher_confirms=False)
+            try:
+                yield channel
+            finally:
+                if not channel.is_closed:
+                    self._idle.put_nowait(channel)
+
+    async def publish(
+        self,
+        body: bytes,
+        exchange: str,
+        routing_key: str,
+        properties: Optional[Basic.Properties] = None,
+    ) -> None:
+        """Публикует сообщение и ждёт подтверждения брокера.
+
+        Raises:
+            aiormq.exceptions.DeliveryError: Брокер ответил Basic.Nack.
+            asyncio.TimeoutError: Подтверждение не пришло за publish_timeout.
+        """
+        channel = await self.publisher()
+        publish_stats.started()
+        started = time.perf_counter()
+        failed = True
+        try:
+            await channel.basic_publish(
+                body,
+                exchange=exchange,
+                routing_key=routing_key,
+                properties=properties,
+                timeout=self._publish_timeout,
+            )
+            failed = False
+        finally:
+            publish_stats.finished((time.perf_counter() - started) * 1000, failed)
+
+    async def publish_many(
+        self, messages: Iterable[tuple[bytes, str, str, Optional[Basic.Properties]]]
+    ) -> None:
+        """Публикует пачку сообщений (body, exchange, routing_key, properties) разом и
+        ждёт подтверждения всех: брокер подтверждает их одним или несколькими Ack."""
+        await asyncio.gather(*(self.publish(*message) for message in messages))
+
+    async def close(self) -> None:
+        channels = [self._publisher] if self._publisher is not None else []
+        while not self._idle.empty():
+            channels.append(self._idle.get_nowait())
+        self._publisher = None
+        for channel in channels:
+            if not channel.is_closed:
+                await channel.close()
+
+
+async def log_publish_stats(interval: float) -> None:
+    """Периодически пишет в лог статистику публикаций AMQP за прошедший интервал."""
+    while True:
+        await asyncio.sleep(interval)
+        stats = publish_stats.snapshot()
+        publish_stats.reset()
+        logger.info(
+            f"AMQP публикации: подтверждено {stats['published']}, ошибок {stats['failures']}, "
+            f"до подтверждения avg {stats['latency_avg_ms']:.1f} мс / "
+            f"max {stats['latency_max_ms']:.1f} мс; в полёте {stats['in_flight']} "
+            f"(макс. {stats['max_in_flight']})"
+        )
@@ -0,0 +1,151 @@
+"""Формат сообщений между ботом и рекордером.
+
+Версия 1 — JSON-объект с полем "v":
+
+    {"v": 1, "type": "time", "body": "<ссылка>", "user_id": 42, "filepath": "",
+     "correlation_id": "<hex>"}
+
+correlation_id необязателен: бот проставляет его в запросах SCREENSHOT и TIME, рекордер
+возвращает его в ответе без изменений.
+
+Кодируется и разбирается pydantic_core (Rust), без промежуточных копий строки.
+Рекордеры старых версий присылают str(dict) — Python-литерал с одинарными кавычками,
+None и b'...'; такие сообщения без поля "v" разбирает decode_legacy через
+ast.literal_eval, пока все рекордеры не перейдут на версию 1.
+"""
+
+import ast
+from typing import Optional
+
+from pydantic_core import from_json, to_json
+
+from app.rabbitmq.responses import Req, Res
+
+VERSION = 1
+
+
+class MessageFormatError(ValueError):
+    """Сообщение не удалось разобрать или оно не соответствует схеме."""
+
+
+class Message:
+    """Сообщение очередей gmeet_manage и gmeet_res.
+
+    body — ссылка на конференцию, user_id — кому отвечать на SCREENSHOT и TIME,
+    filepath — путь к файлу записи или скриншота, для TIME — секунды с начала записи,
+    correlation_id — связывает ответ на SCREENSHOT или TIME с запросом.
+    """
+
+    __slots__ = ("type", "body", "user_id", "filepath", "correlation_id")
+
+    def __init__(
+        self,
+        type: Req | Res,
+        body: Optional[str] = "",
+        user_id: Optional[int] = -1,
+        filepath: Optional[str | int] = "",
+        correlation_id: Optional[str] = None,
+    ):
+        self.type = type
+        self.body = body
+        self.user_id = user_id
+        self.filepath = filepath
+        self.correlation_id = correlation_id
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(type={self.type.value!r}, body={self.body!r}, "
+            f"user_id={self.user_id!r}, filepath={self.filepath!r}, "
+            f"correlation_id={self.correlation_id!r})"
+        )
+
+
+class Request(Message):
+    """Команда рекордеру (gmeet_manage)."""
+
+    __slots__ = ()
+    type: Req
+
+
+class Response(Message):
+    """Ответ рекордера (gmeet_res): статус записи или ответ на команду Req."""
+
+    __slots__ = ()
+    type: Res | Req
+
+
+def encode(message: Message) -> bytes:
+    return to_json(
+        {
+            "v": VERSION,
+            "type": message.type.value,
+            "body": message.body,
+            "user_id": message.user_id,
+            "filepath": message.filepath,
+            "correlation_id": message.correlation_id,
+        }
+    )
+
+
+def decode_legacy(raw: bytes) -> dict:
+    """Разбирает str(dict) рекордеров старых версий."""
+    try:
+        fields = ast.literal_eval(raw.decode())
+    except (ValueError, SyntaxError, UnicodeDecodeError, MemoryError, RecursionError) as e:
+        raise MessageFormatError(f"not a JSON or Python literal message: {e}") from e
+    if not isinstance(fields, dict):
+        raise MessageFormatError("message is not an object")
+    # старые рекордеры передавали ссылку и путь как bytes
+    return {
+        key: value.decode(errors="replace") if isinstance(value, bytes) else value
+        for key, value in fields.items()
+    }
+
+
+def _parse(raw: bytes) -> dict:
+    try:
+        fields = from_json(raw)
+    except ValueError:
+        return decode_legacy(raw)
+    if not isinstance(fields, dict):
+        raise MessageFormatError("message is not an object")
+    version = fields.get("v")
+    if version is None:  # JSON без версии: старый формат, прошедший через json.dumps
+        return fields
+    if version != VERSION:
+        raise MessageFormatError(f"unsupported message version {version!r}")
+    return fields
+
+
+def _check(fields: dict, name: str, types: tuple, default):
+    value = fields.get(name, default)
+    if isinstance(value, bool) or (value is not None and not isinstance(value, types)):
+        raise MessageFormatError(f"field '{name}' has type {type(value).__name__}")
+    return value
+
+
+def decode_response(raw: bytes) -> Response:
+    """
+    Разбирает ответ рекордера версии 1 или старого формата.
+
+    Raises:
+        MessageFormatError: Сообщение не разбирается, версия не поддерживается, тип
+            неизвестен или поле имеет неверный тип.
+    """
+    fields = _parse(raw)
+    kind = fields.get("type")
+    if not isinstance(kind, str):
+        raise MessageFormatError(f"message type is {type(kind).__name__}")
+    if kind in Res:
+        kind = Res(kind)
+    elif kind in Req:
+        kind = Req(kind)
+    else:
+        raise MessageFormatError(f"unknown message type {kind!r}")
+    return Response(
+        kind,
+        body=_check(fields, "body", (str,), ""),
+        user_id=_check(fields, "user_id", (int,), -1),
+        filepath=_check(fields, "filepath", (str, int), ""),
+        correlation_id=_check(fields, "correlation_id", (str,), None),
+    )
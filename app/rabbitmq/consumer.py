@@ -0,0 +1,134 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Hashable
+
+from app.utils.logger import logger
+
+
+class ConsumerStats:
+    """Ожидание сообщений в очереди диспетчера и время их обработки."""
+
+    def __init__(self):
+        self.pending = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Сбрасывает накопленные счётчики; число ожидающих сообщений остаётся текущим."""
+        self.max_pending = self.pending
+        self.processed = 0
+        self.failures = 0
+        self.lag_total_ms = 0.0
+        self.lag_max_ms = 0.0
+        self.handler_total_ms = 0.0
+        self.handler_max_ms = 0.0
+
+    def snapshot(self) -> dict:
+        processed = self.processed + self.failures
+        return {
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "processed": self.processed,
+            "failures": self.failures,
+            "lag_avg_ms": self.lag_total_ms / processed if processed else 0.0,
+            "lag_max_ms": self.lag_max_ms,
+            "handler_avg_ms": self.handler_total_ms / processed if processed else 0.0,
+            "handler_max_ms": self.handler_max_ms,
+        }
+
+    def queued(self) -> None:
+        self.pending += 1
+        self.max_pending = max(self.max_pending, self.pending)
+
+    def started(self, lag_ms: float) -> None:
+        self.pending -= 1
+        self.lag_total_ms += lag_ms
+        self.lag_max_ms = max(self.lag_max_ms, lag_ms)
+
+    def finished(self, handler_ms: float, failed: bool) -> None:
+        if failed:
+            self.failures += 1
+        else:
+            self.processed += 1
+        self.handler_total_ms += handler_ms
+        self.handler_max_ms = max(self.handler_max_ms, handler_ms)
+
+
+consumer_stats = ConsumerStats()
+
+
+class KeyedDispatcher:
+    """Обработка сообщений пулом из workers задач с порядком внутри ключа.
+
+    Сообщения с одним ключом (ссылкой на конференцию) обрабатываются строго по одному в
+    порядке поступления, с разными ключами — параллельно. Медленная обработка (например,
+    скачивание скриншота) задерживает только сообщения своей конференции. После каждого
+    сообщения ключ встаёт в конец очереди готовых, поэтому конференция с длинной очередью
+    не занимает воркер целиком. Сам диспетчер очередь не ограничивает: число сообщений в
+    нём ограничивает prefetch канала, если подтверждать их после обработки.
+    """
+
+    def __init__(self, workers: int):
+        self._workers = workers
+        # ключ -> сообщения в порядке поступления; ключ есть в словаре, пока его
+        # сообщение обрабатывается или ждёт, и стоит в _ready не больше одного раза
+        self._pending: dict[Hashable, deque[tuple[float, Callable[[], Awaitable]]]] = {}
+        self._ready: asyncio.Queue = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+
+    def submit(self, key: Hashable, job: Callable[[], Awaitable]) -> None:
+        """Ставит обработку в очередь ключа. Не блокирует: порядок вызовов submit и есть
+        порядок обработки внутри ключа."""
+        consumer_stats.queued()
+        jobs = self._pending.get(key)
+        if jobs is None:
+            self._pending[key] = deque([(time.perf_counter(), job)])
+            self._ready.put_nowait(key)
+        else:
+            jobs.append((time.perf_counter(), job))
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            jobs = self._pending[key]
+            queued_at, job = jobs[0]
+            started = time.perf_counter()
+            consumer_stats.started((started - queued_at) * 1000)
+            failed = True
+            try:
+                await job()
+                failed = False
+            except Exception as e:
+                logger.error(f"Ошибка обработки сообщения по ключу '{key}': {e}")
+            finally:
+                consumer_stats.finished((time.perf_counter() - started) * 1000, failed)
+                jobs.popleft()
+                if jobs:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._pending[key]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+async def log_consumer_stats(interval: float) -> None:
+    """Периодически пишет в лог статистику обработки входящих сообщений AMQP."""
+    while True:
+        await asyncio.sleep(interval)
+        stats = consumer_stats.snapshot()
+        consumer_stats.reset()
+        logger.info(
+            f"AMQP обработка: успешно {stats['processed']}, ошибок {stats['failures']}, "
+            f"ожидание в очереди avg {stats['lag_avg_ms']:.1f} мс / "
+            f"max {stats['lag_max_ms']:.1f} мс, обработка avg {stats['handler_avg_ms']:.1f} мс / "
+            f"max {stats['handler_max_ms']:.1f} мс; ожидают {stats['pending']} "
+            f"(макс. {stats['max_pending']})"
+        )
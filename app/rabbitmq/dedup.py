@@ -0,0 +1,68 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+from aiormq.abc import DeliveredMessage
+
+from app.database.db_operations.processed_message_db_operations import (
+    is_message_processed,
+    mark_message_processed,
+)
+
+
+def message_id(message: DeliveredMessage) -> str:
+    """ID сообщения: свойство message_id, если его проставил рекордер, иначе хэш тела.
+
+    Повторная доставка того же сообщения (после рестарта бота или переподключения)
+    получает тот же ID.
+    """
+    properties = message.header.properties
+    if properties.message_id:
+        return properties.message_id
+    return hashlib.sha256(message.body).hexdigest()
+
+
+def may_be_duplicate(message: DeliveredMessage) -> bool:
+    """Стоит ли искать сообщение среди обработанных.
+
+    Старые рекордеры не проставляют message_id, и повторный ответ с тем же телом (вторая
+    ошибка по той же ссылке, новый запрос скриншота) — это новое сообщение. Поэтому по
+    хэшу тела проверяются только сообщения с флагом redelivered.
+    """
+    return bool(message.header.properties.message_id) or message.delivery.redelivered
+
+
+class SeenMessages:
+    """Множество обработанных сообщений: LRU в памяти поверх коллекции processed_messages.
+
+    После рестарта очередь передоставляет все неподтверждённые сообщения; каждое уже
+    обработанное стоит поиска по _id (или по словарю в памяти), а не повторных записей
+    в БД и уведомлений администраторам. Коллекция делает проверку общей для реплик бота
+    и переживает рестарт; размер словаря в памяти ограничен size.
+    """
+
+    def __init__(self, size: int, ttl: float):
+        self._size = size
+        self._ttl = ttl
+        self._recent: OrderedDict[str, float] = OrderedDict()  # ID -> срок годности
+
+    def _remember(self, message_id: str, expires_at: float) -> None:
+        self._recent[message_id] = expires_at
+        self._recent.move_to_end(message_id)
+        if len(self._recent) > self._size:
+            self._recent.popitem(last=False)
+
+    async def seen(self, message_id: str) -> bool:
+        expires_at = self._recent.get(message_id)
+        if expires_at is not None:
+            if expires_at > time.time():
+                return True
+            del self._recent[message_id]
+        if await is_message_processed(message_id):
+            self._remember(message_id, time.time() + self._ttl)
+            return True
+        return False
+
+    async def add(self, message_id: str) -> None:
+        await mark_message_processed(message_id, self._ttl)
+        self._remember(message_id, time.time() + self._ttl)
@@ -1,16 +1,30 @@
 import asyncio
-import json
+import functools
 import os
+import time
+from typing import Awaitable, Callable
 
 import aiormq
 import httpx
+from bson import ObjectId
 from aiormq.abc import AbstractConnection
 from pamqp.commands import Basic
 
-from . import responses as res
+from . import codec, dedup, responses as res
+from .calls import RecorderCalls
+from .channels import ChannelPool
+from .consumer import KeyedDispatcher
+from .dedup import SeenMessages
+from .outbox import Outbox
+from .scheduler import DelayScheduler
 from ..bot import bot
-from app.database.db_operations.conference_db_operations import get_conference_by_link, add_recording_to_conference, \
-    update_conference_timestamp
+from app.config.config import AMQP_CHANNEL_POOL_SIZE, AMQP_CONSUMER_WORKERS, AMQP_DEDUP_CACHE_SIZE, \
+    AMQP_DEDUP_TTL, AMQP_MAX_ATTEMPTS, AMQP_PREFETCH_COUNT, AMQP_PUBLISH_TIMEOUT, \
+    AMQP_RECONNECT_MAX_DELAY, AMQP_RECONNECT_MIN_DELAY, AMQP_REQUEST_TIMEOUT, AMQP_RETRY_DELAY, \
+    OUTBOX_BATCH_SIZE, OUTBOX_CLAIM_TTL, OUTBOX_POLL_INTERVAL, SCHEDULER_CLAIM_TTL, \
+    SCHEDULER_RETRY_DELAY, SCHEDULER_WINDOW
+from app.database.db_operations.conference_db_operations import find_conference_by_link, \
+    add_recording_to_conference, update_conference_timestamp
 from ..database.models.conference_DBO import Conference
 from app.database.db_operations.recording_db_operations import create_recording_by_conference_link
 from app.database.db_operations.tag_db_operations import get_tag_by_id
@@ -21,40 +35,105 @@ from aiogram.types import FSInputFile
 from datetime import timezone as datetime_timezone
 
 connection: AbstractConnection | None = None
+connection_lock = asyncio.Lock()
 
 
 async def get_connection() -> AbstractConnection:
     global connection
-    if connection and not connection.is_closed:
+    async with connection_lock:  # concurrent callers must not open a second connection
+        if connection and not connection.is_closed:
+            return connection
+        connection = await aiormq.connect(os.getenv("AMQP"))
         return connection
-    connection = await aiormq.connect(os.getenv("AMQP"))
-    return connection
 
 
-# await mq.func.schedule_task("https://meet.google.com/qwe-qwe-qwe", 0)   schedule task in n secs
-async def schedule_task(link: str, in_secs: int):
-    print(f"Scheduled new task ({link}) in {in_secs} sec")
-    connection = await get_connection()
-    channel = await connection.channel()
-    await channel.basic_publish(
+channels = ChannelPool(get_connection, AMQP_CHANNEL_POOL_SIZE, AMQP_PUBLISH_TIMEOUT)
+response_workers = KeyedDispatcher(AMQP_CONSUMER_WORKERS)
+processed_responses = SeenMessages(AMQP_DEDUP_CACHE_SIZE, AMQP_DEDUP_TTL)
+recorder_calls = RecorderCalls(AMQP_REQUEST_TIMEOUT)
+# every publish goes through MongoDB, so handlers do not wait for (or fail with) the broker
+outbox = Outbox(
+    channels.publish_many, OUTBOX_BATCH_SIZE, OUTBOX_CLAIM_TTL, OUTBOX_POLL_INTERVAL,
+    AMQP_RECONNECT_MAX_DELAY,
+)
+# responses that failed AMQP_MAX_ATTEMPTS times, kept for manual inspection
+DEAD_LETTER_QUEUE = "gmeet_res_dead"
+
+
+async def publish_due_task(link: str):
+    # expiration "0" keeps the existing topology: the message dead-letters from gmeet_schedule
+    # to the recorder immediately; nothing in the queue can hold it back, because messages with
+    # a long TTL were moved to scheduled_tasks by a migration before any scheduler started
+    await outbox.publish(
         body=link.encode(),
         exchange="conferee_direct",
         routing_key="gmeet_schedule",
-        properties=Basic.Properties(expiration=str(in_secs * 1000)),
+        properties=Basic.Properties(expiration="0"),
     )
 
 
-# await mq.func.manage_active_task(mq.responses.Req.TIME, user_id: int)       request for current recording time
-# await mq.func.manage_active_task(mq.responses.Req.SCREENSHOT, user_id: int) request for screenshot
-async def manage_active_task(command: res.Req, user_id: int):
+scheduler = DelayScheduler(
+    publish_due_task, SCHEDULER_WINDOW, SCHEDULER_CLAIM_TTL, SCHEDULER_RETRY_DELAY
+)
+
+
+async def migrate_queued_tasks(renew_lock: Callable[[], Awaitable[None]]) -> int:
+    """Moves tasks still waiting in gmeet_schedule with a per-message TTL (published before
+    the scheduler existed) into scheduled_tasks. RabbitMQ expires such messages only at the
+    head of the queue, so one of them would hold back every due task published behind it.
+    The due time is the conference's next meeting; tasks of deleted conferences are dropped.
+    Runs once, as a schema migration (app.database.migrations), before any scheduler starts."""
+    migrated = 0
+    async with channels.acquire() as channel:
+        while True:
+            await renew_lock()
+            message = await channel.basic_get("gmeet_schedule")
+            if isinstance(message.delivery, Basic.GetEmpty):
+                return migrated
+            link = message.body.decode()
+            try:
+                # a failed read raises, so the message is requeued instead of being dropped
+                conference = await find_conference_by_link(link, fields=("next_meeting_timestamp",))
+                if conference is not None and conference.next_meeting_timestamp is not None:
+                    await scheduler.schedule(link, conference.next_meeting_timestamp, conference.id)
+                    migrated += 1
+                else:
+                    logger.info(f"Dropped queued task {link}: no upcoming meeting")
+            except Exception:
+                await channel.basic_reject(message.delivery.delivery_tag, requeue=True)
+                raise
+            await channel.basic_ack(delivery_tag=message.delivery.delivery_tag)
+
+
+# await mq.func.schedule_task("https://meet.google.com/qwe-qwe-qwe", 0)   schedule task in n secs
+# pass conference_id so that deleting the conference (or its tag) cancels the task
+async def schedule_task(link: str, in_secs: int, conference_id: ObjectId | None = None):
+    print(f"Scheduled new task ({link}) in {in_secs} sec")
+    await scheduler.schedule(link, time.time() + in_secs, conference_id)
+
+
+# await mq.func.manage_active_task(mq.responses.Req.TIME, user_id: int, link)       request for current recording time
+# await mq.func.manage_active_task(mq.responses.Req.SCREENSHOT, user_id: int, link) request for screenshot
+async def manage_active_task(command: res.Req, user_id: int, link: str = ""):
     print(f"Manage active task: <{command}>")
-    connection = await get_connection()
-    channel = await connection.channel()
-    await channel.basic_publish(
-        body=res.prepare(command, "", user_id),
-        exchange="conferee_direct",
-        routing_key="gmeet_manage",
+
+    async def send(correlation_id: str | None = None):
+        await outbox.publish(
+            body=codec.encode(codec.Request(command, link, user_id, correlation_id=correlation_id)),
+            exchange="conferee_direct",
+            routing_key="gmeet_manage",
+        )
+
+    if command not in (res.Req.SCREENSHOT, res.Req.TIME):  # no answer is expected
+        await send()
+        return
+    deliver = deliver_screenshot if command == res.Req.SCREENSHOT else deliver_recording_time
+    sent = await recorder_calls.request(
+        (command, link), user_id, send, deliver,
+        functools.partial(notify_request_timeout, command, link),
     )
+    if not sent:
+        logger.info(f"Joined the pending <{command}> request for {link}")
 
 
 def get_link(filepath):
@@ -80,31 +159,110 @@ async def download_file(filepath):
 
 
 async def update_conference_meeting_datetime(conference: Conference) -> tuple[bool, str]:
+    # every update is conditional on the date the response was handled with, so a redelivered
+    # SUCCEDED response (retry or crash before it was marked processed) does not move it again
     if conference.periodicity is None:
-        return await update_conference_timestamp(conference.id, None)
+        return await update_conference_timestamp(
+            conference.id, None, expected_timestamp=conference.next_meeting_timestamp
+        )
     else:
-        next_meeting_timestamp = conference.next_meeting_timestamp + conference.periodicity * 7 * 24 * 60 * 60
-        logger.info(f"Next meeting scheduled on {next_meeting_timestamp}, which is {conference.next_meeting_timestamp} + {conference.periodicity} week")
-        success, msg = await update_conference_timestamp(conference.id, next_meeting_timestamp)
-        if not success:
-            return False, f"Error while updating conference timestamp: {msg}"
         current_time = int(datetime.now(datetime_timezone.utc).timestamp())
+        if conference.next_meeting_timestamp > current_time:
+            # the recorded meeting is in the past, so a future date was already moved by an
+            # earlier delivery of this response; only make sure the task is scheduled
+            next_meeting_timestamp = conference.next_meeting_timestamp
+            logger.info(f"Next meeting on {next_meeting_timestamp} was already moved, not moving it again")
+        else:
+            next_meeting_timestamp = conference.next_meeting_timestamp + conference.periodicity * 7 * 24 * 60 * 60
+            logger.info(f"Next meeting scheduled on {next_meeting_timestamp}, which is {conference.next_meeting_timestamp} + {conference.periodicity} week")
+            success, msg = await update_conference_timestamp(
+                conference.id, next_meeting_timestamp, expected_timestamp=conference.next_meeting_timestamp
+            )
+            if not success:
+                return False, f"Error while updating conference timestamp: {msg}"
         secs_before_meeting = next_meeting_timestamp - current_time
         logger.info(f"Scheduling task with link {conference.link} for broker: start in {secs_before_meeting}s, as now it is {current_time} and in planned it is {next_meeting_timestamp}")
-        await schedule_task(conference.link, secs_before_meeting)
+        await schedule_task(conference.link, secs_before_meeting, conference.id)
         return True, f"Successfully scheduled new task for broker on link {conference.link}, start in {secs_before_meeting}s"
 
 
 async def handle_responses(message: aiormq.abc.DeliveredMessage):
-    body = message.body.decode().replace("'", '"').replace('b"', '"')
+    try:
+        response = codec.decode_response(message.body)
+    except codec.MessageFormatError as e:
+        # retrying cannot help: the message goes to the dead-letter queue with the reason
+        logger.warning(f"Consumer got malformed response, moving it to {DEAD_LETTER_QUEUE}: "
+                       f"{message.body!r}\n{e}")
+        headers = dict(message.header.properties.headers or {})
+        headers.setdefault("x-original-id", dedup.message_id(message))
+        headers["x-last-error"] = f"{type(e).__name__}: {e}"[:1000]
+        await outbox.publish(
+            message.body, exchange="", routing_key=DEAD_LETTER_QUEUE,
+            properties=Basic.Properties(headers=headers, delivery_mode=2),
+        )
+        await message.channel.basic_ack(delivery_tag=message.delivery.delivery_tag)
+        return
+    print(f"Received response: {response}")
+    # responses of one conference are handled in order, different conferences in parallel;
+    # submit does not await, so the order of deliveries is the order within a conference
+    response_workers.submit(response.body, functools.partial(process_response, message, response))
+
+
+async def process_response(message: aiormq.abc.DeliveredMessage, response: codec.Response):
+    message_key = dedup.message_id(message)
+    try:
+        if dedup.may_be_duplicate(message) and await processed_responses.seen(message_key):
+            logger.info(f"Response {message_key} was already handled, skipping redelivery")
+        else:
+            try:
+                await handle_response(response)
+            except Exception as e:
+                await retry_or_dead_letter(message, message_key, e)
+            else:
+                await processed_responses.add(message_key)
+    except Exception as e:
+        # the dedup check or the retry could not be stored (MongoDB unavailable): the broker
+        # gets the message back instead of it holding a prefetch slot until a reconnect
+        logger.error(f"Response {message_key} could not be processed, requeueing it: {e}")
+        await message.channel.basic_nack(delivery_tag=message.delivery.delivery_tag, requeue=True)
+        return
+    # acked only after handling (or handing the message over for a retry): if the bot stops
+    # before that, the broker redelivers the response
     await message.channel.basic_ack(delivery_tag=message.delivery.delivery_tag)
-    body = body.replace("None", "null")
-    print(f"Received response: {body}")
+
+
+async def retry_or_dead_letter(
+    message: aiormq.abc.DeliveredMessage, message_key: str, error: Exception
+):
+    headers = dict(message.header.properties.headers or {})
+    attempts = int(headers.get("x-attempts", 0)) + 1
+    headers["x-attempts"] = attempts
+    headers["x-last-error"] = f"{type(error).__name__}: {error}"[:1000]
+    # the ID of the first delivery is kept for tracing only: the copy gets its own message_id
+    # (the outbox record), because for legacy responses the key is a hash of the body, and
+    # as a message_id it would make another response with the same body look like a duplicate
+    headers.setdefault("x-original-id", message_key)
+    properties = Basic.Properties(headers=headers, delivery_mode=2)
+    if attempts >= AMQP_MAX_ATTEMPTS:
+        logger.error(f"Response {message_key} failed {attempts} times, moving it to "
+                     f"{DEAD_LETTER_QUEUE}: {error}")
+        await outbox.publish(message.body, exchange="", routing_key=DEAD_LETTER_QUEUE,
+                             properties=properties)
+        return
+    logger.warning(f"Response {message_key} failed (attempt {attempts} of {AMQP_MAX_ATTEMPTS}), "
+                   f"retrying in {AMQP_RETRY_DELAY * attempts}s: {error}")
+    # the delay is kept by the outbox, so the worker and the conference key are released now;
+    # the retry goes to the tail of gmeet_res, so responses of the same conference that arrive
+    # meanwhile are handled before it: order within a conference is not kept across retries
+    await outbox.publish(message.body, exchange="", routing_key="gmeet_res", properties=properties,
+                         delay=AMQP_RETRY_DELAY * attempts)
+
+
+async def handle_response(response: codec.Response):
     try:
-        msg: dict = json.loads(body)
-        response_type = msg.get("type")
-        body = msg.get("body")
-        user_id = msg.get("user_id")  # USE USER_ID, only for SCREENSHOT and TIME
+        response_type = response.type
+        body = response.body
+        user_id = response.user_id  # USE USER_ID, only for SCREENSHOT and TIME
         if response_type == res.Res.BUSY:
             print("Consumer is busy:", body)
             await message_to_all_admins_and_owners(
@@ -119,136 +277,177 @@ async def handle_responses(message: aiormq.abc.DeliveredMessage):
                 f"Запись конференции {body} начата."
             )
         elif response_type == res.Res.SUCCEDED:
-            filepath = get_link(msg.get("filepath"))
-            logger.info(f"Got recording filepath: '{filepath}', the filepath itself in msg is '{msg.get("filepath")}'")
+            filepath = get_link(response.filepath)
+            logger.info(f"Got recording filepath: '{filepath}', the filepath itself in msg is '{response.filepath}'")
             print("Consumer successfully finished recording:", body, filepath)
-            conference = await get_conference_by_link(body)
-            if conference is not None:
-                conference_tag = await get_tag_by_id(str(conference.tag_id))
-            else:
-                conference_tag = None
-            if conference_tag is not None:
-                await message_to_all_admins_and_owners(
-                    "✅ Конференция записана успешно!\n\n "
-                    f"Запись конференции с тегом '{conference_tag.name}' и ссылкой '{body}' закончена и сохранена."
-                )
-            else:
+            # a failed read raises and the response is retried, it is not "conference not found"
+            conference = await find_conference_by_link(body)
+            if conference is None:
                 await message_to_all_admins_and_owners(
                     "✅ Конференция записана успешно!\n\n "
                     f"Запись конференции с ссылкой '{body}' закончена и сохранена."
                 )
-            if conference is not None:
-                success, msg = await update_conference_meeting_datetime(conference=conference)
-                if not success:
-                    logger.warning(msg)
+            else:
+                # the recording is saved first: both steps are idempotent, so a redelivered
+                # response does not duplicate it; the date update below is conditional on the
+                # old date, so a replay does not move the next meeting again
                 success, operation_msg, recording_id, recording = await create_recording_by_conference_link(
                     conference_link=conference.link,
                     recording_link=filepath
                 )
-                if success:
-                    logger.warning(f"Successfully created recording with id {recording_id}: {operation_msg}")
-                    success, operation_msg = await add_recording_to_conference(conference.id, recording_id)
-                    if not success:
-                        logger.warning(f"Error while adding recording with id {recording_id} "
-                                       f"into the conference '{conference}' array: {operation_msg}")
+                if not success:
+                    # retried, so that the recording is not lost after a transient error
+                    raise RuntimeError(f"Error while creating recording with conference link "
+                                       f"'{conference.link}' and filepath '{filepath}': {operation_msg}")
+                logger.info(f"Successfully created recording with id {recording_id}: {operation_msg}")
+                added, operation_msg = await add_recording_to_conference(conference.id, recording_id)
+                if added:
+                    logger.info(f"Successfully added recording with id {recording_id} "
+                                f"into the conference '{conference}' array: {operation_msg}")
+                    # admins are notified once, after the recording is saved: a retry or a
+                    # redelivery finds it already in the conference and does not notify again
+                    conference_tag = await get_tag_by_id(str(conference.tag_id))
+                    if conference_tag is not None:
+                        await message_to_all_admins_and_owners(
+                            "✅ Конференция записана успешно!\n\n "
+                            f"Запись конференции с тегом '{conference_tag.name}' и ссылкой '{body}' закончена и сохранена."
+                        )
                     else:
-                        recording.link = filepath
-                        logger.warning(f"Successfully added recording with id {recording_id} "
-                                       f"into the conference '{conference}' array: {operation_msg} "
-                                       f"and the download link {filepath} into recording.")
+                        await message_to_all_admins_and_owners(
+                            "✅ Конференция записана успешно!\n\n "
+                            f"Запись конференции с ссылкой '{body}' закончена и сохранена."
+                        )
                 else:
-                    logger.warning(f"Error while creating recording with conference link '{conference.link}' "
-                                   f"and filepath '{filepath}': {operation_msg}")
+                    logger.info(f"Recording with id {recording_id} is already in the conference "
+                                f"'{conference.link}', not notifying again: {operation_msg}")
+                success, msg = await update_conference_meeting_datetime(conference=conference)
+                if not success:
+                    raise RuntimeError(msg)
         elif response_type == res.Res.ERROR:
             print("Consumer finished with ERROR:", body)
             await message_to_all_admins_and_owners(
                 "⚠️ Ошибка записи.\n\n "
                 f"Не удалось записать конференцию {body}, произошла ошибка в процессе записи."
             )
-        elif response_type == res.Req.SCREENSHOT:
-            filepath = msg.get("filepath")
-            print("Got screenshot:", filepath)
-            if filepath is None:
-                await bot.send_message(
-                    chat_id=user_id,
-                    text="⚠️ Ошибка получения скриншота.\n\n "
-                         f"Не удалось получить скриншот для конференции {body}. Произошла ошибка."
-                )
-                return
+        elif response_type in (res.Req.SCREENSHOT, res.Req.TIME):
+            print(f"Got {response_type} response:", body, response.filepath)
+            # the waiting request fans the answer out to every user who asked for it
+            if not recorder_calls.resolve((response_type, body), response):
+                deliver = deliver_screenshot if response_type == res.Req.SCREENSHOT else deliver_recording_time
+                await deliver([user_id], response)
+
+    except Exception as e:
+        logger.warning(f"Consumer failed to handle response: {response}\n{e}, {type(e)}")
+        raise
+
+
+async def deliver_screenshot(user_ids: list[int], response: codec.Response):
+    body = response.body
+    filepath = response.filepath
+    if filepath:
+        try:
+            filepath = await download_file(filepath)
+        except Exception as e:
+            logger.warning(f"Exception while downloading file from {filepath}: '{e}'")
+            filepath = None
+    if not filepath:
+        await send_message_to_users(
+            user_ids,
+            "⚠️ Ошибка получения скриншота.\n\n "
+            f"Не удалось получить скриншот для конференции {body}. Произошла ошибка."
+        )
+        return
+    try:
+        # the file is uploaded once, the other users get it by Telegram file_id
+        photo = FSInputFile(filepath)
+        for user_id in user_ids:
             try:
-                filepath = await download_file(filepath)
-            except Exception as e:
-                logger.warning(f"Exception while downloading file from {filepath}: '{e}'")
-                return
-            photo = FSInputFile(filepath)
-            await bot.send_photo(
-                chat_id=user_id,
-                photo=photo,
-                caption=f"✔ Запрошенный скриншот происходящего в конференции {body} готов!"
-            )
-            os.remove(filepath)
-        elif response_type == res.Req.TIME:
-            print("Got current recording time:", body)
-            secs_from_rec_start = msg.get("filepath")
-            if secs_from_rec_start is None:
-                await bot.send_message(
+                message = await bot.send_photo(
                     chat_id=user_id,
-                    text="⚠️ Ошибка получения времени записи.\n\n "
-                         f"Не удалось выполнить время записи конференции {body}. Произошла ошибка."
+                    photo=photo,
+                    caption=f"✔ Запрошенный скриншот происходящего в конференции {body} готов!"
                 )
-                return
-            await bot.send_message(
-                chat_id=user_id,
-                text=f"✔ Готов ответ на запрос о времени записи конференции {body}:\n\n"
-                     f"Запись ведётся уже {secs_from_rec_start // 60 // 60}ч "
-                     f"{(secs_from_rec_start // 60) % 60}м "
-                     f"{secs_from_rec_start% 60}с"
-            )
+            except Exception as e:
+                logger.warning(f"Failed to send the screenshot to {user_id}: {e}")
+                continue
+            photo = message.photo[-1].file_id
+    finally:
+        os.remove(filepath)
 
-    except Exception as e:
-        logger.warning(f"Consumer did not ack task: {body}\n{e}, {type(e)}")
+
+async def send_message_to_users(user_ids: list[int], text: str):
+    # best effort: a user who blocked the bot must not keep the others from the answer
+    for user_id in user_ids:
+        try:
+            await bot.send_message(chat_id=user_id, text=text)
+        except Exception as e:
+            logger.warning(f"Failed to send a message to {user_id}: {e}")
+
+
+async def deliver_recording_time(user_ids: list[int], response: codec.Response):
+    body = response.body
+    secs_from_rec_start = response.filepath
+    if not isinstance(secs_from_rec_start, int):
+        text = ("⚠️ Ошибка получения времени записи.\n\n "
+                f"Не удалось выполнить время записи конференции {body}. Произошла ошибка.")
+    else:
+        text = (f"✔ Готов ответ на запрос о времени записи конференции {body}:\n\n"
+                f"Запись ведётся уже {secs_from_rec_start // 60 // 60}ч "
+                f"{(secs_from_rec_start // 60) % 60}м "
+                f"{secs_from_rec_start% 60}с")
+    await send_message_to_users(user_ids, text)
+
+
+async def notify_request_timeout(command: res.Req, link: str, user_ids: list[int]):
+    what = "скриншот" if command == res.Req.SCREENSHOT else "время записи"
+    await send_message_to_users(
+        user_ids,
+        f"⌛ Рекордер не ответил на запрос ({what}) для конференции {link} "
+        f"за {AMQP_REQUEST_TIMEOUT:.0f} с. Попробуйте позже."
+    )
 
 
 async def start_listening():
+    """Consumes gmeet_res and keeps doing so across broker restarts: when the connection or
+    the channel closes, it reconnects with exponential backoff and declares the consumer again."""
     logger.info("Starting listening to queues...")
-    connection = await get_connection()
-    async with connection as conn:
-        channel = await conn.channel()
-        reses = channel.basic_consume(queue="gmeet_res", consumer_callback=handle_responses)
-        await asyncio.gather(reses)
-        logger.info("Listeners are ready!")
-        await asyncio.Future()
-    logger.info("Stopped listening to queues.")
-
-
-# await mq.func.decline_task("https://meet.google.com/qwe-qwet-qwe") delete task from schedule
-async def decline_task(link: str):
-    connection = await get_connection()
-    channel = await connection.channel()
+    response_workers.start()
+    delay = AMQP_RECONNECT_MIN_DELAY
     while True:
-        message = await channel.basic_get("gmeet_schedule")
-        body = message.body.decode()
-        if not body:
-            break
-        if body == link:
-            print(f"Task ({link}) canceled.")
-            await message.channel.basic_ack(delivery_tag=message.delivery.delivery_tag)
+        try:
+            connection = await get_connection()
+            channel = await connection.channel()
+            await channel.basic_qos(prefetch_count=AMQP_PREFETCH_COUNT)
+            await channel.queue_declare(DEAD_LETTER_QUEUE, durable=True)
+            await channel.basic_consume(queue="gmeet_res", consumer_callback=handle_responses)
+            logger.info("Listeners are ready!")
+            delay = AMQP_RECONNECT_MIN_DELAY
+            outbox.wake()  # publish what was stored while the broker was unavailable
+            await asyncio.wait(
+                [connection.closing, channel.closing], return_when=asyncio.FIRST_COMPLETED
+            )
+            if not channel.is_closed:
+                await channel.close()
+            logger.warning("Connection to RabbitMQ lost")
+        except Exception as e:
+            logger.warning(f"Failed to start listening to queues: {e}")
+        logger.info(f"Reconnecting to RabbitMQ in {delay}s")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, AMQP_RECONNECT_MAX_DELAY)
 
 
 async def message_to_all_admins_and_owners(message: str):
-    admins = await get_admins()
-    for admin in admins:
-        if admin.telegram_id is not None:
-            await bot.send_message(
-                chat_id=admin.telegram_id,
-                text=message,
-                disable_notification=True,
-            )
-    owners = await get_owners()
-    for owner in owners:
-        if owner.telegram_id is not None:
+    # best effort: a recipient who blocked the bot must not make the response fail and retry
+    admins = await get_admins(fields=("telegram_id",))
+    owners = await get_owners(fields=("telegram_id",))
+    for recipient in [*admins, *owners]:
+        if recipient.telegram_id is None:
+            continue
+        try:
             await bot.send_message(
-                chat_id=owner.telegram_id,
+                chat_id=recipient.telegram_id,
                 text=message,
                 disable_notification=True,
             )
+        except Exception as e:
+            logger.warning(f"Failed to notify {recipient.telegram_id}: {e}")
@@ -0,0 +1,112 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, Optional
+
+from pamqp.commands import Basic
+
+from app.database.db_operations.outbox_db_operations import (
+    add_outbox_message,
+    claim_outbox_batch,
+    delete_outbox_messages,
+    release_outbox_messages,
+)
+from app.utils.logger import logger
+
+# Свойства AMQP, которые бот выставляет при публикации и которые сохраняются в outbox
+PROPERTIES = ("expiration", "message_id", "headers", "delivery_mode")
+
+PublishMany = Callable[[Iterable[tuple[bytes, str, str, Optional[Basic.Properties]]]], Awaitable]
+
+
+class Outbox:
+    """Публикации в RabbitMQ через коллекцию outbox в MongoDB.
+
+    publish() только сохраняет сообщение и будит фоновую задачу, поэтому латентность
+    обработчика не зависит от доступности брокера. run() отправляет накопленное пачками
+    по batch_size с ожиданием подтверждений и удаляет отправленное; пока брокер
+    недоступен, сообщения ждут в MongoDB и уходят одной серией после переподключения
+    (wake()). Сообщение может быть опубликовано повторно, если бот упадёт между
+    подтверждением и удалением, поэтому у каждого есть message_id — ID записи outbox.
+    """
+
+    def __init__(
+        self,
+        publish_many: PublishMany,
+        batch_size: int,
+        claim_ttl: float,
+        poll_interval: float,
+        max_retry_delay: float,
+    ):
+        self._publish_many = publish_many
+        self._batch_size = batch_size
+        self._claim_ttl = claim_ttl
+        self._poll_interval = poll_interval
+        self._max_retry_delay = max_retry_delay
+        self._wakeup = asyncio.Event()
+
+    async def publish(
+        self,
+        body: bytes,
+        exchange: str,
+        routing_key: str,
+        properties: Optional[Basic.Properties] = None,
+        delay: float = 0,
+    ) -> None:
+        """Сохраняет сообщение в outbox; в брокер оно уйдёт из run(), но не раньше чем
+        через delay секунд (с точностью до poll_interval)."""
+        fields = {}
+        if properties is not None:
+            fields = {
+                name: getattr(properties, name)
+                for name in PROPERTIES
+                if getattr(properties, name) is not None
+            }
+        await add_outbox_message(body, exchange, routing_key, fields, delay)
+        if not delay:
+            self.wake()
+
+    def wake(self) -> None:
+        """Запускает отправку, не дожидаясь poll_interval (новое сообщение, переподключение)."""
+        self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Отправляет всё накопленное. Возвращает число опубликованных сообщений."""
+        published = 0
+        while batch := await claim_outbox_batch(self._batch_size, self._claim_ttl):
+            ids = [message["_id"] for message in batch]
+            try:
+                await self._publish_many(
+                    (
+                        message["body"],
+                        message["exchange"],
+                        message["routing_key"],
+                        Basic.Properties(
+                            **{"message_id": str(message["_id"]), **message["properties"]}
+                        ),
+                    )
+                    for message in batch
+                )
+            except Exception:
+                await release_outbox_messages(ids)
+                raise
+            await delete_outbox_messages(ids)
+            published += len(ids)
+        return published
+
+    async def run(self) -> None:
+        logger.info("Отправка outbox в RabbitMQ запущена")
+        delay = self._poll_interval
+        while True:
+            self._wakeup.clear()
+            try:
+                published = await self.flush()
+                if published:
+                    logger.info(f"Из outbox опубликовано сообщений: {published}")
+                delay = self._poll_interval
+            except Exception as e:
+                # брокер недоступен: повтор с растущей паузой или сразу после wake()
+                delay = min(delay * 2, self._max_retry_delay)
+                logger.warning(f"Не удалось опубликовать outbox, повтор через {delay} с: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
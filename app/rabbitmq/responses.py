@@ -12,14 +12,3 @@ class Req(StrEnum):
     SCREENSHOT = "screenshot"
     TIME = "time"
     STOP_RECORD = "stop"
-
-
-def prepare(res: Req, body, user_id=-1, filepath="") -> bytes:
-    return str(
-        {
-            "type": res.value,
-            "body": body,
-            "user_id": user_id,
-            "filepath": filepath,
-        }
-    ).encode()
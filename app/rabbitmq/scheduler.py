@@ -0,0 +1,122 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Awaitable, Callable, Optional
+
+from bson import ObjectId
+
+from app.database.db_operations.scheduled_task_db_operations import (
+    claim_scheduled_task,
+    complete_scheduled_task,
+    get_tasks_due_before,
+    release_scheduled_task,
+    upsert_scheduled_task,
+)
+from app.utils.logger import logger
+
+
+class DelayScheduler:
+    """Отложенная публикация задач рекордеру в срок.
+
+    Сроки хранятся в коллекции scheduled_tasks, поэтому переживают перезапуск бота и
+    очистку очередей. В памяти держится только куча задач, срок которых наступает в
+    ближайшие window секунд: раз в window окно подгружается из MongoDB диапазонным
+    запросом по индексу due_at. Задача через месяц не лежит ни в куче, ни в очереди
+    RabbitMQ и не задерживает более ранние, а стоимость тика — O(log n) по куче окна
+    и не зависит от того, насколько далеко запланированы задачи.
+
+    Несколько реплик бота могут подгрузить одну и ту же задачу; публикует её та, что
+    первой захватит задачу в MongoDB (claim_scheduled_task).
+    """
+
+    def __init__(
+        self,
+        publish: Callable[[str], Awaitable[None]],
+        window: float,
+        claim_ttl: float,
+        retry_delay: float,
+    ):
+        self._publish = publish
+        self._window = window
+        self._claim_ttl = claim_ttl
+        self._retry_delay = retry_delay
+        # (fire_at, seq, task_id, due_at); записи, чей due_at уже не актуален для задачи
+        # (перенесена или отменена), пропускаются при извлечении
+        self._heap: list[tuple[float, int, ObjectId, float]] = []
+        self._tasks: dict[ObjectId, tuple[float, str]] = {}  # task_id -> (due_at, link)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._loaded_until = 0.0
+
+    def _push(self, task_id: ObjectId, link: str, due_at: float, fire_at: float = None) -> None:
+        self._tasks[task_id] = (due_at, link)
+        heapq.heappush(self._heap, (fire_at or due_at, next(self._seq), task_id, due_at))
+        if self._heap[0][2] == task_id:
+            self._wakeup.set()
+
+    def _forget(self, task_id: ObjectId) -> None:
+        self._tasks.pop(task_id, None)
+
+    async def schedule(
+        self, link: str, due_at: float, conference_id: Optional[ObjectId] = None
+    ) -> ObjectId:
+        """Сохраняет срок задачи; если он попадает в текущее окно, кладёт её в кучу."""
+        task_id = await upsert_scheduled_task(link, due_at, conference_id)
+        if due_at <= self._loaded_until:
+            self._push(task_id, link, due_at)
+        else:
+            self._forget(task_id)
+        return task_id
+
+    async def _load_window(self) -> None:
+        until = time.time() + self._window
+        for task in await get_tasks_due_before(until):
+            if self._tasks.get(task.id, (None,))[0] != task.due_at:
+                self._push(task.id, task.link, task.due_at)
+        self._loaded_until = until
+
+    async def _fire(self, task_id: ObjectId, due_at: float) -> None:
+        task = await claim_scheduled_task(task_id, due_at, self._claim_ttl)
+        if task is None:  # перенесена, отменена или её публикует другая реплика
+            if self._tasks.get(task_id, (None,))[0] == due_at:
+                self._forget(task_id)
+            return
+        try:
+            await self._publish(task.link)
+        except Exception as e:
+            logger.warning(
+                f"Не удалось опубликовать задачу '{task.link}', повтор через "
+                f"{self._retry_delay} с: {e}"
+            )
+            await release_scheduled_task(task_id, due_at)
+            # срок в MongoDB не меняется, повтор только локальный
+            self._push(task_id, task.link, due_at, fire_at=time.time() + self._retry_delay)
+            return
+        await complete_scheduled_task(task_id, due_at)
+        if self._tasks.get(task_id, (None,))[0] == due_at:
+            self._forget(task_id)
+        logger.info(f"Задача '{task.link}' опубликована, опоздание {time.time() - due_at:.3f} с")
+
+    async def run(self) -> None:
+        logger.info("Планировщик отложенных задач запущен")
+        while True:
+            try:
+                now = time.time()
+                if now >= self._loaded_until - self._window / 2:
+                    await self._load_window()
+                    now = time.time()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, task_id, due_at = heapq.heappop(self._heap)
+                    if self._tasks.get(task_id, (None,))[0] == due_at:
+                        await self._fire(task_id, due_at)
+                next_due = self._heap[0][0] if self._heap else self._loaded_until
+                timeout = max(min(next_due, self._loaded_until - self._window / 2) - now, 0)
+            except Exception as e:
+                logger.error(f"Ошибка планировщика отложенных задач: {e}")
+                timeout = self._retry_delay
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -8,18 +8,21 @@ from aiogram.types import CallbackQuery, Message, InlineKeyboardButton, InlineKe
 from bson import ObjectId
 
 from app.config import labels
-from app.database.db_operations.conference_db_operations import add_conference_to_db, conference_exists_by_link
+from app.database.db_operations.conference_db_operations import add_conference_to_db, \
+    conference_exists_by_link
 from app.database.db_operations.tag_db_operations import get_tag_by_id
-from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.database.models.user_DBO import User
 from app.keyboards import (
     inline_active_tag_list,
     inline_single_cancel_button,
     main_actions_keyboard,
+    parse_page_callback,
 )
 from app.rabbitmq.func import schedule_task
 from app.roles.admin.admin import admin
 from app.roles.user.callbacks_enum import Callbacks
 from app.utils.logger import logger
+from app.utils.meet_link import canonical_meet_link, extract_meet_code
 
 
 class RecordingCreateStates(StatesGroup):
@@ -41,11 +44,28 @@ async def start_recording(message: Message, state: FSMContext):
             on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
             on_archived_clicked_callback=None,
             on_item_create_clicked_callback=None,
+            on_page_clicked_callback=Callbacks.tags_page_in_recording_mode,
         ),
     )
     await state.set_state(RecordingCreateStates.waiting_for_tag)
 
 
+@admin.callback_query(F.data.startswith(Callbacks.tags_page_in_recording_mode),
+                      RecordingCreateStates.waiting_for_tag)
+async def paginate_tags_in_recording_mode(callback: CallbackQuery):
+    after, before = parse_page_callback(callback.data)
+    await callback.message.edit_reply_markup(
+        reply_markup=await inline_active_tag_list(
+            on_item_clicked_callback=Callbacks.tag_clicked_in_recording_mode_callback,
+            on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
+            on_page_clicked_callback=Callbacks.tags_page_in_recording_mode,
+            after=after,
+            before=before,
+        ),
+    )
+    await callback.answer("")
+
+
 @admin.callback_query(F.data.startswith(Callbacks.tag_clicked_in_recording_mode_callback))
 async def process_tag_for_recording(callback: CallbackQuery, state: FSMContext):
     try:
@@ -81,6 +101,7 @@ async def back_to_tag_from_link(callback: CallbackQuery, state: FSMContext):
             on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
             on_archived_clicked_callback=None,
             on_item_create_clicked_callback=None,
+            on_page_clicked_callback=Callbacks.tags_page_in_recording_mode,
         ),
     )
     await state.set_state(RecordingCreateStates.waiting_for_tag)
@@ -88,30 +109,32 @@ async def back_to_tag_from_link(callback: CallbackQuery, state: FSMContext):
 
 
 @admin.message(RecordingCreateStates.waiting_for_meet_link)
-async def process_meet_link_for_recording(message: Message, state: FSMContext):
+async def process_meet_link_for_recording(
+    message: Message, state: FSMContext, db_user: User | None
+):
     meet_link = message.text.strip()
     state_data = await state.get_data()
     tag_id = state_data.get("tag_id")
-    telegram_tag = f"@{message.from_user.username}" if message.from_user.username else f"@{message.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
 
     if not tag_id:
         await message.answer(
             text="Ошибка: тег не выбран! Попробуйте начать заново.",
-            reply_markup=main_actions_keyboard(user.role),
+            reply_markup=main_actions_keyboard(db_user.role),
         )
         await state.clear()
         return
 
-    if not meet_link.startswith("https://meet.google.com/") or len(meet_link.split("/")[-1]) < 8:
+    meet_code = extract_meet_code(meet_link)
+    if meet_code is None:
         await message.answer(
             text="Ссылка некорректная, поддерживаются только ссылки Google Meet (https://meet.google.com/). Попробуйте снова:",
             reply_markup=await inline_single_cancel_button(Callbacks.cancel_primary_action_callback),
         )
         return
 
+    meet_link = canonical_meet_link(meet_code)
     if await conference_exists_by_link(meet_link):
         await message.answer(
             text=f"Конференция с ссылкой '{meet_link}' уже существует! Проверьте корректность ссылки и попробуйте снова:",
@@ -144,11 +167,9 @@ async def back_to_link_from_timezone(callback: CallbackQuery, state: FSMContext)
 
 
 @admin.message(RecordingCreateStates.waiting_for_timezone)
-async def process_timezone(message: Message, state: FSMContext):
+async def process_timezone(message: Message, state: FSMContext, db_user: User | None):
     timezone_str = message.text.strip()
-    telegram_tag = f"@{message.from_user.username}" if message.from_user.username else f"@{message.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     try:
         timezone = int(timezone_str)
@@ -186,13 +207,11 @@ async def back_to_timezone_from_date(callback: CallbackQuery, state: FSMContext)
 
 
 @admin.message(RecordingCreateStates.waiting_for_start_date)
-async def process_start_date(message: Message, state: FSMContext):
+async def process_start_date(message: Message, state: FSMContext, db_user: User | None):
     start_date_str = message.text.strip()
     state_data = await state.get_data()
     timezone = state_data.get("timezone")
-    telegram_tag = f"@{message.from_user.username}" if message.from_user.username else f"@{message.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
 
     try:
@@ -247,7 +266,7 @@ async def back_to_timezone_from_recurrence(callback: CallbackQuery, state: FSMCo
 
 
 @admin.callback_query(F.data.startswith("recurrence_"), RecordingCreateStates.waiting_for_recurrence)
-async def process_recurrence(callback: CallbackQuery, state: FSMContext):
+async def process_recurrence(callback: CallbackQuery, state: FSMContext, db_user: User | None):
     recurrence = callback.data == "recurrence_yes"
     await state.update_data(recurrence=recurrence)
 
@@ -262,7 +281,7 @@ async def process_recurrence(callback: CallbackQuery, state: FSMContext):
         )
         await state.set_state(RecordingCreateStates.waiting_for_periodicity)
     else:
-        await finish_recording(callback, state)
+        await finish_recording(callback, state, db_user)
     await callback.answer("")
 
 
@@ -281,14 +300,14 @@ async def back_to_date_from_periodicity(callback: CallbackQuery, state: FSMConte
 
 
 @admin.callback_query(F.data.startswith("period_"), RecordingCreateStates.waiting_for_periodicity)
-async def process_periodicity(callback: CallbackQuery, state: FSMContext):
+async def process_periodicity(callback: CallbackQuery, state: FSMContext, db_user: User | None):
     periodicity = int(callback.data.split("_")[1])
     await state.update_data(periodicity=periodicity)
-    await finish_recording(callback, state)
+    await finish_recording(callback, state, db_user)
     await callback.answer("")
 
 
-async def finish_recording(callback: CallbackQuery, state: FSMContext):
+async def finish_recording(callback: CallbackQuery, state: FSMContext, db_user: User | None):
     state_data = await state.get_data()
     tag_id = state_data.get("tag_id")
     meet_link = state_data.get("meet_link")
@@ -296,15 +315,13 @@ async def finish_recording(callback: CallbackQuery, state: FSMContext):
     timezone = state_data.get("timezone")
     recurrence = state_data.get("recurrence")
     periodicity = state_data.get("periodicity", None)
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
 
     logger.info(
         f"Добавление конференции: tag_id={tag_id}, link={meet_link}, timestamp={timestamp}, timezone={timezone}, periodicity={periodicity if recurrence else None}")
 
-    success, response = await add_conference_to_db(
+    success, response, conference_id = await add_conference_to_db(
         meet_link=meet_link,
         tag_id=ObjectId(tag_id),
         timestamp=timestamp,
@@ -315,11 +332,11 @@ async def finish_recording(callback: CallbackQuery, state: FSMContext):
         meet_start_timestamp = timestamp
         current_time = int(datetime.now(datetime_timezone.utc).timestamp())
         logger.info(f"Send {meet_start_timestamp - current_time}s into broker ({meet_start_timestamp} - {current_time})")
-        await schedule_task(meet_link, (meet_start_timestamp - current_time))
+        await schedule_task(meet_link, (meet_start_timestamp - current_time), conference_id)
         await callback.message.delete()
         await callback.message.answer(
             text=response,
-            reply_markup=main_actions_keyboard(user.role),
+            reply_markup=main_actions_keyboard(db_user.role),
         )
     else:
         await callback.message.answer(
@@ -331,15 +348,15 @@ async def finish_recording(callback: CallbackQuery, state: FSMContext):
 
 
 @admin.callback_query(F.data == Callbacks.cancel_primary_action_callback)
-async def on_cancel_primary_callback(callback: CallbackQuery, state: FSMContext):
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+async def on_cancel_primary_callback(
+    callback: CallbackQuery, state: FSMContext, db_user: User | None
+):
+    if not db_user:
         return
     await callback.answer("")
     await callback.message.delete()
     await callback.message.answer(
         text="Действие отменено. Выберите новое действие с помощью кнопок под клавиатурой.",
-        reply_markup=main_actions_keyboard(user.role),
+        reply_markup=main_actions_keyboard(db_user.role),
     )
     await state.clear()
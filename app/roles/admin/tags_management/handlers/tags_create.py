@@ -4,7 +4,7 @@ from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message, CallbackQuery
 
 from app.database.db_operations.tag_db_operations import add_tag_to_db
-from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.database.models.user_DBO import User
 from app.keyboards import (
     inline_single_cancel_button,
     main_actions_keyboard,
@@ -35,11 +35,9 @@ async def handle_create_tag_callback(callback: CallbackQuery, state: FSMContext)
 
 
 @admin.message(TagCreationStates.waiting_for_tag_name)
-async def process_tag_name(message: Message, state: FSMContext):
+async def process_tag_name(message: Message, state: FSMContext, db_user: User | None):
     tag_name = message.text.strip()
-    telegram_tag = f"@{message.from_user.username}" if message.from_user.username else f"@{message.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     if len(tag_name) > 32:
         await message.answer(
@@ -51,7 +49,7 @@ async def process_tag_name(message: Message, state: FSMContext):
     if success:
         await message.answer(
             text=response,
-            reply_markup=main_actions_keyboard(user.role)
+            reply_markup=main_actions_keyboard(db_user.role)
         )
         await state.clear()
     else:
@@ -62,5 +60,5 @@ async def process_tag_name(message: Message, state: FSMContext):
 
 
 @admin.callback_query(F.data == Callbacks.cancel_tag_naming_callback)
-async def on_cancel_tag_naming(callback: CallbackQuery, state: FSMContext):
-    await manage_tags(callback, state)
+async def on_cancel_tag_naming(callback: CallbackQuery, state: FSMContext, db_user: User | None):
+    await manage_tags(callback, state, db_user)
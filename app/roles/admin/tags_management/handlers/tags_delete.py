@@ -3,7 +3,7 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 
 from app.database.db_operations.tag_db_operations import archive_tag_in_db, get_tag_by_id, delete_tag_from_db
-from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.database.models.user_DBO import User
 from app.keyboards import main_actions_keyboard, tag_deletion_confirmation_keyboard, inline_archived_tag_actions
 from app.roles.admin.admin import admin  # Импортируем роутер admin
 from app.roles.admin.tags_management.handlers.tags_read import TagManagementStates, manage_tags
@@ -11,18 +11,16 @@ from app.roles.user.callbacks_enum import Callbacks
 
 
 @admin.callback_query(F.data.startswith(Callbacks.tag_archive_callback))
-async def on_tag_archive_callback(callback: CallbackQuery):
+async def on_tag_archive_callback(callback: CallbackQuery, db_user: User | None):
     try:
         tag_id = callback.data.split(":")[1]
     except IndexError:
         await callback.answer("Ошибка: тег не выбран!", show_alert=True)
         return
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     success, response = await archive_tag_in_db(tag_id)
-    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(user.role))
+    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(db_user.role))
     await callback.message.delete()
     await callback.answer("")
 
@@ -79,24 +77,22 @@ async def on_cancel_delete(callback: CallbackQuery, state: FSMContext):
     F.data == Callbacks.confirm_deletion,
     TagManagementStates.waiting_for_delete_confirmation,
     )
-async def on_confirm_delete(callback: CallbackQuery, state: FSMContext):
+async def on_confirm_delete(callback: CallbackQuery, state: FSMContext, db_user: User | None):
     state_data = await state.get_data()
     tag_id = state_data.get("tag_id")
     if not tag_id:
         await callback.answer("Ошибка: тег не найден!", show_alert=True)
         await state.clear()
         return
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     success, response = await delete_tag_from_db(tag_id)
-    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(user.role))
+    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(db_user.role))
     await callback.message.delete()
     await state.clear()
     await callback.answer("")
 
 
 @admin.callback_query(F.data == Callbacks.cancel_tag_manage_callback)
-async def on_cancel_tag_manage(callback: CallbackQuery, state: FSMContext):
-    await manage_tags(callback, state)
+async def on_cancel_tag_manage(callback: CallbackQuery, state: FSMContext, db_user: User | None):
+    await manage_tags(callback, state, db_user)
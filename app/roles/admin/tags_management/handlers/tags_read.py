@@ -8,13 +8,14 @@ from app.database.db_operations.tag_db_operations import (
     get_tag_by_id,
     unarchive_tag_in_db,
 )
-from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.database.models.user_DBO import User
 from app.keyboards import (
     inline_active_tag_list,
     inline_archived_tag_actions,
     inline_archived_tag_list,
     main_actions_keyboard,
     manage_tag_inline_keyboard,
+    parse_page_callback,
 )
 from app.roles.admin.admin import admin  # Импортируем роутер admin
 from app.roles.user.callbacks_enum import Callbacks
@@ -25,13 +26,13 @@ class TagManagementStates(StatesGroup):
     waiting_for_delete_confirmation = State()
 
 
-async def manage_tags(event: Message | CallbackQuery, state: FSMContext = None):
+async def manage_tags(
+    event: Message | CallbackQuery, state: FSMContext = None, db_user: User | None = None
+):
     logger.info("manage_tags_call")
     if state:
         await state.clear()
-    telegram_tag = f"@{event.from_user.username}" if event.from_user.username else f"@{event.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     text = "Выберите тег или создайте новый:"
     reply_markup = await inline_active_tag_list(
@@ -39,6 +40,7 @@ async def manage_tags(event: Message | CallbackQuery, state: FSMContext = None):
         on_item_create_clicked_callback=Callbacks.tag_create_callback,
         on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
         on_archived_clicked_callback=Callbacks.show_archived_in_manage_mode,
+        on_page_clicked_callback=Callbacks.tags_page_in_manage_mode,
     )
     if isinstance(event, Message):
         await event.answer(text=text, reply_markup=reply_markup)
@@ -47,9 +49,41 @@ async def manage_tags(event: Message | CallbackQuery, state: FSMContext = None):
         await event.answer("")
 
 
+@admin.callback_query(F.data.startswith(Callbacks.tags_page_in_manage_mode))
+async def paginate_tags_in_manage_mode(callback: CallbackQuery):
+    after, before = parse_page_callback(callback.data)
+    await callback.message.edit_reply_markup(
+        reply_markup=await inline_active_tag_list(
+            on_item_clicked_callback=Callbacks.tag_clicked_manage_callback,
+            on_item_create_clicked_callback=Callbacks.tag_create_callback,
+            on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
+            on_archived_clicked_callback=Callbacks.show_archived_in_manage_mode,
+            on_page_clicked_callback=Callbacks.tags_page_in_manage_mode,
+            after=after,
+            before=before,
+        ),
+    )
+    await callback.answer("")
+
+
+@admin.callback_query(F.data.startswith(Callbacks.archived_tags_page_in_manage_mode))
+async def paginate_archived_tags_in_manage_mode(callback: CallbackQuery):
+    after, before = parse_page_callback(callback.data)
+    await callback.message.edit_reply_markup(
+        reply_markup=await inline_archived_tag_list(
+            on_item_clicked_callback=Callbacks.archived_tag_clicked_manage_callback,
+            on_back_clicked_callback=Callbacks.return_back_from_archived_callback,
+            on_page_clicked_callback=Callbacks.archived_tags_page_in_manage_mode,
+            after=after,
+            before=before,
+        ),
+    )
+    await callback.answer("")
+
+
 @admin.message(F.text == labels.MANAGE_TAGS)
-async def handle_manage_tags_command(message: Message):
-    await manage_tags(message)
+async def handle_manage_tags_command(message: Message, db_user: User | None):
+    await manage_tags(message, db_user=db_user)
 
 
 @admin.callback_query(F.data == Callbacks.show_archived_in_manage_mode)
@@ -59,6 +93,7 @@ async def on_show_archived_in_manage_callback(callback: CallbackQuery):
         reply_markup=await inline_archived_tag_list(
             on_item_clicked_callback=Callbacks.archived_tag_clicked_manage_callback,
             on_back_clicked_callback=Callbacks.return_back_from_archived_callback,
+            on_page_clicked_callback=Callbacks.archived_tags_page_in_manage_mode,
         ),
     )
     await callback.answer("")
@@ -87,25 +122,25 @@ async def on_archived_tag_clicked_in_manage_mode(callback: CallbackQuery):
 
 
 @admin.callback_query(F.data.startswith(Callbacks.unarchive_tag_clicked_callback))
-async def unarchive_tag_clicked_callback(callback: CallbackQuery):
+async def unarchive_tag_clicked_callback(callback: CallbackQuery, db_user: User | None):
     try:
         tag_id = callback.data.split(":")[1]
     except IndexError:
         await callback.answer("Ошибка: тег не выбран!", show_alert=True)
         return
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     success, response = await unarchive_tag_in_db(tag_id)
-    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(user.role))
+    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(db_user.role))
     await callback.message.delete()
     await callback.answer("")
 
 
 @admin.callback_query(F.data == Callbacks.return_back_from_archived_callback)
-async def return_back_from_archived(callback: CallbackQuery, state: FSMContext):
-    await manage_tags(callback, state)
+async def return_back_from_archived(
+    callback: CallbackQuery, state: FSMContext, db_user: User | None
+):
+    await manage_tags(callback, state, db_user)
 
 
 @admin.callback_query(F.data.startswith(Callbacks.tag_clicked_manage_callback))
@@ -133,6 +168,7 @@ async def on_return_back_from_archived_tag_actions(callback: CallbackQuery):
         reply_markup=await inline_archived_tag_list(
             on_item_clicked_callback=Callbacks.archived_tag_clicked_manage_callback,
             on_back_clicked_callback=Callbacks.return_back_from_archived_callback,
+            on_page_clicked_callback=Callbacks.archived_tags_page_in_manage_mode,
         ),
     )
     await callback.answer("")
@@ -4,7 +4,7 @@ from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message, CallbackQuery
 
 from app.database.db_operations.tag_db_operations import update_tag_in_db
-from app.database.db_operations.user_db_operations import get_user_by_telegram_tag
+from app.database.models.user_DBO import User
 from app.keyboards import (
     inline_single_cancel_button,
     main_actions_keyboard,
@@ -37,11 +37,9 @@ async def on_tag_edit_callback(callback: CallbackQuery, state: FSMContext):
 
 
 @admin.message(TagEditingStates.waiting_for_new_name)
-async def process_tag_edit(message: Message, state: FSMContext):
+async def process_tag_edit(message: Message, state: FSMContext, db_user: User | None):
     new_name = message.text.strip()
-    telegram_tag = f"@{message.from_user.username}" if message.from_user.username else f"@{message.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
     if len(new_name) > 32:
         await message.answer(
@@ -59,7 +57,7 @@ async def process_tag_edit(message: Message, state: FSMContext):
     if success:
         await message.answer(
             text=response,
-            reply_markup=main_actions_keyboard(user.role)
+            reply_markup=main_actions_keyboard(db_user.role)
         )
         await state.clear()
     else:
@@ -11,13 +11,14 @@ from aiogram.types import (
 from app.config import labels
 from app.config.config import OWNERS
 from app.database.db_operations.user_db_operations import (
-    get_user_by_telegram_tag, get_user_by_telegram_id, add_or_update_user_to_admin, get_user_by_id,
-    demote_admin_to_user,
+    add_or_update_user_to_admin, get_user_by_id, demote_admin_to_user,
 )
+from app.database.models.user_DBO import User
 from app.keyboards import (
     inline_admin_list,
     inline_single_cancel_button,
     main_actions_keyboard,
+    parse_page_callback,
 )
 from app.roles.owner.owner import owner
 from app.roles.user.callbacks_enum import Callbacks
@@ -52,11 +53,9 @@ async def handle_add_admin_callback(callback: CallbackQuery, state: FSMContext):
 
 
 @owner.message(F.text == labels.MANAGE_ADMINS)
-async def manage_admins(message: Message):
+async def manage_admins(message: Message, db_user: User | None):
     logger.info("manage_admins_call")
-    telegram_id = message.from_user.id
-    user = await get_user_by_telegram_id(telegram_id)
-    if not user:
+    if not db_user:
         return
     await message.answer(
         text="Выберите админа или создайте нового:",
@@ -67,7 +66,7 @@ async def manage_admins(message: Message):
 
 
 @owner.message(AdminManagementStates.waiting_for_admin_username)
-async def process_admin_username(message: Message, state: FSMContext):
+async def process_admin_username(message: Message, state: FSMContext, db_user: User | None):
     username = message.text.strip()
     if not is_valid_telegram_username(username):
         await message.answer(
@@ -86,12 +85,10 @@ async def process_admin_username(message: Message, state: FSMContext):
         )
         return
     success, response = await add_or_update_user_to_admin(username)
-    telegram_id = message.from_user.id
-    user = await get_user_by_telegram_id(telegram_id)
-    if not user:
+    if not db_user:
         return
     if success:
-        await message.answer(text=response, reply_markup=main_actions_keyboard(user.role))
+        await message.answer(text=response, reply_markup=main_actions_keyboard(db_user.role))
         await state.clear()
     else:
         await message.answer(
@@ -141,18 +138,16 @@ async def on_admin_clicked(callback: CallbackQuery):
 
 
 @owner.callback_query(F.data.startswith(Callbacks.admin_delete_callback))
-async def on_admin_delete_callback(callback: CallbackQuery):
+async def on_admin_delete_callback(callback: CallbackQuery, db_user: User | None):
     try:
         user_id = callback.data.split(":")[1]
     except IndexError:
         await callback.answer("Ошибка: пользователь не выбран!", show_alert=True)
         return
     success, response = await demote_admin_to_user(user_id)
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+    if not db_user:
         return
-    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(user.role))
+    await callback.message.answer(text=response, reply_markup=main_actions_keyboard(db_user.role))
     await callback.message.delete()
     await callback.answer("")
 
@@ -168,16 +163,29 @@ async def on_return_to_admin_list(callback: CallbackQuery):
     await callback.answer("")
 
 
+@owner.callback_query(F.data.startswith(Callbacks.admins_page))
+async def paginate_admins(callback: CallbackQuery):
+    after, before = parse_page_callback(callback.data)
+    await callback.message.edit_reply_markup(
+        reply_markup=await inline_admin_list(
+            on_cancel_clicked_callback=Callbacks.cancel_primary_action_callback,
+            after=after,
+            before=before,
+        ),
+    )
+    await callback.answer("")
+
+
 @owner.callback_query(F.data == Callbacks.cancel_primary_action_callback)
-async def on_cancel_primary_callback(callback: CallbackQuery, state: FSMContext):
-    telegram_tag = f"@{callback.from_user.username}" if callback.from_user.username else f"@{callback.from_user.id}"
-    user = await get_user_by_telegram_tag(telegram_tag)
-    if not user:
+async def on_cancel_primary_callback(
+    callback: CallbackQuery, state: FSMContext, db_user: User | None
+):
+    if not db_user:
         return
     await callback.answer("")
     await callback.message.delete()
     await callback.message.answer(
         text="Действие отменено. Выберите новое действие с помощью кнопок под клавиатурой.",
-        reply_markup=main_actions_keyboard(user.role),
+        reply_markup=main_actions_keyboard(db_user.role),
     )
     await state.clear()
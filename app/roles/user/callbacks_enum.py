@@ -8,6 +8,7 @@ class Callbacks:
     back_to_tag_in_search_mode = "back_to_tag_in_search"
     get_recording_by_link_callback = "get_recording_by_link"
     get_recording_by_tag_callback = "get_recording_by_tag"
+    get_recording_by_search_callback = "get_recording_by_search"
     cancel_deletion = "confirm_delete"
     confirm_deletion = "cancel_delete"
     cancel_tag_manage_callback = "on_cancel_tag_manage"
@@ -29,3 +30,10 @@ class Callbacks:
     add_admin_callback = "on_add_admin"
     admin_delete_callback = "on_admin_delete"
     return_to_admin_list_callback = "on_return_to_admin_list"
+    tags_page_in_search_mode = "tags_page_search"
+    tags_page_in_recording_mode = "tags_page_recording"
+    tags_page_in_manage_mode = "tags_page_manage"
+    archived_tags_page_in_manage_mode = "archived_tags_page_manage"
+    admins_page = "admins_page"
+    search_page = "search_page"  # search_page:<skip>, сам запрос хранится в FSM
+    conferences_page = "conf_pg"  # conf_pg:<tag_id>:<skip>:<n|p>:<cursor> must fit in 64 bytes
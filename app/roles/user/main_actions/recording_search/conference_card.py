@@ -0,0 +1,225 @@
+from datetime import datetime
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from app.config.labels import (
+    BACK,
+    CANCEL,
+    NEXT_PAGE,
+    PREV_PAGE,
+    REQUEST_SCREENSHOT,
+    REQUEST_STOP_RECORDING,
+    REQUEST_TIME_PASSED,
+)
+from app.config.roles import Role
+from app.database.db_operations.recording_db_operations import get_recordings_by_conference_id
+from app.database.db_operations.search_db_operations import TAG, SearchHit
+from app.database.db_operations.tag_db_operations import get_tag_by_id
+from app.database.models.conference_DBO import Conference, ConferenceListItem
+from app.database.models.tag_DBO import Tag
+from app.database.pagination import PAGE_SIZE
+from app.keyboards import page_navigation_row
+from app.roles.user.callbacks_enum import Callbacks
+from app.roles.user.main_actions.recording_search.conference_status import (
+    ConferenceStatus,
+    get_conference_status,
+)
+
+
+async def render_conference_card(
+    conference: Conference, user_role: Role, found_by_link: bool = False
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Собирает текст и клавиатуру карточки конференции.
+
+    Все записи конференции загружаются одним запросом, а не по одной на каждый id.
+
+    Args:
+        conference (Conference): Конференция для отображения.
+        user_role (Role): Роль пользователя, от неё зависят кнопки управления.
+        found_by_link (bool): Карточка открыта поиском по ссылке, вместо "Назад" к тегу
+            показывается кнопка отмены.
+
+    Returns:
+        tuple[str, InlineKeyboardMarkup]: Текст сообщения и клавиатура.
+    """
+    tag = await get_tag_by_id(str(conference.tag_id))
+    if tag:
+        tag_name = tag.name + " (архивированный)" if tag.is_archived else tag.name
+    else:
+        tag_name = "Неизвестный тег"
+
+    conference_status = get_conference_status(conference.next_meeting_timestamp)
+    if conference.next_meeting_timestamp is not None:
+        timestamp_str = datetime.fromtimestamp(conference.next_meeting_timestamp).strftime(
+            f"%d.%m.%Y %H:%M:%S UTC+{conference.timezone}"
+        )
+    else:
+        timestamp_str = "отсутствует, так как встреча не является регулярной."
+
+    recordings = await get_recordings_by_conference_id(conference.id)
+
+    if found_by_link:
+        response = f"Найдена конференция:\nСсылка: {conference.link}"
+    else:
+        response = f"Конференция: {conference.link}"
+    response += (
+        f"\nТег: {tag_name}\nСтатус: {conference_status}\nДата следующей встречи: {timestamp_str}"
+    )
+    if not recordings:
+        response += "\n\nЗаписей пока нет."
+
+    buttons = []
+    if conference_status == ConferenceStatus.IN_PROGRESS:
+        buttons.extend(
+            [
+                InlineKeyboardButton(
+                    text=REQUEST_TIME_PASSED, callback_data=f"duration:{conference.id}"
+                ),
+                InlineKeyboardButton(
+                    text=REQUEST_SCREENSHOT, callback_data=f"screenshot:{conference.id}"
+                ),
+            ]
+        )
+        if user_role >= Role.ADMIN:
+            buttons.append(
+                InlineKeyboardButton(
+                    text=REQUEST_STOP_RECORDING, callback_data=f"stop_recording:{conference.id}"
+                )
+            )
+    for recording in recordings:
+        recording_date = datetime.fromtimestamp(recording.timestamp).strftime("%d.%m.%Y %H:%M")
+        buttons.append(
+            InlineKeyboardButton(text=f"Скачать запись {recording_date}", url=recording.link)
+        )
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[[btn] for btn in buttons])
+    if user_role >= Role.ADMIN:
+        keyboard.inline_keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text="🗑️ Удалить конференцию",
+                    callback_data=f"{Callbacks.delete_conference_callback}:{conference.id}",
+                )
+            ]
+        )
+    if found_by_link:
+        keyboard.inline_keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=CANCEL, callback_data=Callbacks.cancel_primary_action_callback
+                )
+            ]
+        )
+    else:
+        keyboard.inline_keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=BACK,
+                    callback_data=f"{Callbacks.back_to_tag_in_search_mode}:{conference.tag_id}",
+                )
+            ]
+        )
+    return response, keyboard
+
+
+def render_conference_list(
+    tag: Tag,
+    conferences: list[ConferenceListItem],
+    skip: int = 0,
+    has_prev: bool = False,
+    has_next: bool = False,
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Собирает текст и клавиатуру одной страницы списка конференций с тегом.
+
+    Args:
+        tag (Tag): Тег, по которому найдены конференции.
+        conferences (list[ConferenceListItem]): Проекции конференций из get_conference_page_by_tag.
+        skip (int): Сколько конференций на предыдущих страницах, с него идёт нумерация.
+        has_prev (bool): Есть ли предыдущая страница.
+        has_next (bool): Есть ли следующая страница.
+
+    Returns:
+        tuple[str, InlineKeyboardMarkup]: Текст сообщения и клавиатура.
+    """
+    response = f"Найденные конференции с тегом '{tag.name}':\n\n"
+    buttons = []
+    for i, conference in enumerate(conferences, skip + 1):
+        conference_status = get_conference_status(conference.next_meeting_timestamp)
+        if conference.next_meeting_timestamp is not None:
+            meeting_date = datetime.fromtimestamp(conference.next_meeting_timestamp)
+            timestamp_str = meeting_date.strftime(f"%d.%m.%Y %H:%M:%S UTC+{conference.timezone}")
+            short_date = meeting_date.strftime("%d.%m.%Y %H:%M")
+        else:
+            timestamp_str = "отсутствует, так как встреча не является регулярной."
+            short_date = "не регулярная"
+        response += (
+            f"{i}. Конференция: {conference.link}\nДата: {timestamp_str}\n"
+            f"Статус: {conference_status}\nЗаписей: {conference.recordings_count}\n\n"
+        )
+        clean_link = (
+            conference.link.replace("https://", "").replace("http://", "").replace("www.", "")
+        )
+        buttons.append(
+            InlineKeyboardButton(
+                text=f"{i}. {clean_link}, {short_date}",
+                callback_data=f"open_conference:{conference.id}",
+            )
+        )
+
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[[btn] for btn in buttons])
+    navigation = page_navigation_row(
+        f"{Callbacks.conferences_page}:{tag.id}:{skip}", conferences, has_prev, has_next
+    )
+    if navigation:
+        keyboard.inline_keyboard.append(navigation)
+    keyboard.inline_keyboard.append(
+        [InlineKeyboardButton(text=CANCEL, callback_data=Callbacks.cancel_primary_action_callback)]
+    )
+    return response.strip(), keyboard
+
+
+def render_search_results(
+    query: str, hits: list[SearchHit], skip: int, has_prev: bool = False, has_next: bool = False
+) -> tuple[str, InlineKeyboardMarkup]:
+    """Собирает текст и клавиатуру одной страницы результатов поиска по фрагменту.
+
+    Args:
+        query (str): Введённый фрагмент.
+        hits (list[SearchHit]): Результаты страницы из search_catalogue.
+        skip (int): Сколько результатов пропущено до этой страницы.
+        has_prev (bool): Есть ли предыдущая страница.
+        has_next (bool): Есть ли следующая страница.
+
+    Returns:
+        tuple[str, InlineKeyboardMarkup]: Текст сообщения и клавиатура.
+    """
+    response = f"Результаты поиска по '{query}':"
+    buttons = []
+    for i, hit in enumerate(hits, skip + 1):
+        if hit.kind == TAG:
+            text = f"{i}. 🏷️ {hit.title}"
+            callback_data = f"{Callbacks.tag_clicked_in_search_mode_callback}:{hit.id}"
+        else:
+            text = f"{i}. 🔗 {hit.title}"
+            callback_data = f"open_conference:{hit.id}"
+        buttons.append(InlineKeyboardButton(text=text, callback_data=callback_data))
+
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[[btn] for btn in buttons])
+    navigation = []
+    if has_prev:
+        navigation.append(
+            InlineKeyboardButton(
+                text=PREV_PAGE, callback_data=f"{Callbacks.search_page}:{max(skip - PAGE_SIZE, 0)}"
+            )
+        )
+    if has_next:
+        navigation.append(
+            InlineKeyboardButton(
+                text=NEXT_PAGE, callback_data=f"{Callbacks.search_page}:{skip + PAGE_SIZE}"
+            )
+        )
+    if navigation:
+        keyboard.inline_keyboard.append(navigation)
+    keyboard.inline_keyboard.append(
+        [InlineKeyboardButton(text=CANCEL, callback_data=Callbacks.cancel_primary_action_callback)]
+    )
+    return response, keyboard
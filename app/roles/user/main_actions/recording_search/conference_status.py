@@ -1,3 +1,5 @@
+from datetime import datetime
+from datetime import timezone as datetime_timezone
 from enum import StrEnum
 
 
@@ -5,3 +7,12 @@ class ConferenceStatus(StrEnum):
     PLANNED = "запланирована 🗓️"
     IN_PROGRESS = "записывается 🎥"
     FINISHED = "завершилась 🏁"
+
+
+def get_conference_status(next_meeting_timestamp: int | None) -> ConferenceStatus:
+    """Определяет статус конференции по времени следующей встречи."""
+    if next_meeting_timestamp is None:
+        return ConferenceStatus.FINISHED
+    if next_meeting_timestamp <= int(datetime.now(datetime_timezone.utc).timestamp()):
+        return ConferenceStatus.IN_PROGRESS
+    return ConferenceStatus.PLANNED
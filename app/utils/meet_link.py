@@ -0,0 +1,38 @@
+import re
+from typing import Optional
+from urllib.parse import urlsplit
+
+MEET_HOST = "meet.google.com"
+# Код встречи Google Meet: xxx-yyyy-zzz, в ссылках встречается и без дефисов
+_MEET_CODE = re.compile(r"^([a-z]{3})-?([a-z]{4})-?([a-z]{3})$")
+
+
+def extract_meet_code(link: str) -> Optional[str]:
+    """
+    Извлекает канонический код встречи из ссылки Google Meet.
+
+    Схема (http/https), www., регистр, query-параметры (?authuser=0, ?hs=...) и фрагмент
+    не влияют на результат: https://meet.google.com/abc-defg-hij,
+    meet.google.com/ABCDEFGHIJ?authuser=0 и http://www.meet.google.com/abc-defg-hij/
+    дают код abc-defg-hij.
+
+    Returns:
+        Optional[str]: Код встречи или None, если это не ссылка на встречу Google Meet.
+    """
+    link = link.strip()
+    if "://" not in link:
+        link = f"https://{link}"
+    parts = urlsplit(link)
+    host = (parts.hostname or "").removeprefix("www.")
+    if host != MEET_HOST:
+        return None
+    code = parts.path.strip("/").lower()
+    match = _MEET_CODE.match(code)
+    if match:
+        return "-".join(match.groups())
+    # Встречи с пользовательским названием (meet.google.com/lookup/...) сохраняются как есть
+    return code if len(code) >= 8 else None
+
+
+def canonical_meet_link(code: str) -> str:
+    return f"https://{MEET_HOST}/{code}"
@@ -0,0 +1,54 @@
+from bson import ObjectId
+
+from app.config.config import ROLE_CACHE_SIZE, ROLE_CACHE_TTL
+from app.config.roles import Role
+from app.database.models.user_DBO import User
+from app.utils.cache import TTLCache
+from app.utils.logger import logger
+
+# telegram_id -> (telegram_tag, User): пользователь вместе с ролью, которую проверяет RoleFilter
+role_cache = TTLCache(maxsize=ROLE_CACHE_SIZE, ttl=ROLE_CACHE_TTL)
+
+
+def get_cached_user(telegram_id: int, telegram_tag: str) -> User | None:
+    """Возвращает закэшированного пользователя или None при промахе.
+
+    Запись, сохранённая под другим тегом (пользователь сменил username), считается промахом:
+    пользователь ищется в БД по тегу.
+    """
+    entry = role_cache.get(telegram_id)
+    if entry is None or entry[0] != telegram_tag:
+        return None
+    return entry[1]
+
+
+def get_cached_role(telegram_id: int, telegram_tag: str) -> Role | None:
+    """Возвращает закэшированную роль пользователя или None при промахе."""
+    user = get_cached_user(telegram_id, telegram_tag)
+    return Role(user.role) if user is not None else None
+
+
+def cache_user(telegram_id: int, telegram_tag: str, user: User) -> None:
+    role_cache.set(telegram_id, (telegram_tag, user))
+
+
+def invalidate_role(
+    telegram_id: int | None = None,
+    telegram_tag: str | None = None,
+    user_id: ObjectId | None = None,
+) -> None:
+    """Сбрасывает закэшированного пользователя по telegram_id, telegram_tag и/или _id.
+
+    Поиск по тегу нужен для пользователей, добавленных владельцем до первого /start,
+    у которых в БД ещё нет telegram_id; поиск по _id — для изменений, где известен только он.
+    """
+    if telegram_id is not None:
+        role_cache.pop(telegram_id)
+    if telegram_tag is not None or user_id is not None:
+        for key, (cached_tag, user) in list(role_cache.items()):
+            if cached_tag == telegram_tag or user.id == user_id:
+                role_cache.pop(key)
+    logger.debug(
+        f"Кэш ролей сброшен для id={telegram_id}, tag={telegram_tag}, _id={user_id}: "
+        f"{role_cache.stats()}"
+    )
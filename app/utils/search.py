@@ -0,0 +1,46 @@
+import re
+
+# Поиск по фрагменту идёт по полю search_terms: нормализованный текст целиком и его
+# отдельные слова. Запрос — якорный префикс ^fragment, который MongoDB превращает в
+# диапазон по индексу, поэтому стоимость поиска не зависит от размера коллекции.
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def normalize(text: str) -> str:
+    """Приводит текст к виду, в котором он хранится в search_terms."""
+    return " ".join(text.casefold().replace("ё", "е").split())
+
+
+def search_terms(text: str) -> list[str]:
+    """
+    Строит ключи поиска: полный нормализованный текст, он же без разделителей и каждое
+    слово отдельно. Для кода встречи abc-defg-hij это abc-defg-hij, abcdefghij, abc,
+    defg и hij, поэтому встреча находится и по фрагменту из середины кода.
+    """
+    full = normalize(text)
+    words = [word for word in _SEPARATORS.split(full) if word]
+    terms = [full, "".join(words), *words]
+    return list(dict.fromkeys(term for term in terms if term))
+
+
+def prefix_filter(query: str) -> dict:
+    """Фильтр по search_terms, начинающимся с нормализованного запроса."""
+    return {"search_terms": {"$regex": f"^{re.escape(normalize(query))}"}}
+
+
+def rank(query: str, text: str) -> int:
+    """
+    Ранг совпадения запроса с текстом, меньше — лучше: 0 — текст совпал целиком,
+    1 — текст начинается с запроса, 2 — совпало слово, 3 — слово начинается с запроса.
+    """
+    query = normalize(query)
+    full = normalize(text)
+    words = [word for word in _SEPARATORS.split(full) if word]
+    whole = (full, "".join(words))
+    if query in whole:
+        return 0
+    if any(form.startswith(query) for form in whole):
+        return 1
+    if query in words:
+        return 2
+    return 3
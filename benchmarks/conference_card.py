@@ -0,0 +1,82 @@
+"""Латентность загрузки записей для карточки конференции в зависимости от их количества.
+
+Сравнивает старый путь (get_recording_by_id на каждый id из conference.recordings)
+с одним запросом get_recordings_by_conference_id.
+
+Запуск против поднятой MongoDB (по умолчанию используется отдельная БД conferee_bench,
+которая удаляется после замера):
+
+    MONGODB_USERNAME=... MONGODB_PASSWORD=... MONGODB_HOST=localhost \
+        python -m benchmarks.conference_card
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("MONGODB_DATABASE", "conferee_bench")
+
+from app.database.database import db  # noqa: E402
+from app.database.db_operations.recording_db_operations import (  # noqa: E402
+    get_recording_by_id,
+    get_recordings_by_conference_id,
+)
+from app.database.models.conference_DBO import Conference  # noqa: E402
+from app.database.models.recording_DBO import Recording  # noqa: E402
+from app.database.models.tag_DBO import Tag  # noqa: E402
+
+RECORDING_COUNTS = (0, 10, 50, 200, 500)
+REPEATS = 20
+
+
+async def create_conference(recordings_count: int) -> Conference:
+    tag = Tag(name=f"bench-{recordings_count}")
+    conference = Conference(
+        tag_id=tag.id, link=f"https://meet.google.com/bench-{recordings_count}", timezone=3
+    )
+    recordings = [
+        Recording(conference_id=conference.id, link=f"http://bench/{i}.mp4", timestamp=i)
+        for i in range(recordings_count)
+    ]
+    conference.recordings = [recording.id for recording in recordings]
+    await db.db.tags.insert_one(tag.model_dump(by_alias=True))
+    await db.db.conferences.insert_one(conference.model_dump(by_alias=True))
+    if recordings:
+        await db.db.recordings.insert_many([r.model_dump(by_alias=True) for r in recordings])
+    return conference
+
+
+async def per_id(conference: Conference):
+    return [await get_recording_by_id(str(recording_id)) for recording_id in conference.recordings]
+
+
+async def batched(conference: Conference):
+    return await get_recordings_by_conference_id(conference.id)
+
+
+async def measure(loader, conference: Conference) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        await loader(conference)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def main():
+    await db.setup_indexes()
+    print(f"{'recordings':>10} | {'per id, ms':>10} | {'batched, ms':>11} | {'speedup':>7}")
+    try:
+        for count in RECORDING_COUNTS:
+            conference = await create_conference(count)
+            old = await measure(per_id, conference)
+            new = await measure(batched, conference)
+            speedup = old / new if new else float("inf")
+            print(f"{count:>10} | {old:>10.2f} | {new:>11.2f} | {speedup:>6.1f}x")
+    finally:
+        await db.client.drop_database(db.db.name)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+"""Пропускная способность обращений к БД, которые делают обработчики бота.
+
+Для каждого сценария выполняется та же последовательность db_operations, что и в
+обработчике (без Telegram API), из CONCURRENCY конкурентных задач. Кэш чтений
+сбрасывается перед каждым вызовом, чтобы мерить само хранилище. Печатаются операции
+в секунду и перцентили латентности.
+
+Запуск с in-memory бэкендом (mongod не нужен) и против MongoDB; разница между ними —
+доля латентности обработчика, которую занимает база. user_db_operations импортирует
+app.bot, поэтому нужен TOKEN_BOT в формате токена Telegram; запросов к Telegram бенчмарк
+не делает, подойдёт любое значение вида 123:abc:
+
+    TOKEN_BOT=123:abc DB_BACKEND=memory python -m benchmarks.handler_db
+    TOKEN_BOT=123:abc MONGODB_USERNAME=... MONGODB_PASSWORD=... MONGODB_HOST=localhost \
+        python -m benchmarks.handler_db
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("MONGODB_DATABASE", "conferee_bench")
+
+from app.config.config import DB_BACKEND  # noqa: E402
+from app.database.cache import (  # noqa: E402
+    conference_cache,
+    conference_list_cache,
+    tag_cache,
+    tag_list_cache,
+)
+from app.database.database import db  # noqa: E402
+from app.database.db_operations.conference_db_operations import (  # noqa: E402
+    add_conference_to_db,
+    add_recording_to_conference,
+    get_conference_by_id,
+    get_conference_by_link,
+    get_conference_page_by_tag,
+)
+from app.database.db_operations.recording_db_operations import (  # noqa: E402
+    add_recording_to_db,
+    get_recordings_by_conference_id,
+)
+from app.database.db_operations.search_db_operations import search_catalogue  # noqa: E402
+from app.database.db_operations.tag_db_operations import (  # noqa: E402
+    add_tag_to_db,
+    get_tag_by_id,
+)
+from app.database.db_operations.user_db_operations import handle_user_on_start  # noqa: E402
+
+TAGS = 50
+CONFERENCES_PER_TAG = 20
+RECORDINGS_PER_CONFERENCE = 5
+CONCURRENCY = 20
+CALLS_PER_SCENARIO = 2_000
+
+
+def meet_link(tag: int, conference: int) -> str:
+    """Уникальная ссылка Google Meet: номер конференции в 26-ричной записи буквами."""
+    number, letters = tag * CONFERENCES_PER_TAG + conference, []
+    for _ in range(10):
+        number, digit = divmod(number, 26)
+        letters.append(chr(ord("a") + digit))
+    code = "".join(reversed(letters))
+    return f"https://meet.google.com/{code[:3]}-{code[3:7]}-{code[7:]}"
+
+
+async def seed() -> tuple[list[str], list[str]]:
+    tag_ids, conference_ids = [], []
+    for t in range(TAGS):
+        await add_tag_to_db(f"bench tag {t}")
+        tag = await db.db.tags.find_one({"name": f"bench tag {t}"}, {"_id": 1})
+        tag_ids.append(str(tag["_id"]))
+        for c in range(CONFERENCES_PER_TAG):
+            await add_conference_to_db(meet_link(t, c), tag["_id"], int(time.time()), 3, 1)
+            conference = await get_conference_by_link(meet_link(t, c), fields=("_id",))
+            conference_ids.append(str(conference.id))
+            for r in range(RECORDINGS_PER_CONFERENCE):
+                _, _, recording_id = await add_recording_to_db(
+                    conference.id, f"http://bench/{t}/{c}/{r}.mp4"
+                )
+                await add_recording_to_conference(conference.id, recording_id)
+    return tag_ids, conference_ids
+
+
+def clear_caches() -> None:
+    for cache in (tag_cache, tag_list_cache, conference_cache, conference_list_cache):
+        cache.clear()
+
+
+def scenarios(tag_ids: list[str], conference_ids: list[str]):
+    """Имя обработчика -> корутина с его обращениями к БД для i-го вызова."""
+
+    async def tag_list(i):
+        await db.get_active_tags_page()
+
+    async def tag_selection(i):
+        tag_id = tag_ids[i % len(tag_ids)]
+        await get_tag_by_id(tag_id)
+        await get_conference_page_by_tag(tag_id)
+
+    async def conference_card(i):
+        conference = await get_conference_by_id(conference_ids[i % len(conference_ids)])
+        await get_tag_by_id(str(conference.tag_id))
+        await get_recordings_by_conference_id(conference.id)
+
+    async def meet_link_search(i):
+        await get_conference_by_link(meet_link(i % TAGS, i % CONFERENCES_PER_TAG))
+
+    async def fragment_search(i):
+        await search_catalogue(f"bench tag {i % TAGS}")
+
+    async def start(i):
+        await handle_user_on_start(f"@bench{i % 500}", 1_000_000 + i % 500)
+
+    return {
+        "get_recording_by_tag": tag_list,
+        "process_tag_selection": tag_selection,
+        "handle_conference_button": conference_card,
+        "process_meet_link": meet_link_search,
+        "process_search_query": fragment_search,
+        "cmd_start": start,
+    }
+
+
+async def run_scenario(scenario) -> tuple[float, list[float]]:
+    """Возвращает операций в секунду и латентности вызовов в мс."""
+    timings: list[float] = []
+    counter = iter(range(CALLS_PER_SCENARIO))
+
+    async def worker():
+        for i in counter:
+            clear_caches()
+            started = time.perf_counter()
+            await scenario(i)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return CALLS_PER_SCENARIO / (time.perf_counter() - started), timings
+
+
+async def main():
+    await db.setup_indexes()
+    try:
+        tag_ids, conference_ids = await seed()
+        print(f"Бэкенд: {DB_BACKEND}, {CONCURRENCY} конкурентных задач")
+        header = f"{'handler':>26} | {'ops/s':>9} | {'p50, ms':>8} | {'p99, ms':>8}"
+        print(header)
+        print("-" * len(header))
+        for name, scenario in scenarios(tag_ids, conference_ids).items():
+            throughput, timings = await run_scenario(scenario)
+            p99 = statistics.quantiles(timings, n=100)[98]
+            print(
+                f"{name:>26} | {throughput:>9.0f} | "
+                f"{statistics.median(timings):>8.3f} | {p99:>8.3f}"
+            )
+    finally:
+        await db.client.drop_database(db.db.name)
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
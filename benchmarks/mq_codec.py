@@ -0,0 +1,91 @@
+"""Кодирование и разбор сообщений RabbitMQ: str(dict) со строковыми заменами против
+формата версии 1 (app.rabbitmq.codec).
+
+Для типичного ответа рекордера печатает время кодирования и разбора одного сообщения
+и проверяет, что каждый способ переживает кавычку в ссылке. Брокер и MongoDB не нужны,
+но импорт app.rabbitmq читает переменные окружения бота (.env):
+
+    python -m benchmarks.mq_codec
+"""
+
+import json
+import timeit
+
+from app.rabbitmq import codec
+from app.rabbitmq.responses import Req, Res
+
+REPEATS = 5
+NUMBER = 20_000
+
+RESPONSES = {
+    "succeded": codec.Response(
+        Res.SUCCEDED,
+        "https://meet.google.com/abc-defg-hij",
+        -1,
+        "/recordings/abc-defg-hij/2025-01-01T10-00-00.mp4",
+    ),
+    "time": codec.Response(Req.TIME, "https://meet.google.com/abc-defg-hij", 123456789, 3725),
+}
+QUOTED = codec.Response(Res.ERROR, "https://meet.google.com/abc-defg-hij?authuser=o'neil")
+
+
+def legacy_encode(message: codec.Message) -> bytes:
+    """Прежний responses.prepare."""
+    return str(
+        {
+            "type": message.type.value,
+            "body": message.body,
+            "user_id": message.user_id,
+            "filepath": message.filepath,
+        }
+    ).encode()
+
+
+def legacy_decode(raw: bytes) -> dict:
+    """Прежний разбор в handle_responses."""
+    body = raw.decode().replace("'", '"').replace('b"', '"')
+    body = body.replace("None", "null")
+    return json.loads(body)
+
+
+def measure(func, *args) -> float:
+    """Лучшее из REPEATS время одного вызова, мкс."""
+    return min(timeit.repeat(lambda: func(*args), number=NUMBER, repeat=REPEATS)) / NUMBER * 1e6
+
+
+def survives_quote(encode, decode) -> bool:
+    try:
+        decoded = decode(encode(QUOTED))
+    except Exception:
+        return False
+    body = decoded.body if isinstance(decoded, codec.Message) else decoded["body"]
+    return body == QUOTED.body
+
+
+def main():
+    header = f"{'message':>9} | {'method':>22} | {'encode, us':>10} | {'decode, us':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, message in RESPONSES.items():
+        legacy, current = legacy_encode(message), codec.encode(message)
+        rows = (
+            ("str(dict) + replace", legacy_encode, legacy_decode, legacy),
+            ("codec v1", codec.encode, codec.decode_response, current),
+            ("codec, legacy input", legacy_encode, codec.decode_response, legacy),
+        )
+        for method, encode, decode, raw in rows:
+            print(
+                f"{name:>9} | {method:>22} | {measure(encode, message):>10.2f} | "
+                f"{measure(decode, raw):>10.2f}"
+            )
+    print()
+    print(f"Кавычка в ссылке, str(dict) + replace: {survives_quote(legacy_encode, legacy_decode)}")
+    print(f"Кавычка в ссылке, codec v1: {survives_quote(codec.encode, codec.decode_response)}")
+    print(
+        "Кавычка в ссылке, codec, legacy input: "
+        f"{survives_quote(legacy_encode, codec.decode_response)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
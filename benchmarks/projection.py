@@ -0,0 +1,92 @@
+"""Экономия от проекций при чтении конференции с большим массивом записей.
+
+Для каждого размера массива recordings сравнивает чтение всего документа, чтение по
+умолчанию (без recordings) и чтение одного поля link: размер ответа в байтах, время
+декодирования BSON и полное время find_one.
+
+Запуск против поднятой MongoDB (по умолчанию используется отдельная БД conferee_bench,
+которая удаляется после замера):
+
+    MONGODB_USERNAME=... MONGODB_PASSWORD=... MONGODB_HOST=localhost \
+        python -m benchmarks.projection
+"""
+
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("MONGODB_DATABASE", "conferee_bench")
+
+from bson import ObjectId, decode  # noqa: E402
+from bson.codec_options import CodecOptions  # noqa: E402
+from bson.raw_bson import RawBSONDocument  # noqa: E402
+
+from app.database.database import db  # noqa: E402
+from app.database.projection import build_projection  # noqa: E402
+
+RECORDING_COUNTS = (0, 100, 1_000, 10_000, 50_000)
+REPEATS = 20
+
+PROJECTIONS = {
+    "full": None,
+    "default": build_projection("conferences"),
+    "link": build_projection("conferences", ("link",)),
+}
+
+
+async def create_conference(recordings_count: int) -> ObjectId:
+    result = await db.db.conferences.insert_one(
+        {
+            "tag_id": ObjectId(),
+            "link": f"https://meet.google.com/bench-{recordings_count}",
+            "next_meeting_timestamp": int(time.time()),
+            "recordings": [ObjectId() for _ in range(recordings_count)],
+            "recordings_count": recordings_count,
+            "timezone": 3,
+            "periodicity": 1,
+        }
+    )
+    return result.inserted_id
+
+
+async def measure(conference_id: ObjectId, projection) -> tuple[int, float, float]:
+    """Возвращает размер ответа в байтах, медиану декодирования и медиану find_one в мс."""
+    raw_collection = db.db.conferences.with_options(
+        codec_options=CodecOptions(document_class=RawBSONDocument)
+    )
+    raw = await raw_collection.find_one({"_id": conference_id}, projection)
+    decode_timings, query_timings = [], []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        decode(raw.raw)
+        decode_timings.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await db.db.conferences.find_one({"_id": conference_id}, projection)
+        query_timings.append((time.perf_counter() - started) * 1000)
+    return len(raw.raw), statistics.median(decode_timings), statistics.median(query_timings)
+
+
+async def main():
+    header = (
+        f"{'recordings':>10} | {'projection':>10} | {'bytes':>9} | "
+        f"{'decode, ms':>10} | {'find_one, ms':>12}"
+    )
+    print(header)
+    print("-" * len(header))
+    try:
+        for count in RECORDING_COUNTS:
+            conference_id = await create_conference(count)
+            for name, projection in PROJECTIONS.items():
+                size, decode_ms, query_ms = await measure(conference_id, projection)
+                print(
+                    f"{count:>10} | {name:>10} | {size:>9} | "
+                    f"{decode_ms:>10.3f} | {query_ms:>12.3f}"
+                )
+    finally:
+        await db.client.drop_database(db.db.name)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,207 @@
+"""Проверка планов запросов: каждый запрос из app/database должен идти по индексу.
+
+Создаёт индексы из app/database/indexes.py, заполняет коллекции тестовыми документами
+и запускает explain() для фильтров, которые используют db_operations и Database.
+Завершается с кодом 1, если в выигравшем плане хотя бы одного запроса есть COLLSCAN.
+
+Запуск против поднятой MongoDB (по умолчанию используется отдельная БД conferee_bench,
+которая удаляется после проверки):
+
+    MONGODB_USERNAME=... MONGODB_PASSWORD=... MONGODB_HOST=localhost \
+        python -m benchmarks.query_plans
+"""
+
+import asyncio
+import os
+import sys
+
+os.environ.setdefault("MONGODB_DATABASE", "conferee_bench")
+
+from bson import ObjectId  # noqa: E402
+
+from app.config.roles import Role  # noqa: E402
+from app.database.database import db  # noqa: E402
+from app.database.db_operations.conference_db_operations import (  # noqa: E402
+    conference_list_pipeline,
+)
+from app.utils.search import prefix_filter, search_terms  # noqa: E402
+
+DOCUMENTS_PER_COLLECTION = 200
+
+TAG_ID = ObjectId()
+CONFERENCE_ID = ObjectId()
+CURSOR_ID = ObjectId()
+
+# (запрос, коллекция, фильтр, сортировка). Для update_one/delete_one проверяется тот же
+# фильтр через find: план выбора документа у них одинаковый.
+FIND_QUERIES = [
+    ("tags: по _id", "tags", {"_id": TAG_ID}, None),
+    ("tags: активные", "tags", {"is_archived": False}, None),
+    ("tags: архивные", "tags", {"is_archived": True}, None),
+    (
+        "tags: страница активных",
+        "tags",
+        {"is_archived": False, "_id": {"$gt": CURSOR_ID}},
+        [("_id", 1)],
+    ),
+    (
+        "tags: страница архивных",
+        "tags",
+        {"is_archived": True, "_id": {"$lt": CURSOR_ID}},
+        [("_id", -1)],
+    ),
+    (
+        "tags: поиск по фрагменту",
+        "tags",
+        {**prefix_filter("bench-1"), "is_archived": False},
+        None,
+    ),
+    ("users: по telegram_tag", "users", {"telegram_tag": "@bench"}, None),
+    ("users: по telegram_id", "users", {"telegram_id": 1}, None),
+    ("users: по _id", "users", {"_id": ObjectId()}, None),
+    ("users: админы", "users", {"role": Role.ADMIN.value}, None),
+    ("users: владельцы", "users", {"role": Role.OWNER.value}, None),
+    (
+        "users: страница админов",
+        "users",
+        {"role": Role.ADMIN.value, "_id": {"$gt": CURSOR_ID}},
+        [("_id", 1)],
+    ),
+    (
+        "users: тег без telegram_id",
+        "users",
+        {"telegram_tag": "@bench", "telegram_id": {"$eq": None}},
+        None,
+    ),
+    ("conferences: по _id", "conferences", {"_id": CONFERENCE_ID}, None),
+    ("conferences: по ссылке", "conferences", {"link": "https://meet.google.com/bench-0"}, None),
+    ("conferences: по коду встречи", "conferences", {"meet_code": "abc-defg-hij"}, None),
+    ("conferences: по тегу", "conferences", {"tag_id": TAG_ID}, None),
+    ("conferences: поиск по фрагменту", "conferences", prefix_filter("bench"), None),
+    ("recordings: по _id", "recordings", {"_id": ObjectId()}, None),
+    (
+        "recordings: конференции",
+        "recordings",
+        {"conference_id": CONFERENCE_ID},
+        [("timestamp", 1)],
+    ),
+    ("recordings: по встрече", "recordings", {"meeting_id": ObjectId()}, None),
+    ("scheduled_tasks: по ссылке", "scheduled_tasks", {"link": "https://bench"}, None),
+    ("scheduled_tasks: окно", "scheduled_tasks", {"due_at": {"$lte": 1.0}}, [("due_at", 1)]),
+    (
+        "scheduled_tasks: конференций",
+        "scheduled_tasks",
+        {"conference_id": {"$in": [CONFERENCE_ID]}},
+        None,
+    ),
+    (
+        "outbox: незахваченные",
+        "outbox",
+        {"$or": [{"claimed_until": None}, {"claimed_until": {"$lt": 1.0}}]},
+        [("_id", 1)],
+    ),
+    ("outbox: захваченные", "outbox", {"claim": ObjectId()}, [("_id", 1)]),
+]
+
+AGGREGATE_QUERIES = [
+    ("conferences: список тега", "conferences", conference_list_pipeline(str(TAG_ID))),
+    (
+        "conferences: страница тега",
+        "conferences",
+        conference_list_pipeline(str(TAG_ID), limit=11, before=str(CURSOR_ID)),
+    ),
+]
+
+
+async def seed():
+    n = DOCUMENTS_PER_COLLECTION
+    roles = [Role.USER.value, Role.ADMIN.value, Role.OWNER.value]
+    await db.db.tags.insert_many(
+        [
+            {
+                "name": f"bench-{i}",
+                "is_archived": i % 2 == 0,
+                "search_terms": search_terms(f"bench-{i}"),
+            }
+            for i in range(n)
+        ]
+    )
+    await db.db.users.insert_many(
+        [{"telegram_tag": f"@bench{i}", "telegram_id": i, "role": roles[i % 3]} for i in range(n)]
+    )
+    await db.db.conferences.insert_many(
+        [
+            {
+                "link": f"https://meet.google.com/bench-{i}",
+                "meet_code": f"bench-{i}",
+                "search_terms": search_terms(f"bench-{i}"),
+                "tag_id": ObjectId(),
+                "recordings": [],
+            }
+            for i in range(n)
+        ]
+    )
+    await db.db.recordings.insert_many(
+        [{"conference_id": ObjectId(), "meeting_id": ObjectId(), "timestamp": i} for i in range(n)]
+    )
+
+
+def plan_stages(plan) -> set[str]:
+    """Собирает стадии плана, не заходя в отвергнутые планировщиком варианты."""
+    stages = set()
+    if isinstance(plan, dict):
+        for key, value in plan.items():
+            if key == "rejectedPlans":
+                continue
+            if key == "stage" and isinstance(value, str):
+                stages.add(value)
+            else:
+                stages |= plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            stages |= plan_stages(item)
+    return stages
+
+
+async def explain_find(collection: str, query: dict, sort) -> dict:
+    cursor = db.db[collection].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    return await cursor.explain()
+
+
+async def explain_aggregate(collection: str, pipeline: list) -> dict:
+    return await db.db.command(
+        {"explain": {"aggregate": collection, "pipeline": pipeline, "cursor": {}}}
+    )
+
+
+async def main() -> int:
+    await db.setup_indexes()
+    failed = []
+    try:
+        await seed()
+        results = [
+            (name, await explain_find(collection, query, sort))
+            for name, collection, query, sort in FIND_QUERIES
+        ] + [
+            (name, await explain_aggregate(collection, pipeline))
+            for name, collection, pipeline in AGGREGATE_QUERIES
+        ]
+        for name, explained in results:
+            stages = plan_stages(explained)
+            status = "COLLSCAN" if "COLLSCAN" in stages else "ok"
+            if status != "ok":
+                failed.append(name)
+            print(f"{status:>8} | {name} | {', '.join(sorted(stages))}")
+    finally:
+        await db.client.drop_database(db.db.name)
+    if failed:
+        print(f"Запросы без индекса: {len(failed)}")
+        return 1
+    print("Все запросы используют индексы")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,113 @@
+"""Сборка моделей из документов БД: валидация Pydantic против лёгких *ListItem со __slots__.
+
+MongoDB не нужна: документы генерируются в памяти в том виде, в котором их возвращает Motor.
+Для каждого пути печатается медианное время сборки DOCUMENTS моделей, количество
+выделенных при этом блоков памяти и пик памяти по tracemalloc.
+
+    python -m benchmarks.read_models
+"""
+
+import os
+import statistics
+import time
+import tracemalloc
+
+os.environ.setdefault("MONGODB_DATABASE", "conferee_bench")
+
+from bson import ObjectId  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.config.roles import Role  # noqa: E402
+from app.database.models.conference_DBO import Conference, ConferenceListItem  # noqa: E402
+from app.database.models.recording_DBO import Recording, RecordingListItem  # noqa: E402
+from app.database.models.tag_DBO import Tag, TagListItem  # noqa: E402
+from app.database.models.user_DBO import User, UserListItem  # noqa: E402
+
+DOCUMENTS = 10_000
+REPEATS = 5
+
+
+def make_documents():
+    """Возвращает пары (модель с валидацией, лёгкая модель) -> документы."""
+    tag_id = ObjectId()
+    conference_id = ObjectId()
+    return {
+        (Tag, TagListItem): [
+            {"_id": ObjectId(), "name": f"tag-{i}", "is_archived": False} for i in range(DOCUMENTS)
+        ],
+        (User, UserListItem): [
+            {
+                "_id": ObjectId(),
+                "telegram_tag": f"@user{i}",
+                "telegram_id": i,
+                "role": Role.ADMIN.value,
+            }
+            for i in range(DOCUMENTS)
+        ],
+        (Recording, RecordingListItem): [
+            {
+                "_id": ObjectId(),
+                "conference_id": conference_id,
+                "link": f"http://bench/{i}.mp4",
+                "timestamp": 1_700_000_000 + i,
+            }
+            for i in range(DOCUMENTS)
+        ],
+        (Conference, ConferenceListItem): [
+            {
+                "_id": ObjectId(),
+                "tag_id": tag_id,
+                "link": f"https://meet.google.com/bench-{i}",
+                "next_meeting_timestamp": 1_700_000_000 + i,
+                "recordings": [ObjectId() for _ in range(5)],
+                "recordings_count": 5,
+                "timezone": 3,
+                "periodicity": 1,
+            }
+            for i in range(DOCUMENTS)
+        ],
+    }
+
+
+def build(model, documents):
+    if issubclass(model, BaseModel):
+        return [model(**document) for document in documents]
+    return [model(document) for document in documents]
+
+
+def measure_time(model, documents) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        build(model, documents)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure_allocations(model, documents) -> tuple[int, int]:
+    """Возвращает количество выделенных блоков, оставшихся после сборки, и пик памяти в КиБ."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    built = build(model, documents)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del built
+    return blocks, peak // 1024
+
+
+def main():
+    header = f"{'model':>18} | {'ms':>8} | {'blocks':>8} | {'peak KiB':>8}"
+    print(f"{DOCUMENTS} документов на модель")
+    print(header)
+    print("-" * len(header))
+    for models, documents in make_documents().items():
+        for model in models:
+            elapsed = measure_time(model, documents)
+            blocks, peak = measure_allocations(model, documents)
+            print(f"{model.__name__:>18} | {elapsed:>8.2f} | {blocks:>8} | {peak:>8}")
+
+
+if __name__ == "__main__":
+    main()